@@ -0,0 +1,99 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - database_write_benchmark.py
+# Benchmark: compares the write throughput of the old DataBaseManager updates - a new connection and an f-string UPDATE for every write -
+# against the bound parameter updates on the DataBaseManager's persistent connection, which reuse one cached prepared statement.
+# The database is created in a temporary folder, and the same Steam data is written for every game.
+# Usage (from the main folder): python -m Benchmarks.database_write_benchmark [number of game updates]
+
+import sys, time, sqlite3, tempfile
+
+try:
+    from Managers.database_manager import DataBaseManager
+    from ClassContainers.GameData import Game
+    import ClassContainers.programConsts as PC
+except ImportError as e:
+    print(e)
+    print("Missing Modules in database_write_benchmark.py.")
+
+def create_games(gameCount:int) -> list[Game]:
+    '''Creates Game Objects with Steam data - every fourth title has an apostrophe in it.'''
+    gameList = []
+    for gameNum in range(gameCount):
+        game = Game(f"Assassin's Creed {gameNum}" if gameNum % 4 == 0 else f"Game {gameNum}")
+        game.steam_data.found_data = True
+        game.steam_data.allReviewsText = "Very Positive"
+        game.steam_data.recentReviewsText = "Mostly Positive"
+        game.steam_data.allReviewsData = "12,345 user reviews"
+        game.steam_data.recentReviewsData = "321 user reviews"
+        game.steam_data.allReviewsScore = 91
+        game.steam_data.recentReviewsScore = 78
+        game.steam_data.releaseDate = "Oct 17, 2026"
+        game.steam_data.imageURL = "https://store.steampowered.com/header.jpg"
+        game.steam_data.url = f"https://store.steampowered.com/app/{gameNum}/"
+        game.steam_data.title_on_steam = game.name
+        gameList.append(game)
+    return gameList
+
+def create_database(folder:str, gameList:list[Game]) -> DataBaseManager:
+    database = DataBaseManager(path_to_folder=folder, database_name="benchmark", table_name="games")
+    database.start()
+    database.insert_game_list([game.name for game in gameList])
+    return database
+
+def old_updates(database:DataBaseManager, gameList:list[Game]) -> float:
+    '''Old behaviour - a new connection, an f-string UPDATE with apostrophes replaced by dashes, and a commit for every write.'''
+    # The old connections did not set a journal mode, so the database used SQLite's default rollback journal
+    database.close()
+    conn = sqlite3.connect(database.path_to_database)
+    conn.execute("PRAGMA journal_mode = DELETE")
+    conn.close()
+
+    startTime = time.perf_counter()
+    for game in gameList:
+        data = game.steam_data
+        title = data.title_on_steam.replace('\'', '-')
+        sql_command = f""" UPDATE {database.table_name} SET SteamAllText = '{data.allReviewsText}', SteamRecentText = '{data.recentReviewsText}', SteamAllData = '{data.allReviewsData}', SteamRecentData = '{data.recentReviewsData}', SteamAllScore = {data.allReviewsScore}, SteamRecentScore = {data.recentReviewsScore}, SteamReleaseDate = '{data.releaseDate}', SteamImageURL = '{data.imageURL}', SteamTitle = '{title}', SteamURL = '{data.url}' WHERE ID = {database.database_game_to_id_key[game.name]} """
+        conn = sqlite3.connect(database.path_to_database)
+        conn.execute(sql_command)
+        conn.commit()
+        conn.close()
+    return time.perf_counter() - startTime
+
+def new_updates(database:DataBaseManager, gameList:list[Game]) -> float:
+    '''New behaviour - bound parameters on the persistent connection, one commit for every write.'''
+    startTime = time.perf_counter()
+    for game in gameList:
+        database.update_one_game_data_with_gameobj(game, PC.STEAM_BRAND)
+    return time.perf_counter() - startTime
+
+def new_updates_one_transaction(database:DataBaseManager, gameList:list[Game]) -> float:
+    '''New behaviour - bound parameters on the persistent connection, with every write in one transaction.'''
+    startTime = time.perf_counter()
+    with database.transaction():
+        for game in gameList:
+            database.update_one_game_data_with_gameobj(game, PC.STEAM_BRAND)
+    return time.perf_counter() - startTime
+
+def main():
+    gameCount = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    gameList = create_games(gameCount)
+
+    results = []
+    for name, update_function in [("Old - f-string and new connection per write", old_updates),
+                                  ("New - bound parameters, one commit per write", new_updates),
+                                  ("New - bound parameters, one transaction", new_updates_one_transaction)]:
+        with tempfile.TemporaryDirectory() as folder:
+            database = create_database(folder, gameList)
+            seconds = update_function(database, gameList)
+
+            # Check the titles with apostrophes were stored as they are
+            storedTitle = database.get_connection().execute("SELECT SteamTitle FROM games WHERE ID = 1").fetchone()[0]
+            database.close()
+        results.append((name, seconds, storedTitle))
+
+    print(f"\nGame updates: {gameCount}")
+    for name, seconds, storedTitle in results:
+        print(f"{name}: {seconds:.2f} seconds - {gameCount / seconds:.0f} updates per second - stored title: {storedTitle}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - export_benchmark.py
+# Benchmark: compares the export time and file size of each export format - the streaming XLSX export, CSV, JSON Lines and Parquet -
+# on a database filled with games that have data from every website. Parquet is skipped if pyarrow is not installed.
+# The database and the exported files are created in a temporary folder.
+# Usage (from the main folder): python -m Benchmarks.export_benchmark [number of games]
+
+import sys, os, time, tempfile, types
+
+try:
+    from Managers.database_manager import DataBaseManager
+    from Managers.xlsx_exporter import XlsxExporter
+    from Managers.data_exporters import DATA_EXPORTERS
+    from ClassContainers.GameData import Game
+except ImportError as e:
+    print(e)
+    print("Missing Modules in export_benchmark.py.")
+
+def create_database(folder:str, gameCount:int) -> DataBaseManager:
+    '''Creates a database with every column of every game filled in.'''
+    database = DataBaseManager(path_to_folder=folder, database_name="benchmark", table_name="games")
+    database.start()
+
+    columns = list(database.spreadsheet_to_database_dict.values())
+    integerColumns = ['SteamAllScore', 'SteamRecentScore', 'OpenCriticAverage', 'OpenCriticRecommend']
+
+    def create_row(gameNum:int) -> tuple:
+        row = [gameNum]
+        for column in columns:
+            if column == 'Title':
+                row.append(f"Game {gameNum}")
+            elif column in integerColumns:
+                row.append(gameNum % 101)
+            elif column == 'ExtraWikiInfo':
+                row.append(f"{{'Engine': 'Unreal Engine 4', 'Modes': ['Single-player', 'Multiplayer'], 'Game Number': '{gameNum}'}}")
+            else:
+                row.append(f"{column} value of game {gameNum}")
+        return tuple(row)
+
+    with database.transaction() as conn:
+        conn.executemany(f"INSERT INTO games (ID, {', '.join(columns)}) VALUES ({', '.join('?' * (len(columns) + 1))})",
+                         (create_row(gameNum) for gameNum in range(1, gameCount + 1)))
+    return database
+
+def main():
+    gameCount = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    with tempfile.TemporaryDirectory() as folder:
+        database = create_database(folder, gameCount)
+        gameList = [Game(f"Game {gameNum}") for gameNum in range(1, gameCount + 1)]
+
+        settings = types.SimpleNamespace(xlsx_filename="Benchmark", xlsx_worksheet_title="Info Sheet", export_xlsx_file_path=folder,
+                                         exportFetchSize=1000, xlsxStreamingExport=True)
+
+        exporters = [("xlsx", XlsxExporter())] + [(exportFormat, exporterClass()) for exportFormat, exporterClass in DATA_EXPORTERS.items()]
+
+        results = []
+        for exportFormat, exporter in exporters:
+            if hasattr(exporter, "is_available") and not exporter.is_available():
+                results.append((exportFormat, None, None))
+                continue
+
+            startTime = time.perf_counter()
+            exporter.export_database_games(gameList, settings, database)
+            seconds = time.perf_counter() - startTime
+
+            fileSize = sum(os.path.getsize(os.path.join(folder, fileName)) for fileName in os.listdir(folder) if fileName.endswith(f".{exportFormat}"))
+            results.append((exportFormat, seconds, fileSize))
+
+        database.close()
+
+    print(f"\nGames exported: {gameCount}")
+    for exportFormat, seconds, fileSize in results:
+        if seconds is None:
+            print(f"{exportFormat}: skipped - a required module is not installed")
+        else:
+            print(f"{exportFormat}: {seconds:.2f} seconds - {gameCount / seconds:.0f} games per second - {fileSize / 1048576:.1f} MB")
+
+if __name__ == '__main__':
+    main()
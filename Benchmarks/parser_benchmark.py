@@ -0,0 +1,181 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - parser_benchmark.py
+# Benchmark: compares the time each web hunter takes to read its data out of a saved web page with
+# the old parsing - a whole page tree built by Python's html.parser - against the page parser's lxml trees, whole and limited by each hunter's strainer.
+# Each method must read the same data out of the page, and any difference is printed.
+# Saved pages are read from a folder - Benchmarks/pages by default. The file names must start with 'steam', 'opencritic' or 'wikipedia' and end with '.html',
+# and they should be the HTML returned by the Requests library, not a browser's saved copy of the page - the --save option downloads them.
+# Only if the folder has no saved pages - or the folder is '-' - does the benchmark fall back to sample pages built to the same layout as each website's pages.
+# Usage (from the main folder): python -m Benchmarks.parser_benchmark [folder of saved pages | -] [number of parses per page]
+#                               python -m Benchmarks.parser_benchmark --save [folder to save the pages to]
+
+import sys, os, time, types, requests
+
+try:
+    from web_hunters import page_parser
+    from web_hunters.steam_web_hunter import SteamHunter
+    from web_hunters.opencritic_web_hunter import OpenCriticHunter
+    from web_hunters.wikipedia_web_hunter import WikipediaHunter, GAME_PAGE_STRAINER as WIKIPEDIA_PAGE_STRAINER
+    from ClassContainers.GameData import Game
+except ImportError as e:
+    print(e)
+    print("Missing Modules in parser_benchmark.py.")
+
+# Folder the saved pages are read from and saved to
+DEFAULT_PAGES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages")
+
+# Pages downloaded by the --save option - file name to url
+SAVED_PAGE_URLS = {'steam_hollow_knight.html' : "https://store.steampowered.com/app/367520/Hollow_Knight/",
+                   'steam_elden_ring.html' : "https://store.steampowered.com/app/1245620/ELDEN_RING/",
+                   'opencritic_elden_ring.html' : "https://opencritic.com/game/12090/elden-ring",
+                   'wikipedia_hollow_knight.html' : "https://en.wikipedia.org/wiki/Hollow_Knight",
+                   'wikipedia_elden_ring.html' : "https://en.wikipedia.org/wiki/Elden_Ring"}
+
+# Headers and cookies sent when downloading the pages - the Steam age check cookies let a mature rated game's store page be saved
+SAVE_HEADERS = {'User-Agent' : "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:128.0) Gecko/20100101 Firefox/128.0", 'Accept-Language' : "en-US,en;q=0.5"}
+SAVE_COOKIES = {'birthtime' : '283993201', 'lastagecheckage' : '1-0-1979', 'mature_content' : '1', 'wants_mature_content' : '1'}
+
+# Parsing methods compared - (name, HTML parser, strainers enabled)
+PARSING_METHODS = [("html.parser, whole page", 'html.parser', False),
+                   ("lxml, whole page", 'lxml', False),
+                   ("lxml, strained", 'lxml', True)]
+
+def create_filler(kilobytes:int) -> str:
+    '''Scripts, menus and paragraphs that every page has around the elements the hunters read.'''
+    script = "<script>" + "window.config = {'key': 'value', 'list': [1, 2, 3]};" * 20 + "</script>\n"
+    menu = "<ul class='menu'>" + "".join(f"<li><a href='/link/{num}'>Menu Link {num}</a></li>" for num in range(30)) + "</ul>\n"
+    paragraph = "<div class='block'><p>Some text about the game with a <a href='/wiki/Link'>link</a> and <b>bold</b> words.</p></div>\n"
+    filler = []
+    while sum(len(part) for part in filler) < kilobytes * 1024:
+        filler.extend([script, menu, paragraph * 10])
+    return "".join(filler)
+
+def create_sample_pages() -> dict:
+    '''Returns sample pages with the same layout as the Steam store, OpenCritic game and Wikipedia game pages.'''
+    steam = f"""<html><head>{create_filler(150)}</head><body>{create_filler(100)}
+        <div id="appHubAppName" class="apphub_AppName">Hollow Knight</div>
+        <img class="game_header_image_full" src="https://cdn.steam/header.jpg">
+        <div class="user_reviews">
+        <span class="game_review_summary positive" data-tooltip-html="97% of the 4,123 user reviews in the last 30 days are positive.">Overwhelmingly Positive</span>
+        <span class="responsive_reviewdesc">- 97% of the 4,123 user reviews in the last 30 days are positive.</span>
+        <span class="game_review_summary positive" data-tooltip-html="96% of the 301,234 user reviews for this game are positive.">Overwhelmingly Positive</span>
+        <span class="responsive_reviewdesc">- 96% of the 301,234 user reviews for this game are positive.</span>
+        <div class="outlier_totals">Total reviews in all languages: <span class="game_review_summary positive" data-tooltip-html="97% of the 400,000 user reviews are positive.">Overwhelmingly Positive</span></div>
+        </div>
+        <div class="release_date"><div class="date">24 Feb, 2017</div></div>
+        {create_filler(200)}</body></html>"""
+
+    opencritic = f"""<html><head>{create_filler(100)}</head><body><app-root>{create_filler(50)}
+        <h1 class="my-2">Hollow Knight</h1>
+        <app-tier-display class="mighty-score"><img alt="Mighty" src="/mighty-man.png"></app-tier-display>
+        <app-game-scores-display><div class="row">
+        <div class="col-4"><div class="inner-orb">87</div></div>
+        <div class="col-4"><div class="inner-orb">96%</div></div>
+        <div class="col-4"><div class="inner-orb">92</div></div>
+        </div></app-game-scores-display>
+        {create_filler(150)}</app-root></body></html>"""
+
+    infobox_rows = "".join(f"<tr><th class='infobox-label'>{label}</th><td class='infobox-data'>{value}</td></tr>" for label, value in
+                           [("Developer(s)", "Team Cherry"), ("Publisher(s)", "Team Cherry"), ("Director(s)", "Ari Gibson<br>William Pellen"),
+                            ("Composer(s)", "Christopher Larkin"), ("Engine", "Unity"), ("Platform(s)", "<ul><li>Windows</li><li>macOS</li><li>Linux</li></ul>"),
+                            ("Genre(s)", "Metroidvania"), ("Mode(s)", "Single-player")])
+    review_rows = "".join(f"<tr><td>{publication}</td><td>{score}</td></tr>" for publication, score in
+                          [("Destructoid", "10/10"), ("Game Informer", "9/10"), ("GameSpot", "9/10"), ("IGN", "9.4/10"), ("PC Gamer (US)", "92/100")])
+    wikipedia = f"""<html><head>{create_filler(60)}</head><body>{create_filler(40)}<div id="mw-content-text">
+        <table class="infobox ib-video-game hproduct"><tbody><tr><th colspan="2" class="infobox-above">Hollow Knight</th></tr>
+        <tr><td colspan="2"><img class="mw-file-element" src="//upload.wikimedia.org/cover.png"></td></tr>{infobox_rows}</tbody></table>
+        {create_filler(150)}
+        <div class="video-game-reviews"><table class="vgr-aggregators"><tr><th>Aggregator</th><th>Score</th></tr>
+        <tr><td>Metacritic</td><td>PC: 87/100<br>NS: 90/100</td></tr></table>
+        <table class="vgr-reviews"><tr><th>Publication</th><th>Score</th></tr>{review_rows}</table></div>
+        {create_filler(100)}</div>{create_filler(40)}</body></html>"""
+
+    return {'steam' : [("sample steam page", steam)], 'opencritic' : [("sample opencritic page", opencritic)],
+            'wikipedia' : [("sample wikipedia page", wikipedia)]}
+
+def save_pages(folder:str):
+    '''Downloads each of the saved page urls with the Requests library into the folder.'''
+    os.makedirs(folder, exist_ok=True)
+    for fileName, url in SAVED_PAGE_URLS.items():
+        try:
+            response = requests.get(url, headers=SAVE_HEADERS, cookies=SAVE_COOKIES, timeout=20)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(e)
+            print(f"Unable to save the page: {url}")
+            continue
+
+        with open(os.path.join(folder, fileName), mode='w', encoding='utf-8') as file:
+            file.write(response.text)
+        print(f"Saved {url} to {fileName} - {len(response.text) / 1024:.0f} KB")
+
+def load_saved_pages(folder:str) -> dict:
+    '''Returns the saved pages of each website in the folder - no pages if the folder does not exist.'''
+    pages = {'steam' : [], 'opencritic' : [], 'wikipedia' : []}
+    if not os.path.isdir(folder):
+        return pages
+    for fileName in sorted(os.listdir(folder)):
+        for site in pages:
+            if fileName.lower().startswith(site) and fileName.lower().endswith('.html'):
+                with open(os.path.join(folder, fileName), mode='r', encoding='utf-8') as file:
+                    pages[site].append((fileName, file.read()))
+    return pages
+
+def read_steam_page(hunter:SteamHunter, html:str):
+    game = Game("Benchmark")
+    hunter._SteamHunter__get_game_page_info(types.SimpleNamespace(text=html), game)
+    return vars(game.steam_data)
+
+def read_opencritic_page(hunter:OpenCriticHunter, html:str):
+    game = Game("Benchmark")
+    hunter._OpenCriticHunter__get_game_page_info(types.SimpleNamespace(text=html), game)
+    return vars(game.open_c_data)
+
+def read_wikipedia_page(hunter:WikipediaHunter, html:str):
+    return hunter._WikipediaHunter__get_page_info(hunter._WikipediaHunter__parse_page(html, WIKIPEDIA_PAGE_STRAINER))
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--save':
+        save_pages(sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PAGES_FOLDER)
+        return
+
+    folder = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PAGES_FOLDER
+    parseCount = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    pages = load_saved_pages(folder) if folder != '-' else {}
+
+    if not any(pages.values()):
+        # The sample pages only have the elements the hunters read, so a real page can still read different data between the parsing methods
+        if folder != '-':
+            print(f"WARNING: No saved pages in {folder} - run 'python -m Benchmarks.parser_benchmark --save' to download them.")
+        print("Using the sample pages instead of real web pages.")
+        pages = create_sample_pages()
+
+    readers = {'steam' : (SteamHunter({}), read_steam_page),
+               'opencritic' : (OpenCriticHunter({}), read_opencritic_page),
+               'wikipedia' : (WikipediaHunter({}), read_wikipedia_page)}
+
+    print(f"\nParses per page: {parseCount}")
+    for site, sitePages in pages.items():
+        hunter, read_page = readers[site]
+        for pageName, html in sitePages:
+            print(f"\n{pageName} - {len(html) / 1024:.0f} KB")
+
+            oldData = None
+            oldSeconds = None
+            for methodName, htmlParser, strainersEnabled in PARSING_METHODS:
+                page_parser.HTML_PARSER = htmlParser
+                page_parser.STRAINERS_ENABLED = strainersEnabled
+
+                startTime = time.perf_counter()
+                for _ in range(parseCount):
+                    data = read_page(hunter, html)
+                seconds = (time.perf_counter() - startTime) / parseCount
+
+                if oldData is None:
+                    oldData, oldSeconds = data, seconds
+
+                sameData = "same data" if data == oldData else f"DIFFERENT DATA: {data}"
+                print(f"{methodName}: {seconds * 1000:.1f} ms per page - {oldSeconds / seconds:.1f}x - {sameData}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - worker_pool_benchmark.py
+# Benchmark: compares the old search loop - a new spawn process for every web hunter and every game, with each game waiting on the one before it -
+# against the SearchPipeline, which feeds games through one long-lived worker process per web hunter.
+# No web requests are made - each web hunter is replaced with a stub hunter that sleeps for a fixed time per search,
+# so the benchmark measures the process overhead and the overlap of the searches.
+# Usage (from the main folder): python -m Benchmarks.worker_pool_benchmark [number of games] [seconds per search]
+
+import sys, time, types, contextlib, io
+from multiprocessing import get_context
+
+try:
+    from ClassContainers.GameData import Game
+    from ClassContainers.RunStats import RunStats
+    import ClassContainers.programConsts as PC
+
+    from Managers.search_pipeline import SearchPipeline
+
+    from web_hunters.webHunter import WebHunter
+
+    # Imported so every spawned process pays the same import cost as the real web hunter processes
+    from web_hunters.opencritic_web_hunter import OpenCriticHunter
+    from web_hunters.steam_web_hunter import SteamHunter
+    from web_hunters.wikipedia_web_hunter import WikipediaHunter
+except ImportError as e:
+    print(e)
+    print("Missing Modules in worker_pool_benchmark.py.")
+
+BRANDS = [PC.STEAM_BRAND, PC.OPENCRITIC_BRAND, PC.WIKIPEDIA_BRAND]
+
+
+class StubHunter(WebHunter):
+    '''Stands in for a web hunter - each search sleeps for a fixed time and marks the game's data for its brand as found.'''
+    def __init__(self, brand:str, secondsPerSearch:float):
+        super().__init__({})
+
+        self.brand = brand
+
+        self.secondsPerSearch = secondsPerSearch
+
+    def search(self, game:Game):
+        time.sleep(self.secondsPerSearch)
+        game.get_brand_data(self.brand).found_data = True
+        self.runStats.increment("Stub Searches")
+
+
+def search_in_process(web_hunter:WebHunter, game:Game):
+    '''Process Method: Searches for one game with one web hunter - the old search loop started one of these for every web hunter and every game.'''
+    web_hunter.search(game)
+
+def process_per_game(gameCount:int, secondsPerSearch:float) -> float:
+    '''Old behaviour - a new spawn process is started for every web hunter and every game, and each game waits until all of its processes have finished.'''
+    ctx = get_context("spawn")
+    web_hunters_list = [StubHunter(brand, secondsPerSearch) for brand in BRANDS]
+
+    startTime = time.perf_counter()
+    for gameNum in range(gameCount):
+        game = Game(f"Game {gameNum}")
+
+        processesInUse = []
+        for web_hunter in web_hunters_list:
+            processSub = ctx.Process(target=search_in_process, args=(web_hunter, game))
+            processSub.start()
+            processesInUse.append(processSub)
+
+        for processSub in processesInUse:
+            processSub.join()
+    return time.perf_counter() - startTime
+
+def search_pipeline(gameCount:int, secondsPerSearch:float, maxGamesInFlight:int) -> tuple[float, int]:
+    '''
+    New behaviour - SearchPipeline.run with one long-lived worker process per web hunter.\n
+    Returns the time taken and the number of games whose every search result came back as found.
+    '''
+    web_hunters_list = [StubHunter(brand, secondsPerSearch) for brand in BRANDS]
+    settings = types.SimpleNamespace(maxGamesInFlight=maxGamesInFlight)
+    completedGames = []
+
+    pipeline = SearchPipeline(web_hunters_list, settings, RunStats(), lambda game, brand: None, completedGames.append)
+    gameList = [Game(f"Game {gameNum}") for gameNum in range(gameCount)]
+
+    startTime = time.perf_counter()
+    # The pipeline prints the titles completed per minute after every game
+    with contextlib.redirect_stdout(io.StringIO()):
+        pipeline.run(gameList)
+    searchTime = time.perf_counter() - startTime
+
+    foundCount = sum(1 for game in completedGames if all(game.get_brand_data(brand).found_data for brand in BRANDS))
+    return searchTime, foundCount
+
+def main():
+    gameCount = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    secondsPerSearch = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+
+    print(f"Games: {gameCount} - Web hunters: {len(BRANDS)} - Seconds per search: {secondsPerSearch}")
+    # Every search runs at the same time, so each game takes at least one search's time
+    print(f"Search time alone: {gameCount * secondsPerSearch:.2f} seconds total\n")
+
+    oldTime = process_per_game(gameCount, secondsPerSearch)
+    print(f"Spawn process per game: {oldTime:.2f} seconds total - {oldTime / gameCount * 1000:.1f} ms per game")
+
+    for maxGamesInFlight in [1, 3]:
+        newTime, foundCount = search_pipeline(gameCount, secondsPerSearch, maxGamesInFlight)
+        print(f"SearchPipeline.run, {maxGamesInFlight} games in flight: {newTime:.2f} seconds total - {newTime / gameCount * 1000:.1f} ms per game"
+              f" - {oldTime / newTime:.1f}x - {foundCount} of {gameCount} games found on every site")
+
+if __name__ == '__main__':
+    main()
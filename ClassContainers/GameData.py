@@ -1,5 +1,11 @@
 # Class Container to hold various Game's data for the search program.
 
+try:
+    import ClassContainers.programConsts as PC # type: ignore ##
+except ImportError as e:
+    print(e)
+    print("Missing Modules in GameData.py.")
+
 class Game():
     '''Data Container to hold each game's data.'''
     def __init__(self, name:str = "No Name"):
@@ -7,6 +13,31 @@ class Game():
         self.steam_data = SteamData()
         self.open_c_data = OpenCriticData() 
         self.wiki_data = WikipediaData()
+
+    def get_brand_data(self, brand:str):
+        '''
+        Returns the game's Data Object of one brand/website - such as the SteamData Object for Steam.
+        '''
+        match brand:
+            case PC.STEAM_BRAND:
+                return self.steam_data
+            case PC.OPENCRITIC_BRAND:
+                return self.open_c_data
+            case PC.WIKIPEDIA_BRAND:
+                return self.wiki_data
+        return None
+
+    def set_brand_data(self, brand:str, data):
+        '''
+        Sets the game's Data Object of one brand/website - used to copy a worker process's search results into this Game Object.
+        '''
+        match brand:
+            case PC.STEAM_BRAND:
+                self.steam_data = data
+            case PC.OPENCRITIC_BRAND:
+                self.open_c_data = data
+            case PC.WIKIPEDIA_BRAND:
+                self.wiki_data = data
  
 class Data():
     '''Base Class Container of games data.'''
@@ -23,6 +23,8 @@ class UserSettings():
 
         self.webHeadersTempChange = False
 
+        self.performanceTempChange = False
+
         # Path Variables to the Settings TextFile that stores the UserSettings for the program:
         self.pathToMainFolder = pathToMainFolder
         
@@ -51,6 +53,96 @@ class UserSettings():
  
         self.web_tool_headers = {}
 
+        # Performance Settings - these are not shown in the GUI, but can be changed in the Settings text file.
+        # Maximum number of games that can be searched for at the same time across the web hunters
+        self.maxGamesInFlight = 3
+
+        # Rate Limits for each website domain - 'rate' is the requests per second, 'burst' is the number of requests 
+        # that can be made back to back, and 'jitter' is the maximum random seconds added to each wait.
+        # Any domain that is not listed here is limited by the WaitTime settings.
+        self.rateLimits = {'store.steampowered.com' : {'rate' : 0.2, 'burst' : 2, 'jitter' : 2.0},
+                           'opencritic.com' : {'rate' : 0.2, 'burst' : 2, 'jitter' : 2.0},
+                           'en.wikipedia.org' : {'rate' : 2.0, 'burst' : 5, 'jitter' : 0.0},
+                           'duckduckgo.com' : {'rate' : 0.1, 'burst' : 1, 'jitter' : 3.0}}
+
+        # Number of connections each Web Hunter keeps open to each website, and whether they are kept open between requests
+        self.httpPoolSize = 4
+
+        self.httpKeepAlive = True
+
+        # Response Cache - stores the downloaded web pages in a folder next to the database.
+        # The time-to-live is the number of seconds a cached web page is used before it is checked again with the website.
+        self.responseCacheEnabled = True
+
+        self.responseCacheTTLs = {'store.steampowered.com' : 86400,
+                                  'opencritic.com' : 259200,
+                                  'en.wikipedia.org' : 604800}
+
+        self.responseCacheDefaultTTL = 86400
+
+        # Browser Pool - number of idle Selenium browsers each Web Hunter keeps open between games, 
+        # and the number of pages a browser loads before it is closed and replaced with a new one.
+        self.browserPoolSize = 1
+
+        self.browserMaxPageLoads = 25
+
+        # Determines whether OpenCritic is searched with its JSON search endpoint first, with Selenium only as the fallback
+        self.openCriticHttpSearch = True
+
+        # Determines whether Steam's data is read from its JSON appdetails and appreviews endpoints first, with the store page as the fallback.
+        # The JSON endpoints have no recent reviews, so the Steam recent reviews are left as 'No user review' for the games read from them
+        self.steamJsonApi = True
+
+        # Determines whether the Steam recent reviews - the last 30 days - are read. The store page is then read instead of the JSON endpoints
+        self.steamRecentReviews = False
+
+        # Number of days after a game's last update before its data is searched for again
+        self.updateMaxAgeDays = 30
+
+        # Write-behind database writes - the search results are saved in one transaction once this many games have been completed, 
+        # or once this many seconds have passed since the last write
+        self.databaseWriteBatchGames = 25
+
+        self.databaseWriteBatchSeconds = 5.0
+
+        # Number of titles Wikipedia looks up in each MediaWiki action API request (at most 50) - 1 searches for each title on its own
+        self.wikipediaBatchSize = 50
+
+        # Determines whether the XLSX file is exported with a write-only worksheet - the rows are streamed from the database straight into the file, 
+        # so the memory used stays the same however many games are exported
+        self.xlsxStreamingExport = True
+
+        # Number of game rows read from the database by each query during an export
+        self.exportFetchSize = 1000
+
+        # File formats the search results are exported to, separated by commas - xlsx, csv, jsonl and parquet (parquet needs pyarrow)
+        self.exportFormats = "xlsx"
+
+        # Determines whether the CSV, JSON Lines and Parquet exports only write the games changed since that format's last export
+        self.exportIncremental = False
+
+        # Settings text file key to the member variable name of each performance setting
+        self.__performanceSettingsKeys = {"Max-GamesInFlight" : "maxGamesInFlight", 
+                                          "RateLimits" : "rateLimits",
+                                          "HTTP-PoolSize" : "httpPoolSize",
+                                          "HTTP-KeepAlive" : "httpKeepAlive",
+                                          "ResponseCache-Enabled" : "responseCacheEnabled",
+                                          "ResponseCache-TTLs" : "responseCacheTTLs",
+                                          "ResponseCache-DefaultTTL" : "responseCacheDefaultTTL",
+                                          "BrowserPool-Size" : "browserPoolSize",
+                                          "BrowserPool-MaxPageLoads" : "browserMaxPageLoads",
+                                          "OpenCritic-HttpSearch" : "openCriticHttpSearch",
+                                          "Steam-JsonApi" : "steamJsonApi",
+                                          "Steam-RecentReviews" : "steamRecentReviews",
+                                          "Wikipedia-BatchSize" : "wikipediaBatchSize",
+                                          "Update-MaxAgeDays" : "updateMaxAgeDays",
+                                          "DatabaseWrite-BatchGames" : "databaseWriteBatchGames",
+                                          "DatabaseWrite-BatchSeconds" : "databaseWriteBatchSeconds",
+                                          "XLSX-StreamingExport" : "xlsxStreamingExport",
+                                          "Export-FetchSize" : "exportFetchSize",
+                                          "Export-Formats" : "exportFormats",
+                                          "Export-Incremental" : "exportIncremental"}
+
         if self.__checkForSettingsFile():
             self.getSettingsFromFile()
         else:
@@ -78,7 +170,7 @@ class UserSettings():
                 else:
                     self.__tempChangesDict[rowItem[0]] = str(rowItem[1])
                 
-                if rowItem[0] == "WebHeaders":
+                if rowItem[0] == "WebHeaders" or rowItem[0] == "RateLimits" or rowItem[0] == "ResponseCache-TTLs":
                     convertedDict = ast.literal_eval(rowItem[1])
                     self.__tempChangesDict[rowItem[0]] = convertedDict
 
@@ -112,6 +204,8 @@ class UserSettings():
             file.write(f"XLSX_Worksheet_Name: {self.xlsx_worksheet_title}\n")
             file.write(f"Export_XLSX_File_Path: {self.export_xlsx_file_path}\n")
             file.write(f"WebHeaders: {str(self.web_tool_headers)}")
+            for key, attributeName in self.__performanceSettingsKeys.items():
+                file.write(f"\n{key}: {str(getattr(self, attributeName))}")
             file.close()
      
     ### Print Methods ###
@@ -140,6 +234,9 @@ class UserSettings():
 
         print(self.web_tool_headers) 
 
+        for attributeName in self.__performanceSettingsKeys.values():
+            print(getattr(self, attributeName))
+
 
     def printTempDict(self):
         for key, value in self.__tempChangesDict.items():
@@ -193,6 +290,12 @@ class UserSettings():
     def getWebHeadersTempDict(self):
         return str(self.__tempChangesDict["WebHeaders"])
     ###
+    def getDefaultRateLimit(self) -> dict:
+        '''
+        Returns the rate limit used for any website domain that is not listed in the rateLimits setting, based on the WaitTime settings.
+        '''
+        return {'rate' : 1 / max(self.minTimeSeconds, 1), 'burst' : 1, 'jitter' : max(self.maxTimeSeconds - self.minTimeSeconds, 0)}
+    ###
 
     ############################################## 
     ######## Temporary Dictionary Methods ########
@@ -206,6 +309,8 @@ class UserSettings():
         self.xlsxTempChange = False 
 
         self.webHeadersTempChange = False
+
+        self.performanceTempChange = False
         
         self.__tempChangesDict.clear()       
 
@@ -245,6 +350,12 @@ class UserSettings():
             if self.webHeadersTempChange:
                 self.web_tool_headers = self.__tempChangesDict["WebHeaders"]
 
+            if self.performanceTempChange:
+                for key, attributeName in self.__performanceSettingsKeys.items():
+                    # Settings files made by older versions of the program will not have every performance setting in them 
+                    if key in self.__tempChangesDict:
+                        setattr(self, attributeName, self.__convertSettingValue(self.__tempChangesDict[key], getattr(self, attributeName)))
+
             self.clearTempChangesMade()
 
             self.__setSettingsToFile()
@@ -267,6 +378,8 @@ class UserSettings():
                 self.xlsxTempChange = True
 
                 self.webHeadersTempChange = True
+
+                self.performanceTempChange = True
             case "WaitTime":
                 self.waitTimeTempChange = True
             
@@ -277,4 +390,22 @@ class UserSettings():
                 self.xlsxTempChange = True
 
             case "WebHunters":
-                self.webHeadersTempChange = True
\ No newline at end of file
+                self.webHeadersTempChange = True
+
+    def __convertSettingValue(self, value, currentValue):
+        '''
+        Converts a value read from the Settings text file into the same type as the setting's current value.\n
+        If the value can't be converted, the current value is kept.
+
+        :param value: Value read from the Settings text file.
+        :param currentValue: Current value of the setting.
+        '''
+        try:
+            if type(currentValue).__name__ == 'bool':
+                return str(value).strip().lower() == 'true'
+            if type(currentValue).__name__ == 'dict':
+                return value if type(value).__name__ == 'dict' else ast.literal_eval(str(value))
+            return type(currentValue)(value)
+        except (ValueError, SyntaxError):
+            print(f"Unable to read the setting value: {value}. Keeping the value: {currentValue}")
+            return currentValue
\ No newline at end of file
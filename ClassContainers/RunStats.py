@@ -0,0 +1,82 @@
+# Class Container to hold the statistics of a search run.
+
+import time
+
+class RunStats():
+    '''
+    Stores the counters and timings gathered while the search program is running, and prints them once the run is over.
+    '''
+    def __init__(self):
+        self.startTime = time.time()
+
+        self.titlesCompleted = 0
+
+        # Named counters - such as the number of web requests made - 'HTTP Requests' : 12
+        self.counters: dict[str, float] = {}
+
+        # Ratios of two counters printed with the stats - 'HTML Parses per Title' : ('HTML Pages Parsed', 'Titles Searched')
+        self.ratios: dict[str, tuple[str, str]] = {}
+
+    def increment(self, name:str, amount:float = 1):
+        '''
+        Adds an amount to a named counter, creating the counter if needed.
+
+        :param name: Name of the counter.
+        :type name: str
+        :param amount: Amount to add to the counter.
+        :type amount: float
+        '''
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def add_ratio(self, name:str, counterName:str, perCounterName:str):
+        '''
+        Adds a ratio of two counters that is printed with the stats - such as the number of pages parsed per title searched.
+
+        :param name: Name of the ratio.
+        :type name: str
+        :param counterName: Name of the counter divided.
+        :type counterName: str
+        :param perCounterName: Name of the counter it is divided by.
+        :type perCounterName: str
+        '''
+        self.ratios[name] = (counterName, perCounterName)
+
+    def merge(self, counters:dict):
+        '''Adds every counter from another dictionary of counters to this one.'''
+        for name, amount in counters.items():
+            self.increment(name, amount)
+
+    def pop_counters(self) -> dict:
+        '''Returns the counters and clears them - used to send a process's counters back to the main process.'''
+        counters = self.counters
+        self.counters = {}
+        return counters
+
+    def title_completed(self):
+        self.titlesCompleted += 1
+
+    def get_minutes_elapsed(self) -> float:
+        return (time.time() - self.startTime) / 60
+
+    def get_titles_per_minute(self) -> float:
+        minutesElapsed = self.get_minutes_elapsed()
+        if minutesElapsed <= 0:
+            return 0.0
+        return self.titlesCompleted / minutesElapsed
+
+    def printStats(self):
+        border_sep_symbol = "#" * 60
+        print(f"\n{border_sep_symbol}\n")
+        print("Search Run Stats:")
+        print(f"Titles completed: {self.titlesCompleted}")
+        print(f"Minutes elapsed: {self.get_minutes_elapsed():.2f}")
+        print(f"Titles completed per minute: {self.get_titles_per_minute():.2f}")
+        for name, amount in sorted(self.counters.items()):
+            if type(amount).__name__ == 'float':
+                print(f"{name}: {amount:.2f}")
+            else:
+                print(f"{name}: {amount}")
+        for name, (counterName, perCounterName) in sorted(self.ratios.items()):
+            if self.counters.get(perCounterName):
+                print(f"{name}: {self.counters.get(counterName, 0) / self.counters[perCounterName]:.2f}")
+        print(f"\n{border_sep_symbol}\n")
@@ -295,7 +295,7 @@ class WaitTimeBlock(QWidget):
         self.mainWidgetLayout.setSpacing(10)
         self.mainWidgetLayout.setContentsMargins(0, 0, 0, 0)
  
-        self.waitTimeTitle = CustomLabel("Wait Time\nUsed to set how long the program\npauses between web searches.", fontsize, "white", False, True, Qt.AlignmentFlag.AlignLeft) 
+        self.waitTimeTitle = CustomLabel("Wait Time\nUsed to set how long the program\npauses between web searches\non websites without a rate limit.", fontsize, "white", False, True, Qt.AlignmentFlag.AlignLeft) 
         #  - Used to set how long the Game Searcher\npauses between web searches
  
         self.minLabel = CustomLabel("Minimum Seconds:", fontsize, "white", False, True, Qt.AlignmentFlag.AlignLeft) 
@@ -2,8 +2,7 @@
 # This class is the critical part of the program that starts and manages the search for each game's information. 
 # It utilizes the Database Class and the Web Hunter Classes to get and store the data found on the internet for each game.
 
-import time, random, multiprocessing, platform, sys
-from multiprocessing import Process, get_context 
+import os, multiprocessing, sys
 
 try:      
     from ClassContainers.GameData import Game # type: ignore ##
@@ -12,9 +11,13 @@ try:
 
     from ClassContainers.Options import UserSettings
 
+    from ClassContainers.RunStats import RunStats
+
+    from Managers.search_pipeline import SearchPipeline
+
     from Managers.database_manager import DataBaseManager # type: ignore ##
 
-    import ClassContainers.programConsts as PC # type: ignore ##  
+    from Managers.database_writer import DatabaseWriter
 
 except ImportError as e:
     print(e) 
@@ -22,6 +25,10 @@ except ImportError as e:
 
 try: 
     from web_hunters.webHunter import WebHunter 
+
+    from web_hunters.rate_limiter import DomainRateLimiter
+
+    from web_hunters.response_cache import ResponseCache
 except ImportError as e:
     print(e)
     print("Unable to import the WebHunter Parent Class")
@@ -58,6 +65,9 @@ class GameSearchManager():
         ## Database Manager
         self.database = DataBaseManager(path_to_folder=self.settings.path_to_database, database_name=self.settings.gameDataBaseName, table_name=self.settings.database_table_name) 
 
+        # Counters and timings of the search run 
+        self.runStats = RunStats()
+
         # Type Hint to establish a List that will only contain Game Objects
         self.gameObjectList: list[Game] = []
 
@@ -68,20 +78,35 @@ class GameSearchManager():
         # Section to Create the Game Hunter Objects for each major site
         if self.instructs.get_wiki_bValue(): 
             self.hunter_Wikipedia = WikipediaHunter(self.settings.web_tool_headers)
+            self.hunter_Wikipedia.batch_size = self.settings.wikipediaBatchSize
+            self.runStats.add_ratio("Wikipedia Search - HTML Parses per Title", "Wikipedia Search - HTML Pages Parsed", "Wikipedia Search - HTML Titles Searched")
             self.web_hunters_list.append(self.hunter_Wikipedia)
             
         if self.instructs.get_opencritic_bValue(): 
             self.hunter_OpenCritic = OpenCriticHunter(self.settings.web_tool_headers)
+            self.hunter_OpenCritic.use_http_search = self.settings.openCriticHttpSearch
             self.web_hunters_list.append(self.hunter_OpenCritic)
 
         if self.instructs.get_steam_bValue(): 
             self.hunter_Steam = SteamHunter(self.settings.web_tool_headers)
+            self.hunter_Steam.use_json_api = self.settings.steamJsonApi
+            self.hunter_Steam.read_recent_reviews = self.settings.steamRecentReviews
             self.web_hunters_list.append(self.hunter_Steam) 
 
-    ### General Methods for the Class ###
-    def __pause_search(self):
-        print(f"Pausing Searcher from {self.settings.minTimeSeconds} to {self.settings.maxTimeSeconds} seconds to prevent bot stops...")
-        time.sleep(random.randint(self.settings.minTimeSeconds,self.settings.maxTimeSeconds)) 
+        # Rate Limiter shared by every Web Hunter - paces the web requests made to each website domain separately 
+        self.rateLimiter = DomainRateLimiter(self.settings.rateLimits, self.settings.getDefaultRateLimit())
+
+        # Response Cache shared by every Web Hunter - stored in a folder next to the database 
+        self.responseCache = None
+        if self.settings.responseCacheEnabled:
+            self.responseCache = ResponseCache(os.path.join(self.settings.path_to_database, "ResponseCache"), 
+                                               self.settings.responseCacheTTLs, self.settings.responseCacheDefaultTTL)
+
+        for web_hunter in self.web_hunters_list:
+            web_hunter.set_rate_limiter(self.rateLimiter)
+            web_hunter.set_session_options(self.settings.httpPoolSize, self.settings.httpKeepAlive)
+            web_hunter.set_response_cache(self.responseCache)
+            web_hunter.set_browser_pool_options(self.settings.browserPoolSize, self.settings.browserMaxPageLoads)
 
     def start_search(self):
         '''
@@ -101,32 +126,16 @@ class GameSearchManager():
         self.gamesToGetInfoList: list[Game] = []
         gamesToIgnoreList: list[Game] = []
 
-        databaseCount = 0
-        
-        # After getting the games dates,
-        # divide the games based on whether they are new (ones without update dates) or old (ones that have a last update date).
-        # If they are old, the program will check if thirty dates have past since their last update and if so, go ahead and update the game's data.
-        for game in self.gameObjectList:
-            databaseCount += 1
-            date = self.database.get_game_data_last_update(game.name)
-            print("\n")
-            print(f"Game: {databaseCount}")
-            print(game.name)
-            print(f"Last update: {date}")
+        # Get the IDs of every game that is new (one without an update date) or old (one updated at least the set number of days ago)
+        # with one query for the whole game list, and only search for those games.
+        staleGameIDs = self.database.get_stale_game_ids([game.name for game in self.gameObjectList], self.settings.updateMaxAgeDays)
 
-            if type(date).__name__ == 'NoneType':  
-                self.gamesToGetInfoList.append(game)
-            elif date == 'None': 
+        for game in self.gameObjectList:
+            if self.database.database_game_to_id_key[game.name] in staleGameIDs:
                 self.gamesToGetInfoList.append(game)
             else:
-                if self.database.compareDates(date, 30): 
-                    self.gamesToGetInfoList.append(game)
-                else:
-                    gamesToIgnoreList.append(game)
-
+                gamesToIgnoreList.append(game)
 
-            if databaseCount % 50 == 0:
-                time.sleep(1) 
         print("\n")
         print(f"Getting data for {len(self.gamesToGetInfoList)} games!")
         print(f"Ignoring the remaining {len(gamesToIgnoreList)} games.")
@@ -146,89 +155,53 @@ class GameSearchManager():
             return None, None 
     
     
-    def create_and_start_process(self, game:Game, brand:str, function_to_call, processesList:list[Process]):
-        '''
-        Creates and starts a new process for each web hunter search method.
-
-        Returns the processes list to ensure no processes are lost.
-        
-        :param game: Game Object containing game data.
-        :type game: Game
-        :param brand: Platform - that is being searched on.
-        :type brand: str
-        :param function_to_call: Method to call upon.
-        :param processesList: List of Process Objects
-        :type processesList: list[Process]
-        '''
-
-        processSub = Process(target=self.search_one_game_info_and_update_database, args=(game, brand, function_to_call))
-
-        processesList.append(processSub) 
-
-        processSub.start()
-
-        return processesList
-
-    def create_starmap_list(self, game:Game):
-        '''
-        Creates a list to be used with the Pool Method's 'starmap' method. 
-        '''
-        starmap = []
-
-        for web_hunter in self.web_hunters_list:
-            starmap.append((game, web_hunter.brand, web_hunter.search))
-
-        return starmap
-
     def get_games_data_multiprocessing(self):
         '''
-        This method searches for each game's data on all platforms at the same time utilizing multiprocessing. 
+        This method searches for each game's data on all platforms utilizing multiprocessing. 
         
-        Any data found on the game will then be saved to the database before continuing onto the next game. 
+        Several games are kept in flight at once and each platform is searched on by one process at a time.
+        Instead of pausing the whole search after every game, each web request waits on the rate limit of its own website.
         ''' 
         # Used to prevent freezing on Windows Platforms.
         if sys.platform.startswith('win'):
             multiprocessing.freeze_support()                      
 
-        gameCount = 1  
+        self.gameCount = 0
 
-        for game in self.gamesToGetInfoList:               
+        # The search results are written to the database in batches by the main process only
+        self.databaseWriter = DatabaseWriter(self.database, self.settings.databaseWriteBatchGames, self.settings.databaseWriteBatchSeconds)
 
-            self.__print_current_place_in_game_count(gameCount, game)
+        pipeline = SearchPipeline(self.web_hunters_list, self.settings, self.runStats, 
+                                  self.databaseWriter.add_search_result, self.__complete_game_search, self.databaseWriter.write_if_due)
 
-            if platform.system() == 'Linux': 
-                # Due to the nature of multiprocessing differing on each platform, the below code has been designed to work on most Linux Platforms.
-                with get_context("spawn").Pool() as p:
+        try:
+            pipeline.run(self.gamesToGetInfoList)
+        finally:
+            # Save the completed games still waiting to be written - the results of games that were not completed are not saved
+            self.databaseWriter.write()
 
-                    starmap_list = self.create_starmap_list(game) 
+        self.runStats.increment("Database Batch Writes", self.databaseWriter.writeCount)
+        self.runStats.increment("Database Batch Writes Failed", self.databaseWriter.failedWriteCount)
 
-                    results = p.starmap(self.search_one_game_info_and_update_database, starmap_list)
+        self.runStats.printStats()
 
-            else:
-                # This multiprocessing section will usually occur for 'non-Linux' platforms such as Windows, 
-                # where the Process class is the more friendly option to pick. 
-                processesInUse: list[Process] = []    
-
-                # For each WebHunter set up and start the search process for the game's data.
-                for web_hunter in self.web_hunters_list:
-                    processesInUse = self.create_and_start_process(game, web_hunter.brand, web_hunter.search, processesInUse)
+    def __complete_game_search(self, game:Game):
+        '''
+        Called once every web hunter has finished searching for a game.
+        
+        :param game: Game Object that has been searched for.
+        :type game: Game
+        '''
+        self.gameCount += 1
 
-                # Wait to complete all processes before proceeding onto the next step
-                for proc in processesInUse: 
-                    proc.join()  
- 
-            # Finally, now that we got all four platform's data added to the database, 
-            # We'll update the the game's last update date to the current date to signify we're up to date with the latest data for this game.
-            self.database.update_game_new_update_date(game.name)
+        self.__print_current_place_in_game_count(self.gameCount, game)
 
-            print(f"\n{gameCount} of {len(self.gamesToGetInfoList)}:\nSuccessfully updated the database with the data found for {game.name}.") 
-            
-            # Pauses the searcher for a random set of time if the gameCount is not equal to the total of the game list
-            # otherwise if they are equal, then that means we are on the last game in the list, so we can skip this pause and go ahead the exit the method
-            if gameCount != len(self.gamesToGetInfoList):
-                self.__pause_search()
+        # Finally, now that we got all platform's data, 
+        # We'll update the the game's last update date to the current date to signify we're up to date with the latest data for this game.
+        # The date is written in the same transaction as the game's data.
+        self.databaseWriter.add_completed_game(game)
 
-            gameCount += 1  
+        print(f"\n{self.gameCount} of {len(self.gamesToGetInfoList)}:\nFinished searching for {game.name} - its data will be saved with the next database write.") 
  
     def __print_current_place_in_game_count(self, gameCount:int, game:Game):
         '''
@@ -242,18 +215,3 @@ class GameSearchManager():
         border_sep_symbol = "#" * 60
         print(f"\n{border_sep_symbol}\n")
         print(f"Game - {gameCount} - {game.name} - \n")
- 
-    def search_one_game_info_and_update_database(self, game:Game, brand:str, function_to_call):
-        ''' 
-        Process Method: Starts, gets, and updates information gathered from the web hunter into the database.
-         
-        :param game: Game Object to hold the game's data.
-        :type game: Game
-        :param brand: Web platform - such as Wikipedia being searched for.
-        :type brand: str
-        :param function_to_call: Function Object that will be called in this method. 
-        '''        
-
-        function_to_call(game) 
-
-        self.database.update_one_game_data_with_gameobj(game, brand)     
\ No newline at end of file
@@ -0,0 +1,270 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - data_exporters.py
+# Exporters that write the games' data to files for other programs to read - CSV, JSON Lines and Parquet.
+# Each exporter streams the rows straight from the database in batches, so the whole export is never held in memory.
+
+import csv, json, os, datetime
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+try:
+    from ClassContainers.GameData import Game # type: ignore ##
+
+    from ClassContainers.Options import UserSettings
+
+    from Managers.database_manager import DataBaseManager # type: ignore ##
+
+except ImportError as e:
+    print(e)
+    print("Missing Modules in data_exporters.py.")
+
+# Parquet support is optional - the Parquet exporter is only available if pyarrow is installed
+try:
+    import pyarrow
+    import pyarrow.parquet
+
+    pyarrow_available = True
+except ImportError:
+    pyarrow_available = False
+
+
+class DataExporter(ABC):
+    '''
+    Parent class of the data exporters. Writes the games' rows from the database to a file,\n
+    using the database column names in the order of the DataBaseManager's spreadsheet to database column key.\n
+    Each child class sets its file extension and writes the rows in its own format.
+    '''
+    def __init__(self):
+        # Name of the export format - used in the export messages and the Export-Formats setting
+        self.format_name = ""
+
+        self.file_extension = ""
+
+    def is_available(self) -> bool:
+        '''Returns True if every module the exporter needs is installed.'''
+        return True
+
+    def export_database_games(self, gameList: list[Game], settings: UserSettings, database: DataBaseManager) -> bool:
+        '''
+        Export a list of game's data to a file in the settings' export folder.
+
+        :param gameList: List of Game Objects.
+        :type gameList: list[Game]
+        :param settings: To get the export file path and fetch size.
+        :type settings: UserSettings
+        :param database: To access database.
+        :type database: DataBaseManager
+        '''
+        fileName = f"{settings.xlsx_filename} - {datetime.datetime.today().strftime('%m-%d-%Y')}.{self.file_extension}"
+        pathToFile = Path(settings.export_xlsx_file_path, fileName)
+
+        print(f"Creating the {self.format_name} File Now with all of the Game Information.")
+        try:
+            rowCount = self.export_rows(pathToFile, database, [game.name for game in gameList], settings.exportFetchSize)
+            print(f"{rowCount} games exported to the {self.format_name} file:")
+            print(pathToFile)
+            return True
+
+        except Exception as e:
+            print(e)
+            print(f"Program failed to generate a {self.format_name} File to path:")
+            print(pathToFile)
+            return False
+
+    def export_rows(self, pathToFile, database: DataBaseManager, gameKeys: list|None = None, fetchSize: int = 1000) -> int:
+        '''
+        Writes the rows of a list of games - or of every game in the database - to a file, and returns the number of rows written.
+
+        :param pathToFile: Path of the file to write.
+        :param database: To access database.
+        :type database: DataBaseManager
+        :param gameKeys: Game titles or game IDs - None exports every game in the database.
+        :type gameKeys: list | None
+        :param fetchSize: Number of rows read from the database by each query.
+        :type fetchSize: int
+        '''
+        columns = list(database.spreadsheet_to_database_dict.values())
+
+        return self.__write_file(pathToFile, columns, database.iter_game_rows(gameKeys, columns, fetchSize=fetchSize), fetchSize)
+
+    def export_changed_games(self, settings: UserSettings, database: DataBaseManager, exportName: str|None = None) -> bool:
+        '''
+        Incremental export - writes only the games inserted or updated since this export's watermark to a file in the settings' export folder,\n
+        with each game's ChangeSeq as the first column. The file is only renamed into place in the same transaction that moves the watermark forward,\n
+        so a failed export leaves neither a file nor a moved watermark behind. No file is written if nothing has changed.
+
+        :param settings: To get the export file path and fetch size.
+        :type settings: UserSettings
+        :param database: To access database.
+        :type database: DataBaseManager
+        :param exportName: Name the export's watermark is stored under - defaults to the file extension.
+        :type exportName: str | None
+        '''
+        exportName = exportName or self.file_extension
+
+        sinceChangeSeq = database.get_export_watermark(exportName)
+        # Changes made while the file is written are left for the next export
+        untilChangeSeq = database.get_last_change_seq()
+
+        if untilChangeSeq <= sinceChangeSeq:
+            print(f"No games have changed since the last {self.format_name} export.")
+            return True
+
+        fileName = f"{settings.xlsx_filename} - Changes {sinceChangeSeq + 1}-{untilChangeSeq}.{self.file_extension}"
+        pathToFile = Path(settings.export_xlsx_file_path, fileName)
+
+        print(f"Creating the {self.format_name} File Now with the games changed since the last export.")
+        try:
+            columns = ['ChangeSeq'] + list(database.spreadsheet_to_database_dict.values())
+            gameRows = database.iter_changed_game_rows(sinceChangeSeq, untilChangeSeq, columns, fetchSize=settings.exportFetchSize)
+
+            pathToTempFile, rowCount = self.__write_temp_file(pathToFile, columns, gameRows, settings.exportFetchSize)
+            try:
+                # A failed rename rolls back the watermark, and a failed watermark leaves the file unrenamed
+                with database.transaction():
+                    database.set_export_watermark(exportName, untilChangeSeq)
+                    os.replace(pathToTempFile, pathToFile)
+            finally:
+                self.__remove_file(pathToTempFile)
+
+            print(f"{rowCount} changed games exported to the {self.format_name} file:")
+            print(pathToFile)
+            return True
+
+        except Exception as e:
+            print(e)
+            print(f"Program failed to generate a {self.format_name} File to path:")
+            print(pathToFile)
+            return False
+
+    def __write_file(self, pathToFile, columns: list[str], gameRows, chunkSize: int) -> int:
+        '''Writes the game rows to a temporary file and renames it to the file once every row is written.'''
+        pathToTempFile, rowCount = self.__write_temp_file(pathToFile, columns, gameRows, chunkSize)
+        try:
+            os.replace(pathToTempFile, pathToFile)
+        finally:
+            self.__remove_file(pathToTempFile)
+        return rowCount
+
+    def __write_temp_file(self, pathToFile, columns: list[str], gameRows, chunkSize: int) -> tuple[Path, int]:
+        '''
+        Writes the game rows to a temporary file next to the file if every module the exporter needs is installed,\n
+        and returns the temporary file's path and the number of rows written. The temporary file is deleted if writing fails.
+        '''
+        if not self.is_available():
+            raise RuntimeError(f"The {self.format_name} export is not available - a required module is not installed.")
+
+        pathToTempFile = Path(f"{pathToFile}.tmp")
+        try:
+            return pathToTempFile, self._write_rows(pathToTempFile, columns, gameRows, chunkSize)
+        except:
+            self.__remove_file(pathToTempFile)
+            raise
+
+    def __remove_file(self, pathToFile: Path):
+        '''Deletes the file if it exists.'''
+        try:
+            pathToFile.unlink()
+        except FileNotFoundError:
+            pass
+
+    @abstractmethod
+    def _write_rows(self, pathToFile, columns: list[str], gameRows, chunkSize: int) -> int:
+        '''Writes the game rows to the file and returns the number of rows written - set by each child class.'''
+
+
+class CsvExporter(DataExporter):
+    '''Writes the games' rows to a UTF-8 CSV file with a header row of the database column names.'''
+    def __init__(self):
+        super().__init__()
+
+        self.format_name = "CSV"
+
+        self.file_extension = "csv"
+
+    def _write_rows(self, pathToFile, columns: list[str], gameRows, chunkSize: int) -> int:
+        rowCount = 0
+        with open(pathToFile, mode='w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            for gameRow in gameRows:
+                writer.writerow(gameRow)
+                rowCount += 1
+        return rowCount
+
+
+class JsonLinesExporter(DataExporter):
+    '''Writes each game's row to a JSON Lines file as one JSON object of database column name to value per line.'''
+    def __init__(self):
+        super().__init__()
+
+        self.format_name = "JSON Lines"
+
+        self.file_extension = "jsonl"
+
+    def _write_rows(self, pathToFile, columns: list[str], gameRows, chunkSize: int) -> int:
+        rowCount = 0
+        with open(pathToFile, mode='w', encoding='utf-8', newline='\n') as file:
+            for gameRow in gameRows:
+                file.write(json.dumps(dict(zip(columns, gameRow)), ensure_ascii=False))
+                file.write("\n")
+                rowCount += 1
+        return rowCount
+
+
+class ParquetExporter(DataExporter):
+    '''
+    Writes the games' rows to a Parquet file with pyarrow, one row group per chunk of rows.\n
+    The score columns are stored as integers and every other column as text - a score that is not a number is stored as null.
+    '''
+    def __init__(self):
+        super().__init__()
+
+        self.format_name = "Parquet"
+
+        self.file_extension = "parquet"
+
+        # Columns stored as integers - every other column is stored as text
+        self.integer_columns = ['ChangeSeq', 'SteamAllScore', 'SteamRecentScore', 'OpenCriticAverage', 'OpenCriticRecommend']
+
+        self.compression = "zstd"
+
+    def is_available(self) -> bool:
+        return pyarrow_available
+
+    def _write_rows(self, pathToFile, columns: list[str], gameRows, chunkSize: int) -> int:
+        schema = pyarrow.schema([(column, pyarrow.int64() if column in self.integer_columns else pyarrow.string()) for column in columns])
+        converters = [self.__to_integer if column in self.integer_columns else self.__to_text for column in columns]
+
+        rowCount = 0
+        with pyarrow.parquet.ParquetWriter(str(pathToFile), schema, compression=self.compression) as writer:
+            chunk = []
+            for gameRow in gameRows:
+                chunk.append(gameRow)
+                if len(chunk) >= chunkSize:
+                    writer.write_table(self.__create_table(schema, converters, chunk))
+                    rowCount += len(chunk)
+                    chunk = []
+            if chunk:
+                writer.write_table(self.__create_table(schema, converters, chunk))
+                rowCount += len(chunk)
+        return rowCount
+
+    def __create_table(self, schema, converters: list, chunk: list[tuple]):
+        '''Converts a chunk of rows into a pyarrow table, one column at a time.'''
+        arrays = [[convert(value) for value in columnValues] for convert, columnValues in zip(converters, zip(*chunk))]
+        return pyarrow.Table.from_arrays([pyarrow.array(values, type=field.type) for values, field in zip(arrays, schema)], schema=schema)
+
+    def __to_integer(self, value):
+        if type(value).__name__ == 'int':
+            return value
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    def __to_text(self, value):
+        return None if value is None else str(value)
+
+
+# Export format name used in the Export-Formats setting to its exporter class
+DATA_EXPORTERS = {'csv' : CsvExporter, 'jsonl' : JsonLinesExporter, 'parquet' : ParquetExporter}
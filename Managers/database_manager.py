@@ -1,4 +1,5 @@
-import sqlite3, os, datetime  
+import sqlite3, os, datetime, re  
+from contextlib import contextmanager
 
 try:  
     import ClassContainers.programConsts as PC # type: ignore ##
@@ -24,6 +25,57 @@ class DataBaseManager():
         self.primary_key = "ID"
 
         self.database_game_to_id_key = {}
+
+        # Full-text search index over the game titles and Wikipedia metadata - kept in sync with the games table by triggers
+        self.search_table_name = f"{table_name}_search"
+        self.search_columns = ['Title', 'WikiTitle', 'SteamTitle', 'OpenCriticTitle', 'Series', 'ExtraWikiInfo']
+        # bm25 weight of each search column - a match in a title ranks higher than one in the extra info
+        self.search_column_weights = [10.0, 5.0, 5.0, 5.0, 2.0, 1.0]
+
+        # Number of rows each migration step changes in one transaction - the database stays usable between batches
+        self.migration_batch_size = 10000
+
+        # Every insert or update of a game sets its ChangeSeq column to the next number of this table's change counter,
+        # and each incremental export records the last ChangeSeq it wrote as its watermark
+        self.change_counter_table_name = f"{table_name}_ChangeCounter"
+        self.export_watermarks_table_name = "ExportWatermarks"
+
+        # Normalized credits, platforms and genres - each table of names and the table linking it to the games, with the name's role in the game
+        self.credit_tables = {'People' : ('GamePeople', 'PersonID'),
+                              'Companies' : ('GameCompanies', 'CompanyID'),
+                              'Platforms' : ('GamePlatforms', 'PlatformID'),
+                              'Genres' : ('GameGenres', 'GenreID')}
+
+        # Games table column to the name table and role its names are stored with
+        self.credit_columns = {'Developers' : ('Companies', 'Developer'), 
+                               'Publishers' : ('Companies', 'Publisher'),
+                               'Directors' : ('People', 'Director'),
+                               'Producers' : ('People', 'Producer'),
+                               'Designers' : ('People', 'Designer'),
+                               'Programmers' : ('People', 'Programmer'),
+                               'Artists' : ('People', 'Artist'),
+                               'Writers' : ('People', 'Writer'),
+                               'Composers' : ('People', 'Composer'),
+                               'Platforms' : ('Platforms', 'Platform'),
+                               'Genres' : ('Genres', 'Genre')}
+
+        # Each process keeps one open connection to the database - created the first time it is needed in that process
+        self.__connection = None
+        self.__connection_pid = None
+
+        # Number of transaction blocks currently open - only the outermost one commits
+        self.__transaction_depth = 0
+
+        # Connection pragmas - WAL lets the worker processes write while others read,
+        # and the busy timeout makes a process wait for the write lock instead of failing with 'database is locked'
+        self.busy_timeout_ms = 30000
+        self.synchronous = "NORMAL"
+        self.cache_size_kib = 20000
+
+        # Number of prepared statements each connection keeps - every write uses the same SQL text with bound parameters,
+        # so each statement is only parsed once per connection
+        self.cached_statements = 256
+
         # Spreadsheet To Database Column Name Key Guide
         self.spreadsheet_to_database_dict = {
             'Game Title' : 'Title',
@@ -74,7 +126,69 @@ class DataBaseManager():
         else: 
             self.__create_sqlite_database()
             print("Database created.")
+
+        self.upgrade_database()
     
+    #############################################################################################################
+    ######### CONNECTION SECTION ######################
+    def get_connection(self) -> sqlite3.Connection:
+        '''
+        Returns this process's connection to the database, opening it and setting its pragmas if needed.\n
+        A connection is never shared between processes - a worker process opens its own the first time it uses the database.
+        '''
+        if self.__connection is None or self.__connection_pid != os.getpid():
+            self.__connection = sqlite3.connect(self.path_to_database, timeout=self.busy_timeout_ms / 1000, cached_statements=self.cached_statements)
+            self.__connection_pid = os.getpid()
+            self.__transaction_depth = 0
+
+            self.__connection.execute("PRAGMA journal_mode = WAL")
+            self.__connection.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+            self.__connection.execute(f"PRAGMA synchronous = {self.synchronous}")
+            self.__connection.execute(f"PRAGMA cache_size = -{int(self.cache_size_kib)}")
+            self.__connection.execute("PRAGMA temp_store = MEMORY")
+
+        return self.__connection
+
+    @contextmanager
+    def transaction(self):
+        '''
+        Context manager that runs the SQL commands inside it as one transaction, and yields the connection.\n
+        The transaction is committed when the block ends, or rolled back if an error is raised inside it.\n
+        Transaction blocks can be nested - only the outermost block commits.
+
+        with database.transaction() as conn:
+            conn.execute(...)
+        '''
+        conn = self.get_connection()
+        self.__transaction_depth += 1
+        try:
+            yield conn
+            if self.__transaction_depth == 1:
+                conn.commit()
+        except:
+            if self.__transaction_depth == 1:
+                conn.rollback()
+            raise
+        finally:
+            self.__transaction_depth -= 1
+
+    def close(self):
+        '''Closes this process's connection to the database.'''
+        if self.__connection is not None and self.__connection_pid == os.getpid():
+            self.__connection.close()
+        self.__connection = None
+        self.__connection_pid = None
+
+    def __getstate__(self):
+        '''
+        The database connection is not passed to other processes - each process opens its own.
+        '''
+        state = self.__dict__.copy()
+        state['_DataBaseManager__connection'] = None
+        state['_DataBaseManager__connection_pid'] = None
+        state['_DataBaseManager__transaction_depth'] = 0
+        return state
+
     def __check_for_database(self):
         '''Checks if the database exists based on a path.'''
         return os.path.isfile(self.path_to_database) 
@@ -86,11 +200,10 @@ class DataBaseManager():
     def __create_sqlite_database(self):
         '''Create a database file and set up a table.'''  
         try:   
-            conn = sqlite3.connect(self.path_to_database)
-
-            conn.execute(f'''CREATE TABLE {self.table_name}
+            with self.transaction() as conn:
+                conn.execute(f'''CREATE TABLE {self.table_name}
                         (
-                        {self.primary_key} INT PRIMARY KEY NOT NULL,
+                        {self.primary_key} INTEGER PRIMARY KEY NOT NULL,
                         Title TEXT, 
                         Modes TEXT,
                         Genres TEXT,
@@ -134,78 +247,400 @@ class DataBaseManager():
             print(e) 
         finally:
             print("Table created successfully!")
-            conn.close()            
 
+    #############################################################################################################
+    ######### SCHEMA MIGRATIONS SECTION ######################
+    # Each migration step upgrades the database's schema by one version. The version is stored in the database's user_version pragma,
+    # so each step only runs once on each database. New steps are added to the end of the list with the next version number.
+    def __get_migrations(self) -> list[tuple]:
+        '''Returns the ordered migration steps - (version, description, method).'''
+        return [(1, "Convert the LastUpdate dates to ISO 8601 and index them", self.__migrate_last_update_to_iso),
+                (2, "Add the unique Title index", self.__migrate_title_index),
+                (3, "Add the credits, platforms and genres tables", self.__migrate_credit_tables),
+                (4, "Add the full-text search index", self.__migrate_search_index),
+                (5, "Add the change sequence and export watermarks", self.__migrate_change_sequence)]
+
+    def get_schema_version(self) -> int:
+        '''Returns the schema version of the database - the last migration step it has been upgraded with.'''
+        return self.get_connection().execute("PRAGMA user_version").fetchone()[0]
+
+    def upgrade_database(self):
+        '''
+        Runs every migration step newer than the database's schema version, in order.\n
+        Each step changes the rows in batches with one transaction per batch, so a large database is not locked for the whole upgrade.\n
+        If a step fails, the upgrade stops and the step is tried again the next time the database is started.
+        '''
+        currentVersion = self.get_schema_version()
+
+        for version, description, migration_function in self.__get_migrations():
+            if version <= currentVersion:
+                continue
+
+            print(f"Upgrading the database to version {version}: {description}.")
+            try:
+                migration_function()
+
+                self.get_connection().execute(f"PRAGMA user_version = {int(version)}")
+                currentVersion = version
+
+            except sqlite3.Error as e:
+                print(e)
+                print(f"Failed to upgrade the database to version {version}. The database will stay on version {currentVersion}.")
+                break
+
+    def __run_in_batches(self, description: str, sql_command: str):
+        '''
+        Runs a command over the games table in ID ranges, one transaction per range, and prints the progress.\n
+        The command must take the start (exclusive) and end (inclusive) of the ID range as its two bound parameters.
+        '''
+        lastID = self.get_connection().execute(f"SELECT COALESCE(MAX({self.primary_key}), 0) FROM {self.table_name}").fetchone()[0]
+        batchSize = max(1, self.migration_batch_size)
+
+        for startID in range(0, lastID, batchSize):
+            endID = min(startID + batchSize, lastID)
+            with self.transaction() as conn:
+                conn.execute(sql_command, (startID, endID))
+            print(f"{description} - {endID} of {lastID} game IDs done.")
+
+    def __migrate_last_update_to_iso(self):
+        '''
+        Version 1: Converts the LastUpdate dates stored in the old MM-DD-YYYY format to ISO 8601 timestamps - YYYY-MM-DDTHH:MM:SS,\n
+        and creates the LastUpdate index, so the dates can be sorted and range filtered by SQLite.\n
+        Games whose LastUpdate is 'None' are set to NULL, as they have never been updated.
+        '''
+        self.__run_in_batches("Converting the LastUpdate dates", f''' UPDATE {self.table_name} 
+            SET LastUpdate = CASE WHEN LastUpdate = 'None' THEN NULL 
+                                  ELSE substr(LastUpdate, 7, 4) || '-' || substr(LastUpdate, 1, 2) || '-' || substr(LastUpdate, 4, 2) || 'T00:00:00' END 
+            WHERE {self.primary_key} > ? AND {self.primary_key} <= ? 
+            AND (LastUpdate = 'None' OR LastUpdate GLOB '[0-9][0-9]-[0-9][0-9]-[0-9][0-9][0-9][0-9]') ''')
+
+        with self.transaction() as conn:
+            conn.execute(f''' CREATE INDEX IF NOT EXISTS idx_{self.table_name}_LastUpdate ON {self.table_name} (LastUpdate) ''')
+
+    def __migrate_title_index(self):
+        '''
+        Version 2: Creates the unique Title index, so each title is only stored once and a title's ID is found without scanning the table.\n
+        If the database already holds duplicate titles, a normal index is created instead and the duplicates are printed.
+        '''
+        try:
+            with self.transaction() as conn:
+                conn.execute(f''' CREATE UNIQUE INDEX IF NOT EXISTS idx_{self.table_name}_Title ON {self.table_name} (Title) ''')
+
+        except sqlite3.IntegrityError as e:
+            print(e)
+            duplicates = self.get_connection().execute(f''' SELECT Title, COUNT(*) FROM {self.table_name} GROUP BY Title HAVING COUNT(*) > 1 ''').fetchall()
+            print(f"The database holds {len(duplicates)} duplicate titles, so the Title index can't be unique:")
+            for title, count in duplicates:
+                print(f"{title} - {count} rows")
+
+            with self.transaction() as conn:
+                conn.execute(f''' CREATE INDEX IF NOT EXISTS idx_{self.table_name}_Title_NotUnique ON {self.table_name} (Title) ''')
+
+    def __migrate_credit_tables(self):
+        '''
+        Version 3: Creates the normalized People, Companies, Platforms and Genres tables and the tables linking them to the games,\n
+        so games can be looked up by a developer, person, platform or genre through an index instead of a LIKE scan.\n
+        The tables are then filled from the games already in the database.
+        '''
+        with self.transaction() as conn:
+            for nameTable, (linkTable, idColumn) in self.credit_tables.items():
+                conn.execute(f''' CREATE TABLE IF NOT EXISTS {nameTable} 
+                                  (ID INTEGER PRIMARY KEY, Name TEXT NOT NULL COLLATE NOCASE UNIQUE) ''')
+                conn.execute(f''' CREATE TABLE IF NOT EXISTS {linkTable} 
+                                  (GameID INTEGER NOT NULL, {idColumn} INTEGER NOT NULL, Role TEXT NOT NULL, 
+                                   PRIMARY KEY (GameID, {idColumn}, Role)) WITHOUT ROWID ''')
+                conn.execute(f''' CREATE INDEX IF NOT EXISTS idx_{linkTable}_{idColumn} ON {linkTable} ({idColumn}, Role, GameID) ''')
+
+        self.rebuild_credit_tables(self.migration_batch_size)
+
+    def __migrate_search_index(self):
+        '''
+        Version 4: Creates the FTS5 full-text index over the games' titles, series and extra Wikipedia info,\n
+        and the triggers that keep it in sync whenever a game is inserted, updated or deleted.\n
+        The index only stores the search terms - the text itself is read from the games table.\n
+        If this SQLite build does not include FTS5, the step is skipped and local search is not available.
+        '''
+        columns = ", ".join(self.search_columns)
+        newColumns = ", ".join(f"new.{column}" for column in self.search_columns)
+        oldColumns = ", ".join(f"old.{column}" for column in self.search_columns)
+
+        try:
+            with self.transaction() as conn:
+                # Start from an empty index, in case an earlier version of the program created one
+                for trigger in ("insert", "delete", "update"):
+                    conn.execute(f"DROP TRIGGER IF EXISTS {self.search_table_name}_{trigger}")
+                conn.execute(f"DROP TABLE IF EXISTS {self.search_table_name}")
+
+                conn.execute(f''' CREATE VIRTUAL TABLE {self.search_table_name} USING fts5(
+                                  {columns}, content='{self.table_name}', content_rowid='{self.primary_key}', 
+                                  tokenize='unicode61 remove_diacritics 2') ''')
+
+                conn.execute(f''' CREATE TRIGGER {self.search_table_name}_insert AFTER INSERT ON {self.table_name} BEGIN
+                                  INSERT INTO {self.search_table_name} (rowid, {columns}) VALUES (new.{self.primary_key}, {newColumns});
+                                  END ''')
+                conn.execute(f''' CREATE TRIGGER {self.search_table_name}_delete AFTER DELETE ON {self.table_name} BEGIN
+                                  INSERT INTO {self.search_table_name} ({self.search_table_name}, rowid, {columns}) VALUES ('delete', old.{self.primary_key}, {oldColumns});
+                                  END ''')
+                # Only updates to the searched columns touch the index - the LastUpdate and score updates do not
+                conn.execute(f''' CREATE TRIGGER {self.search_table_name}_update AFTER UPDATE OF {columns} ON {self.table_name} BEGIN
+                                  INSERT INTO {self.search_table_name} ({self.search_table_name}, rowid, {columns}) VALUES ('delete', old.{self.primary_key}, {oldColumns});
+                                  INSERT INTO {self.search_table_name} (rowid, {columns}) VALUES (new.{self.primary_key}, {newColumns});
+                                  END ''')
+
+        except sqlite3.OperationalError as e:
+            if "fts5" not in str(e).lower():
+                raise
+            print(e)
+            print("This SQLite build does not include FTS5 - local search will not be available.")
+            return
+
+        # Index the games already in the database
+        self.__run_in_batches("Building the full-text search index", f''' INSERT INTO {self.search_table_name} (rowid, {columns}) 
+            SELECT {self.primary_key}, {columns} FROM {self.table_name} WHERE {self.primary_key} > ? AND {self.primary_key} <= ? ''')
+
+    def __migrate_change_sequence(self):
+        '''
+        Version 5: Adds the ChangeSeq column and its index, the change counter and the export watermarks table,\n
+        so an export can write only the games changed since the last export.\n
+        The games already in the database are numbered by their IDs, and triggers number every later insert and update.
+        '''
+        conn = self.get_connection()
+        columns = [row[1] for row in conn.execute(f"PRAGMA table_info({self.table_name})")]
+
+        with self.transaction() as conn:
+            if 'ChangeSeq' not in columns:
+                conn.execute(f"ALTER TABLE {self.table_name} ADD COLUMN ChangeSeq INTEGER")
+            for trigger in ("insert", "update"):
+                conn.execute(f"DROP TRIGGER IF EXISTS {self.table_name}_changeseq_{trigger}")
+
+        self.__run_in_batches("Numbering the game changes", f''' UPDATE {self.table_name} SET ChangeSeq = {self.primary_key} 
+            WHERE {self.primary_key} > ? AND {self.primary_key} <= ? AND ChangeSeq IS NULL ''')
+
+        with self.transaction() as conn:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_ChangeSeq ON {self.table_name} (ChangeSeq)")
+
+            conn.execute(f''' CREATE TABLE IF NOT EXISTS {self.change_counter_table_name} 
+                              (ID INTEGER PRIMARY KEY CHECK (ID = 1), LastChangeSeq INTEGER NOT NULL) ''')
+            conn.execute(f''' INSERT INTO {self.change_counter_table_name} (ID, LastChangeSeq) 
+                              VALUES (1, (SELECT COALESCE(MAX(ChangeSeq), 0) FROM {self.table_name})) 
+                              ON CONFLICT (ID) DO UPDATE SET LastChangeSeq = MAX(LastChangeSeq, excluded.LastChangeSeq) ''')
+
+            conn.execute(f''' CREATE TABLE IF NOT EXISTS {self.export_watermarks_table_name} 
+                              (Name TEXT PRIMARY KEY, ChangeSeq INTEGER NOT NULL, LastExport TEXT) ''')
+
+            # The counter only ever goes up - a deleted game's number is never given to another change
+            nextChangeSeq = f''' UPDATE {self.change_counter_table_name} SET LastChangeSeq = LastChangeSeq + 1 WHERE ID = 1;
+                                 UPDATE {self.table_name} SET ChangeSeq = (SELECT LastChangeSeq FROM {self.change_counter_table_name} WHERE ID = 1) 
+                                 WHERE {self.primary_key} = new.{self.primary_key}; '''
+            conn.execute(f''' CREATE TRIGGER {self.table_name}_changeseq_insert AFTER INSERT ON {self.table_name} BEGIN
+                              {nextChangeSeq}
+                              END ''')
+            # Skipped for the trigger's own ChangeSeq update
+            conn.execute(f''' CREATE TRIGGER {self.table_name}_changeseq_update AFTER UPDATE ON {self.table_name} 
+                              WHEN new.ChangeSeq IS old.ChangeSeq BEGIN
+                              {nextChangeSeq}
+                              END ''')
+
+    #############################################################################################################
+    ######### INSERT GAMES SECTION ######################
     def insert_game_list(self, gameList: list):
         '''
         Insert games into the database.\n
-        Checks if the game title is in the database, before inserting them.
+        Only the titles that are not in the database yet are inserted, and the title to ID key is set for every title in the game list.
          
         :param gameList: List of game titles 
         :type gameList: list
         ''' 
-        lastIndex = self.__get_last_game_id() # Gets the last index ID of the games database.
-        indexCount = 0
-        dataToAdd = []
+        # Remove duplicate titles while keeping the game list's order
+        gameTitles = list(dict.fromkeys(gameList))
 
-        if lastIndex == 0: 
-            # If the last Index is zero then that means there is no existing data,  
-            # so it's ok to insert all games into the database 
-            for game in gameList:
-                indexCount += 1
+        try:
+            with self.transaction() as conn:
+                # Find the IDs of the titles already in the database through the Title index
+                existingTitleIDs = self.__get_ids_for_titles(conn, gameTitles)
 
-                self.database_game_to_id_key[game] = indexCount
+                gamesNotInDataBase = [gameTitle for gameTitle in gameTitles if gameTitle not in existingTitleIDs]
 
-                one_game_data = (indexCount, game)
-                dataToAdd.append(one_game_data) 
-            
-            converted_data_list = tuple(dataToAdd)
+                # If there are games that are not in the database, go ahead and add them to the database
+                if gamesNotInDataBase: 
+                    print(f"New Games Added - Adding {len(gamesNotInDataBase)} games to the database now.")
 
-            sql_command = f""" INSERT INTO {self.table_name} ({self.primary_key}, Title) VALUES (?, ?) """
+                    lastIndex = self.__get_last_game_id(conn) # Gets the last index ID of the games database.
 
-            self.__executemany_commit_sql_command(sql_command, converted_data_list)  
-        
-        else:            
-            gamesNotInDataBase = []
+                    converted_data_list = ((lastIndex + indexCount, gameTitle) for indexCount, gameTitle in enumerate(gamesNotInDataBase, start=1))
 
-            gamesInDataBase = []
+                    conn.executemany(f""" INSERT INTO {self.table_name} ({self.primary_key}, Title) VALUES (?, ?) ON CONFLICT DO NOTHING """, converted_data_list)
 
-            completeSQLGameList = self.__get_all_games_by_id_and_title_list()
-            # example list - [(1, 'Game1'), (2, 'Game2'), (3, "Game3")]
+                    print(f"New index account is {lastIndex + len(gamesNotInDataBase)}")
 
-            # First grab every game title in the database and its ID 
-            for gameData in completeSQLGameList:
-                gamesInDataBase.append(gameData[1]) # Gets the title of the game from the SQL data row and adds it to the gamesInDataBase list
-                self.database_game_to_id_key[gameData[1]] = gameData[0] # Sets the game title to its ID key for easier insert operations  
-            
-            # Check each game in the provided game list if it is in the database or not
-            for gameTitle in gameList:
-                if gameTitle not in gamesInDataBase: # if the game isn't in the database, then go ahead and aded it to the gamesNotInDataBase list
-                    gamesNotInDataBase.append(gameTitle)
+                    self.database_game_to_id_key.update(self.__get_ids_for_titles(conn, gamesNotInDataBase))
+                else:
+                    print("There are no new games to add to the database.")
+
+                self.database_game_to_id_key.update(existingTitleIDs)
+
+        except sqlite3.Error as e:
+            print(e)
+            print("Failed to add the new list of games into the database!")
 
-            # If there are games that are not in the database, go ahead and add them to the database
-            if gamesNotInDataBase: 
-                print(f"New Games Added - Adding {len(gamesNotInDataBase)} games to the database now.")
+    def __get_ids_for_titles(self, conn:sqlite3.Connection, gameTitles:list) -> dict:
+        '''
+        Returns the title to ID key of the game titles that are in the database.\n
+        The titles are loaded into a temporary table and joined against the games table on its Title index.
+        '''
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS SearchGameTitles (Title TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM temp.SearchGameTitles")
+        conn.executemany("INSERT OR IGNORE INTO temp.SearchGameTitles (Title) VALUES (?)", ((gameTitle,) for gameTitle in gameTitles))
 
-                indexCount = lastIndex 
+        titleIDs = {}
+        for gameID, gameTitle in conn.execute(f''' SELECT g.{self.primary_key}, g.Title FROM temp.SearchGameTitles AS t
+                                                   JOIN {self.table_name} AS g ON g.Title = t.Title '''):
+            titleIDs.setdefault(gameTitle, gameID)
 
-                for gameTitle in gamesNotInDataBase:
-                    indexCount += 1
+        conn.execute("DELETE FROM temp.SearchGameTitles")
+        return titleIDs
 
-                    self.database_game_to_id_key[gameTitle] = indexCount
+    #############################################################################################################
+    ######### CREDITS, PLATFORMS AND GENRES SECTION ######################
+    def rebuild_credit_tables(self, batchSize: int = 5000):
+        '''
+        Fills the credits, platforms and genres tables from the ' | ' joined columns of every game in the games table.\n
+        The games are read and written in batches, with one transaction per batch.
 
-                    one_game_data = (indexCount, gameTitle)
-                    dataToAdd.append(one_game_data) 
-                
-                print(f"New index account is {indexCount}")
-                converted_data_list = tuple(dataToAdd)
+        :param batchSize: Number of games written in each transaction.
+        :type batchSize: int
+        '''
+        columnNames = ", ".join(self.credit_columns.keys())
+        lastID = 0
+        gameCount = 0
 
-                sql_command = f""" INSERT INTO {self.table_name} ({self.primary_key}, Title) VALUES (?, ?) """
+        while True:
+            rows = self.get_connection().execute(f''' SELECT {self.primary_key}, {columnNames} FROM {self.table_name} 
+                                                      WHERE {self.primary_key} > ? ORDER BY {self.primary_key} LIMIT ? ''', (lastID, batchSize)).fetchall()
+            if not rows:
+                break
 
-                self.__executemany_commit_sql_command(sql_command, converted_data_list) 
+            with self.transaction() as conn:
+                for row in rows:
+                    self.__write_game_credits(conn, row[0], dict(zip(self.credit_columns.keys(), row[1:])))
 
-            else:
-                print("There are no new games to add to the database.")
+            lastID = rows[-1][0]
+            gameCount += len(rows)
+            print(f"Credits, platforms and genres tables - {gameCount} games added.")
+
+    def __write_game_credits(self, conn: sqlite3.Connection, gameID: int, columns: dict):
+        '''
+        Replaces a game's rows in the link tables with the names in its credit columns.
+
+        :param columns: Games table column names and their ' | ' joined values - {'Developers' : 'Studio 1 | Studio 2'}
+        :type columns: dict
+        '''
+        for linkTable, idColumn in self.credit_tables.values():
+            conn.execute(f"DELETE FROM {linkTable} WHERE GameID = ?", (gameID,))
+
+        for columnName, (nameTable, role) in self.credit_columns.items():
+            linkTable, idColumn = self.credit_tables[nameTable]
+
+            for name in self.__split_credit_names(columnName, columns.get(columnName)):
+                conn.execute(f"INSERT INTO {nameTable} (Name) VALUES (?) ON CONFLICT (Name) DO NOTHING", (name,))
+                conn.execute(f''' INSERT OR IGNORE INTO {linkTable} (GameID, {idColumn}, Role) 
+                                  SELECT ?, ID, ? FROM {nameTable} WHERE Name = ? ''', (gameID, role, name))
+
+    def __split_credit_names(self, columnName: str, value) -> list[str]:
+        '''
+        Splits a credit column's value into its names. Platforms and genres are also split on commas - 'Roguelike, action role-playing'.
+        '''
+        if not value or type(value).__name__ != 'str' or value in ('n/a', 'None', 'Not Found'):
+            return []
+
+        names = value.split(' | ')
+        if columnName in ('Platforms', 'Genres'):
+            names = [part for name in names for part in name.split(',')]
+
+        return list(dict.fromkeys(name.strip() for name in names if name.strip()))
+
+    def __get_games_by_credit(self, nameTable: str, name: str, role: str|None = None) -> list[tuple]:
+        '''Returns the ID and Title of every game linked to a name, optionally only with one role.'''
+        linkTable, idColumn = self.credit_tables[nameTable]
+
+        sql_command = f''' SELECT g.{self.primary_key}, g.Title FROM {nameTable} AS n
+                            JOIN {linkTable} AS l ON l.{idColumn} = n.ID
+                            JOIN {self.table_name} AS g ON g.{self.primary_key} = l.GameID
+                            WHERE n.Name = ? '''
+        parameters = (name,)
+        if role:
+            sql_command += " AND l.Role = ?"
+            parameters = (name, role)
+
+        try:
+            return self.get_connection().execute(sql_command + f" GROUP BY g.{self.primary_key} ORDER BY g.Title", parameters).fetchall()
+        except sqlite3.Error as e:
+            print(e)
+            print(f"Failed to get the games of {name} from the {nameTable} table.")
+            return []
+
+    def get_games_by_company(self, companyName: str, role: str|None = None) -> list[tuple]:
+        '''
+        Returns the ID and Title of every game made by a company - the name is not case sensitive.
+
+        :param companyName: Name of the company - 'Supergiant Games'
+        :type companyName: str
+        :param role: Optional role of the company - 'Developer' or 'Publisher'
+        :type role: str | None
+        '''
+        return self.__get_games_by_credit('Companies', companyName, role)
+
+    def get_games_by_person(self, personName: str, role: str|None = None) -> list[tuple]:
+        '''
+        Returns the ID and Title of every game a person worked on - the name is not case sensitive.
+
+        :param personName: Name of the person - 'Darren Korb'
+        :type personName: str
+        :param role: Optional role of the person - 'Director', 'Producer', 'Designer', 'Programmer', 'Artist', 'Writer' or 'Composer'
+        :type role: str | None
+        '''
+        return self.__get_games_by_credit('People', personName, role)
+
+    def get_games_by_platform(self, platformName: str) -> list[tuple]:
+        '''Returns the ID and Title of every game released on a platform - the name is not case sensitive.'''
+        return self.__get_games_by_credit('Platforms', platformName)
+
+    def get_games_by_genre(self, genreName: str) -> list[tuple]:
+        '''Returns the ID and Title of every game of a genre - the name is not case sensitive.'''
+        return self.__get_games_by_credit('Genres', genreName)
+
+    #############################################################################################################
+    ######### FULL-TEXT SEARCH SECTION ######################
+    def search_local(self, query: str, limit: int = 10) -> list[tuple]:
+        '''
+        Searches the games already in the database by their titles, series and extra Wikipedia info,\n
+        and returns the ID, Title and rank of the best matches - an exact title match first, then the best ranked matches.\n
+        Every word of the query must match, and the last word also matches as a prefix - 'hollow kni' finds 'Hollow Knight'.
+
+        :param query: Text to search for - such as a game title from the user's list.
+        :type query: str
+        :param limit: Maximum number of matches to return.
+        :type limit: int
+        '''
+        words = re.findall(r"\w+", query)
+        if not words:
+            return []
+
+        # Each word is quoted so FTS5 does not read it as a query operator
+        ftsQuery = " ".join(f'"{word}"' for word in words) + "*"
+        weights = ", ".join(str(weight) for weight in self.search_column_weights)
+
+        sql_command = f''' SELECT g.{self.primary_key}, g.Title, bm25({self.search_table_name}, {weights}) AS rank 
+                            FROM {self.search_table_name} AS s
+                            JOIN {self.table_name} AS g ON g.{self.primary_key} = s.rowid
+                            WHERE {self.search_table_name} MATCH ? 
+                            ORDER BY (g.Title = ? COLLATE NOCASE) DESC, rank LIMIT ? '''
+        try:
+            return self.get_connection().execute(sql_command, (ftsQuery, query.strip(), int(limit))).fetchall()
+        except sqlite3.Error as e:
+            print(e)
+            print(f"Failed to search the database for: {query}")
+            return []
 
     #############################################################################################################
     ######### EXECUTE SQL COMMANDS ######################
@@ -218,43 +653,29 @@ class DataBaseManager():
         :param converted_data_list: List containing the data that will be inserted, added, or changed.
         ''' 
         try:  
-            conn = sqlite3.connect(self.path_to_database) 
-
-            cursor = conn.cursor() 
-
-            cursor.executemany(sql_command, converted_data_list)
-
-            conn.commit()
+            with self.transaction() as conn:
+                conn.executemany(sql_command, converted_data_list)
 
         except sqlite3.Error as e:
             print(e)
             print("Failed to excecute the executemany command and add the new list of data into the database!")
-        
-        finally:
-            conn.close()
  
-    def __execute_commit_sql_command(self, sql_command:str):
+    def __execute_commit_sql_command(self, sql_command:str, parameters:tuple = ()):
         '''
         Execute a single line command to modify and change data in the database.
          
         :param sql_command: SQL Query Command instructing the database what to do with the data.
         :type sql_command: str 
+        :param parameters: Values bound to the command's ? placeholders.
+        :type parameters: tuple
         '''  
         try:  
-            conn = sqlite3.connect(self.path_to_database) 
-
-            cursor = conn.cursor() 
-
-            cursor.execute(sql_command) 
-
-            conn.commit() 
+            with self.transaction() as conn:
+                conn.execute(sql_command, parameters) 
 
         except sqlite3.Error as e:
             print(e) 
-            print(f"Failed to update the database with the following command:\n{sql_command}") 
-
-        finally: 
-            conn.close()
+            print(f"Failed to update the database with the following command:\n{sql_command}\n{parameters}") 
 
     #############################################################################################
     ############################################################################
@@ -331,16 +752,6 @@ class DataBaseManager():
                 listStr.append(item) 
         return newString.join(listStr) 
     
-    def apostrophe_string_check(self, value:str) -> str:
-        '''
-        Checks for any Apostrophes -> ' and replaces them with a Dash.
-        This is to prevent insertion errors when inserting into the Database.
-        '''
-        if "\'" in value:
-            value = value.replace('\'', '-')
-
-        return value
-
     ########################################################################################################################################
     ########################################################################################################################################
     ############################# UPDATING DATABASE WITH ONE GAME SECTION #################################################################
@@ -359,29 +770,80 @@ class DataBaseManager():
         :param brand: Website Brand/Platform to update the database on.
         :type brand: str
         '''
+        self.write_game_updates([(gameObject, brand)], [])
+
+    def write_game_updates(self, brandUpdates: list[tuple], completedTitles: list[str]) -> bool:
+        '''
+        Writes a batch of search results and LastUpdate dates to the database in one transaction.\n
+        The updates of each brand share the same command, so they are written with one executemany call per brand.\n
+        The credits, platforms and genres tables are updated in the same transaction for each Wikipedia result.\n
+        Returns False if the batch failed and was rolled back.
+
+        :param brandUpdates: Game Objects and the brand to update for each one - [(Game, 'Steam'), (Game, 'Wikipedia')]
+        :type brandUpdates: list[tuple]
+        :param completedTitles: Titles of the games that every brand has finished searching for - their LastUpdate is set to now.
+        :type completedTitles: list[str]
+        '''
+        commands: dict[str, list] = {}
+        creditUpdates = []
+        for gameObject, brand in brandUpdates:
+            columns = self.__get_update_columns(gameObject, brand)
+            sql_command, parameters = self.__create_update_command(columns, self.database_game_to_id_key[gameObject.name])
+            commands.setdefault(sql_command, []).append(parameters)
+
+            if brand == PC.WIKIPEDIA_BRAND:
+                creditUpdates.append((self.database_game_to_id_key[gameObject.name], columns))
+
+        currentDate = self.__getCurrentDateDataBase()
+
+        try:
+            with self.transaction() as conn:
+                for sql_command, parametersList in commands.items():
+                    conn.executemany(sql_command, parametersList)
+
+                for gameID, columns in creditUpdates:
+                    self.__write_game_credits(conn, gameID, columns)
+
+                conn.executemany(f""" UPDATE {self.table_name} SET LastUpdate = ? {self.__create_where_id_line()} """, 
+                                 ((currentDate, self.database_game_to_id_key[gameTitle]) for gameTitle in completedTitles))
+            return True
+
+        except sqlite3.Error as e:
+            print(e)
+            print(f"Failed to write the search results of {len(brandUpdates)} searches to the database!")
+            return False
+
+    def __get_update_columns(self, gameObject: Game, brand: str) -> dict:
+        '''Returns the column names and values to update for one game's data on one brand.'''
         if brand == PC.OPENCRITIC_BRAND:
-            line_info = self.__create_set_and_where_one_gameObj_opencritic_data(gameObject)
+            columns = self.__create_set_and_where_one_gameObj_opencritic_data(gameObject)
 
         elif brand == PC.STEAM_BRAND: 
-            line_info = self.__create_set_and_where_one_gameObj_steam_data(gameObject)
+            columns = self.__create_set_and_where_one_gameObj_steam_data(gameObject)
 
         elif brand == PC.WIKIPEDIA_BRAND:
-            line_info = self.__create_set_and_where_one_gameObj_wiki_data(gameObject)
+            columns = self.__create_set_and_where_one_gameObj_wiki_data(gameObject)
+
+        return columns
+
+    def __create_update_command(self, columns: dict, gameID: int) -> tuple[str, tuple]:
+        '''Returns the UPDATE command for the columns and its bound parameters.'''
+        set_line = ", ".join(f"{columnName} = ?" for columnName in columns.keys())
 
         # SQL Command to update the one game
-        sql_command = f""" UPDATE {self.table_name} {line_info}"""
+        sql_command = f""" UPDATE {self.table_name} SET {set_line} {self.__create_where_id_line()} """
 
-        self.__execute_commit_sql_command(sql_command)
+        return sql_command, tuple(columns.values()) + (gameID,)
  
-    def __create_set_and_where_one_gameObj_wiki_data(self, gameObj: Game) -> str:     
+    def __create_set_and_where_one_gameObj_wiki_data(self, gameObj: Game) -> dict:     
         '''
         Utilizes the Game Object to get the Wikipedia Data from the object\n
-        to create the necessary set and where sql string command line.
+        to create the column names and values of the update command.
          
         :param gameObj: Game Object containing data on the game. 
         :type gameObj: Game
-        :return: SQL Command Statement
-        :rtype: str
+        :return: Column Name to Value Dictionary
+        :rtype: dict
         '''   
 
         # Lambda Function to insert a 'n/a' whenever there is no data or valid data contained within the Game Object's variable
@@ -394,7 +856,7 @@ class DataBaseManager():
             wikiReviews = empty_value_check(self.check_container_type(gameObj.wiki_data.reviews_dict))
             releaseDate = empty_value_check(self.check_container_type(gameObj.wiki_data.release))
             imageURL = empty_value_check(self.check_container_type(gameObj.wiki_data.image))
-            titleOnWebsite = self.apostrophe_string_check(empty_value_check(self.check_container_type(gameObj.wiki_data.title_on_wiki)))
+            titleOnWebsite = empty_value_check(self.check_container_type(gameObj.wiki_data.title_on_wiki))
             series = empty_value_check(self.check_container_type(gameObj.wiki_data.series))
             developers = empty_value_check(self.check_container_type(gameObj.wiki_data.developers))
             publishers = empty_value_check(self.check_container_type(gameObj.wiki_data.publisher))
@@ -430,27 +892,30 @@ class DataBaseManager():
             extraInfo = 'n/a'
             gameURL = 'No URL'
 
-        # SQL Command to update the one game
-        line_info = f"""SET Modes = '{mode}', Genres = '{genres}', Platforms = '{platforms}', WikiReviews = '{wikiReviews}', WikiReleaseDate = '{releaseDate}', WikiImageURL = '{imageURL}', WikiTitle = '{titleOnWebsite}', Series = '{series}', Developers = '{developers}', Publishers = '{publishers}', Directors = '{directors}', Producers = '{producers}', Designers = '{designers}', Programmers = '{programmers}', Artists = '{artists}', Writers = '{writers}', Composers = '{composers}', Engine = '{engine}', ExtraWikiInfo = '{extraInfo}', WikiURL = '{gameURL}' {self.__create_where_id_line(gameObj.name)} """
+        # Columns to update for the one game
+        columns = {'Modes' : mode, 'Genres' : genres, 'Platforms' : platforms, 'WikiReviews' : wikiReviews, 'WikiReleaseDate' : releaseDate, 
+                   'WikiImageURL' : imageURL, 'WikiTitle' : titleOnWebsite, 'Series' : series, 'Developers' : developers, 'Publishers' : publishers, 
+                   'Directors' : directors, 'Producers' : producers, 'Designers' : designers, 'Programmers' : programmers, 'Artists' : artists, 
+                   'Writers' : writers, 'Composers' : composers, 'Engine' : engine, 'ExtraWikiInfo' : extraInfo, 'WikiURL' : gameURL}
     
-        return line_info    
+        return columns    
 
-    def __create_set_and_where_one_gameObj_opencritic_data(self, gameObject: Game) -> str:
+    def __create_set_and_where_one_gameObj_opencritic_data(self, gameObject: Game) -> dict:
         '''
         Utilizes the Game Object to get the OpenCritic Data from the object\n
-        to create the necessary set and where sql string command line.
+        to create the column names and values of the update command.
          
         :param gameObj: Game Object containing data on the game. 
         :type gameObj: Game
-        :return: SQL Command Statement
-        :rtype: str
+        :return: Column Name to Value Dictionary
+        :rtype: dict
         '''  
         if gameObject.open_c_data.found_data:
             rating = gameObject.open_c_data.openCriticRatingText
             top_critic_average = self.__string_value_check(gameObject.open_c_data.topCriticAverage)
             critics_recommend = self.__string_value_check(gameObject.open_c_data.criticsRecommend)
             gameURL = gameObject.open_c_data.url             
-            titleOnWebsite = self.apostrophe_string_check(gameObject.open_c_data.title_on_oc)
+            titleOnWebsite = gameObject.open_c_data.title_on_oc
         else: 
             rating = "None"
             top_critic_average = 0
@@ -459,20 +924,21 @@ class DataBaseManager():
             
             titleOnWebsite = 'Not Found'
   
-        # SQL Command to update the one game
-        line_info = f"""SET OpenCriticRating = '{rating}', OpenCriticAverage = {top_critic_average}, OpenCriticRecommend = {critics_recommend}, OpenCriticTitle = '{titleOnWebsite}', OpenCriticURL = '{gameURL}' {self.__create_where_id_line(gameObject.name)} """
+        # Columns to update for the one game
+        columns = {'OpenCriticRating' : rating, 'OpenCriticAverage' : top_critic_average, 'OpenCriticRecommend' : critics_recommend, 
+                   'OpenCriticTitle' : titleOnWebsite, 'OpenCriticURL' : gameURL}
 
-        return line_info 
+        return columns 
 
-    def __create_set_and_where_one_gameObj_steam_data(self, gameObject: Game) -> str:
+    def __create_set_and_where_one_gameObj_steam_data(self, gameObject: Game) -> dict:
         '''
         Utilizes the Game Object to get the Steam Data from the object\n
-        to create the necessary set and where sql string command line.
+        to create the column names and values of the update command.
          
         :param gameObj: Game Object containing data on the game. 
         :type gameObj: Game
-        :return: SQL Command Statement
-        :rtype: str
+        :return: Column Name to Value Dictionary
+        :rtype: dict
         '''  
         if gameObject.steam_data.found_data:
             
@@ -490,7 +956,7 @@ class DataBaseManager():
 
             gameURL = gameObject.steam_data.url
             
-            titleOnWebsite = self.apostrophe_string_check(gameObject.steam_data.title_on_steam)
+            titleOnWebsite = gameObject.steam_data.title_on_steam
         else: 
             allReviewsText = 'No user review'
             recentReviewsText = 'No user review'
@@ -505,21 +971,22 @@ class DataBaseManager():
             gameURL = 'No URL'              
             titleOnWebsite = "Not Found"
         
-        # SQL Command to update the one game
-        line_info = f"""SET SteamAllText = '{allReviewsText}', SteamRecentText = '{recentReviewsText}', SteamAllData = '{allReviewsData}', SteamRecentData = '{recentReviewsData}', SteamAllScore = {allReviewsScore}, SteamRecentScore = {recentReviewsScore}, SteamReleaseDate = '{releaseDate}', SteamImageURL = '{imageURL}', SteamTitle = '{titleOnWebsite}', SteamURL = '{gameURL}' {self.__create_where_id_line(gameObject.name)} """
+        # Columns to update for the one game
+        columns = {'SteamAllText' : allReviewsText, 'SteamRecentText' : recentReviewsText, 'SteamAllData' : allReviewsData, 
+                   'SteamRecentData' : recentReviewsData, 'SteamAllScore' : allReviewsScore, 'SteamRecentScore' : recentReviewsScore, 
+                   'SteamReleaseDate' : releaseDate, 'SteamImageURL' : imageURL, 'SteamTitle' : titleOnWebsite, 'SteamURL' : gameURL}
 
-        return line_info 
+        return columns 
 
-    def __create_where_id_line(self, gameTitle) -> str:
+    def __create_where_id_line(self) -> str:
         '''
-        Creates the where line part of the SQL Command. 
+        Creates the where line part of the SQL Command.\n
+        The game's ID is bound to the ? placeholder - self.database_game_to_id_key[gameTitle]
         
-        :param gameTitle: Game Title used to find the correct ID.
-        :type gameTitle: str
         :return: 'Where' Part of the SQL Command to be appended to the final SQL Command.
         :rtype: str
         '''
-        where_line = f"WHERE {self.primary_key} = {self.database_game_to_id_key[gameTitle]}"
+        where_line = f"WHERE {self.primary_key} = ?"
         return where_line
 
 
@@ -537,16 +1004,12 @@ class DataBaseManager():
         '''
         dataList = []
         try: 
-            conn = sqlite3.connect(self.path_to_database)
-                
-            cursor = conn.cursor()
+            cursor = self.get_connection().cursor()
             
-            data=cursor.execute(f''' SELECT {self.primary_key} FROM {self.table_name} WHERE Title = '{game_title}' ''') 
+            data=cursor.execute(f''' SELECT {self.primary_key} FROM {self.table_name} WHERE Title = ? ''', (game_title,)) 
             
             for row in data: 
                 dataList.append(row)
-            
-            conn.close()
 
             return dataList[0][0]
         except: 
@@ -564,122 +1027,257 @@ class DataBaseManager():
         '''        
         dataList = []
         try: 
-            conn = sqlite3.connect(self.path_to_database)
-                
-            cursor = conn.cursor() 
+            cursor = self.get_connection().cursor() 
             
-            command = f''' SELECT {self.spreadsheet_to_database_dict[spColumnName]} FROM {self.table_name} {self.__create_where_id_line(gameName)} ''' 
+            command = f''' SELECT {self.spreadsheet_to_database_dict[spColumnName]} FROM {self.table_name} {self.__create_where_id_line()} ''' 
 
-            data = cursor.execute(command) 
+            data = cursor.execute(command, (self.database_game_to_id_key[gameName],)) 
             
             for row in data: 
                 dataList.append(row)  
 
-            conn.close()
-
             return dataList[0][0]
         except: 
             print(f"Failed to excecute the command: Unable to get data from the {self.table_name} table by column name: {spColumnName}.")
             return '' 
  
-    def __get_all_games_by_id_and_title_list(self):
+    def get_game_rows(self, gameKeys: list, columns: list|None = None, asDict: bool = False) -> list:
         '''
-        Gets all the game titles and IDs from the database.
-        '''  
-        sql_command = f""" SELECT {self.primary_key}, Title FROM {self.table_name}""" 
+        Returns the full rows of a list of games, in the order of the list, with one query per batch of games\n
+        instead of one query per game and column. Games that are not in the database are left out.
+
+        :param gameKeys: Game titles or game IDs.
+        :type gameKeys: list
+        :param columns: Spreadsheet or database column names to return - None returns every spreadsheet column, in the spreadsheet's order.
+        :type columns: list | None
+        :param asDict: Return each row as a dictionary of column name to value instead of a tuple.
+        :type asDict: bool
+        '''
+        return list(self.iter_game_rows(gameKeys, columns, asDict))
 
+    def iter_game_rows(self, gameKeys: list|None = None, columns: list|None = None, asDict: bool = False, fetchSize: int = 1000):
+        '''
+        Generator that streams the rows of a list of games - or of every game in the database, in ID order - fetchSize rows at a time,\n
+        so a large export never holds the whole table in memory.\n
+        Each batch is its own query, so no read is kept open on the connection between batches.\n
+        A failed query raises its sqlite3.Error, so an export writing the rows to a file is never left silently incomplete.
+
+        :param gameKeys: Game titles or game IDs - None streams every game in the database.
+        :type gameKeys: list | None
+        :param columns: Spreadsheet or database column names to return - None returns every spreadsheet column, in the spreadsheet's order.
+        :type columns: list | None
+        :param asDict: Yield each row as a dictionary of column name to value instead of a tuple.
+        :type asDict: bool
+        :param fetchSize: Number of rows fetched by each query.
+        :type fetchSize: int
+        '''
+        columns = list(self.spreadsheet_to_database_dict.keys()) if columns is None else list(columns)
+        selectColumns = ", ".join(self.__get_database_column_name(column) for column in columns)
+        fetchSize = max(1, min(int(fetchSize), 30000))
+
+        if gameKeys is None:
+            sql_command = f''' SELECT {self.primary_key}, {selectColumns} FROM {self.table_name} 
+                               WHERE {self.primary_key} > ? ORDER BY {self.primary_key} LIMIT ? '''
+            lastID = 0
+            while True:
+                rows = self.get_connection().execute(sql_command, (lastID, fetchSize)).fetchall()
+                for row in rows:
+                    yield dict(zip(columns, row[1:])) if asDict else row[1:]
+                if len(rows) < fetchSize:
+                    return
+                lastID = rows[-1][0]
+
+        gameIDs = self.__get_ids_for_game_keys(gameKeys)
+
+        for start in range(0, len(gameIDs), fetchSize):
+            batchIDs = gameIDs[start:start + fetchSize]
+            sql_command = f''' SELECT {self.primary_key}, {selectColumns} FROM {self.table_name} 
+                               WHERE {self.primary_key} IN ({", ".join("?" * len(batchIDs))}) '''
+            rowsByID = {row[0] : row[1:] for row in self.get_connection().execute(sql_command, batchIDs)}
+
+            for gameID in batchIDs:
+                if gameID in rowsByID:
+                    row = rowsByID[gameID]
+                    yield dict(zip(columns, row)) if asDict else row
+
+    def iter_changed_game_rows(self, sinceChangeSeq: int, untilChangeSeq: int, columns: list|None = None, asDict: bool = False, fetchSize: int = 1000):
+        '''
+        Generator that streams the rows of the games inserted or updated after one change sequence number, up to and including another,\n
+        in the order they were changed - fetchSize rows at a time, read through the ChangeSeq index.\n
+        A failed query raises its sqlite3.Error, so an incremental export never moves its watermark past rows it did not write.
+
+        :param sinceChangeSeq: Change sequence number of the last change already exported - 0 streams every game.
+        :type sinceChangeSeq: int
+        :param untilChangeSeq: Last change sequence number to stream - usually get_last_change_seq() from before the export started.
+        :type untilChangeSeq: int
+        :param columns: Spreadsheet or database column names to return - None returns every spreadsheet column, in the spreadsheet's order.
+        :type columns: list | None
+        :param asDict: Yield each row as a dictionary of column name to value instead of a tuple.
+        :type asDict: bool
+        :param fetchSize: Number of rows fetched by each query.
+        :type fetchSize: int
+        '''
+        columns = list(self.spreadsheet_to_database_dict.keys()) if columns is None else list(columns)
+        selectColumns = ", ".join(self.__get_database_column_name(column) for column in columns)
+        fetchSize = max(1, int(fetchSize))
+
+        sql_command = f''' SELECT ChangeSeq, {selectColumns} FROM {self.table_name} 
+                           WHERE ChangeSeq > ? AND ChangeSeq <= ? ORDER BY ChangeSeq LIMIT ? '''
+        lastChangeSeq = sinceChangeSeq
+        while True:
+            rows = self.get_connection().execute(sql_command, (lastChangeSeq, untilChangeSeq, fetchSize)).fetchall()
+            for row in rows:
+                yield dict(zip(columns, row[1:])) if asDict else row[1:]
+            if len(rows) < fetchSize:
+                return
+            lastChangeSeq = rows[-1][0]
+
+    def get_last_change_seq(self) -> int:
+        '''Returns the change sequence number of the last insert or update of a game - 0 if there is no change counter.'''
         try:
-            conn = sqlite3.connect(self.path_to_database)
-            
-            cursor = conn.cursor() 
-
-            cursor.execute(sql_command) 
-            
-            sqlList = cursor.fetchall()
-        
-            conn.close()
+            row = self.get_connection().execute(f"SELECT LastChangeSeq FROM {self.change_counter_table_name} WHERE ID = 1").fetchone()
+            return row[0] if row else 0
+        except sqlite3.Error as e:
+            print(e)
+            return 0
 
-            return sqlList
+    def get_export_watermark(self, exportName: str) -> int:
+        '''
+        Returns the change sequence number of the last change written by an incremental export - 0 if it has never been run.
 
+        :param exportName: Name of the incremental export - such as its file format.
+        :type exportName: str
+        '''
+        try:
+            row = self.get_connection().execute(f"SELECT ChangeSeq FROM {self.export_watermarks_table_name} WHERE Name = ?", (exportName,)).fetchone()
+            return row[0] if row else 0
         except sqlite3.Error as e:
             print(e)
-            print("Failed to excecute the command: Unable to get all games by id and title list.")
-            conn.close() 
+            return 0
 
-    def __get_last_game_id(self):
+    def set_export_watermark(self, exportName: str, changeSeq: int):
         '''
-        Gets the last index ID of the database.
+        Records the change sequence number of the last change written by an incremental export.\n
+        Errors are raised to the caller instead of printed, so a watermark that was not saved fails the export.
+
+        :param exportName: Name of the incremental export - such as its file format.
+        :type exportName: str
+        :param changeSeq: Change sequence number of the last change written.
+        :type changeSeq: int
         '''
-        dataList = []
-        try: 
-            conn = sqlite3.connect(self.path_to_database)
-                
-            cursor = conn.cursor() 
-            
-            data = cursor.execute(f''' SELECT {self.primary_key} FROM {self.table_name} ORDER BY {self.primary_key} ASC''') 
-            
-            for row in data: 
-                dataList.append(row) 
+        sql_command = f''' INSERT INTO {self.export_watermarks_table_name} (Name, ChangeSeq, LastExport) VALUES (?, ?, ?)
+                           ON CONFLICT (Name) DO UPDATE SET ChangeSeq = excluded.ChangeSeq, LastExport = excluded.LastExport '''
+        with self.transaction() as conn:
+            conn.execute(sql_command, (exportName, changeSeq, self.__getCurrentDateDataBase()))
 
-            print(f"Last Index ID is {dataList[-1][0]}")
+    def __get_ids_for_game_keys(self, gameKeys: list) -> list[int]:
+        '''
+        Returns the IDs of a list of game titles or IDs, in the list's order - titles not in the database are left out.\n
+        Titles missing from the title to ID key are looked up in the database with one query.
+        '''
+        missingTitles = [key for key in gameKeys if type(key).__name__ == 'str' and key not in self.database_game_to_id_key]
+        titleIDs = {}
+        if missingTitles:
+            with self.transaction() as conn:
+                titleIDs = self.__get_ids_for_titles(conn, missingTitles)
+
+        gameIDs = []
+        for key in gameKeys:
+            if type(key).__name__ == 'str':
+                gameID = self.database_game_to_id_key.get(key, titleIDs.get(key))
+            else:
+                gameID = int(key)
+            if gameID is not None:
+                gameIDs.append(gameID)
+        return gameIDs
 
-            conn.close()
+    def __get_database_column_name(self, column: str) -> str:
+        '''
+        Returns the database column name of a spreadsheet or database column name.\n
+        Raises a ValueError for any other name, so only known columns are ever put into a SQL command.
+        '''
+        databaseColumn = self.spreadsheet_to_database_dict.get(column, column)
+        if databaseColumn not in self.spreadsheet_to_database_dict.values() and databaseColumn not in (self.primary_key, 'LastUpdate', 'ChangeSeq'):
+            raise ValueError(f"Unknown column name: {column}")
+        return databaseColumn
 
-            return dataList[-1][0]
-        except: 
-            print(f"Unable to get the last ID!")
-            return 0
+    def __get_last_game_id(self, conn:sqlite3.Connection) -> int:
+        '''
+        Gets the last index ID of the database, or 0 if the database is empty.
+        '''
+        lastID = conn.execute(f''' SELECT COALESCE(MAX({self.primary_key}), 0) FROM {self.table_name} ''').fetchone()[0]
 
+        print(f"Last Index ID is {lastID}")
 
-    def get_game_data_last_update(self, gameTitle: str):
+        return lastID
+
+    def get_stale_game_ids(self, gameTitles: list, maxAgeDays: int) -> set:
         '''
-        Gets the last data column for a game title.
+        Returns the IDs of the game titles that have never been updated, or were last updated more than maxAgeDays ago.\n
+        The titles' IDs are loaded into a temporary table and joined against the games table,\n
+        so the whole list is checked with one query instead of one query per title.
+
+        :param gameTitles: Game titles to check - they must already be in the database.
+        :type gameTitles: list
+        :param maxAgeDays: Number of days after which a game's data is searched for again.
+        :type maxAgeDays: int
         '''
-        gameDate = 'None'
-        dataList = []
-        sql_command = f''' SELECT LastUpdate FROM {self.table_name} WHERE ID = {self.database_game_to_id_key[gameTitle]} '''
+        staleIDs = set()
 
-        # Connect to the SQ Database and update it with the command
-        try:  
-            conn = sqlite3.connect(self.path_to_database) 
+        sql_command = f''' SELECT t.ID FROM temp.SearchGameIDs AS t
+                           LEFT JOIN {self.table_name} AS g ON g.{self.primary_key} = t.ID
+                           WHERE g.LastUpdate IS NULL OR g.LastUpdate < ? '''
+        try:
+            with self.transaction() as conn:
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS SearchGameIDs (ID INTEGER PRIMARY KEY)")
+                conn.execute("DELETE FROM temp.SearchGameIDs")
+                conn.executemany("INSERT OR IGNORE INTO temp.SearchGameIDs (ID) VALUES (?)", 
+                                 ((self.database_game_to_id_key[gameTitle],) for gameTitle in gameTitles))
 
-            cursor = conn.cursor() 
+                for row in conn.execute(sql_command, (self.__get_date_days_ago(maxAgeDays),)):
+                    staleIDs.add(row[0])
 
-            data = cursor.execute(sql_command) 
+                conn.execute("DELETE FROM temp.SearchGameIDs")
 
-            for row in data: 
-                dataList.append(row)  
+        except sqlite3.Error as e:
+            print(e)
+            print("Failed to get the games that need to be updated - every game will be searched for.")
+            staleIDs = {self.database_game_to_id_key[gameTitle] for gameTitle in gameTitles}
 
-            gameDate = dataList[0][0]
+        return staleIDs
+
+    def get_games_older_than(self, days: int, limit: int|None = None) -> list[tuple]:
+        '''
+        Returns the ID, Title and LastUpdate of every game that has never been updated or was last updated more than a number of days ago,\n
+        oldest first - the games that have never been updated come before any others.\n
+        The LastUpdate index is read in order, so only the returned rows are visited.
+
+        :param days: Number of days since the game's last update.
+        :type days: int
+        :param limit: Maximum number of games to return - None returns every game.
+        :type limit: int | None
+        '''
+        sql_command = f''' SELECT {self.primary_key}, Title, LastUpdate FROM {self.table_name}
+                           WHERE LastUpdate IS NULL OR LastUpdate < ?
+                           ORDER BY LastUpdate ASC LIMIT ? '''
+        try:
+            return self.get_connection().execute(sql_command, (self.__get_date_days_ago(days), -1 if limit is None else int(limit))).fetchall()
 
         except sqlite3.Error as e:
-            print(e) 
-            print(f"Failed to get the last game data update for the game: {gameTitle}") 
-        finally:    
-            conn.close()
-            return gameDate
-   
+            print(e)
+            print(f"Failed to get the games older than {days} days.")
+            return []
 
     ### Setter Methods ###
-    def update_game_new_update_date(self, gameTitle: str):
-        '''Sets the LastUpdate column for a game title to the current date.'''
-        # SQL Command to update the one game
-        sql_command = f""" UPDATE {self.table_name} 
-                            SET LastUpdate = '{self.__getCurrentDateDataBase()}' 
-                            WHERE {self.primary_key} = {self.database_game_to_id_key[gameTitle]}; """
-        print(f"Game ID:{self.database_game_to_id_key[gameTitle]}")
-        
-        # Connect to the SQ Database and update it with the command
-        self.__execute_commit_sql_command(sql_command)
-
     # Used for bulk updates
     def update_multiple_games_with_new_update_date(self, gameList: set):
         '''Sets a list of game titles to the current date in their LastUpdate column.'''
-        converted_data_list = tuple(gameList)
+        currentDate = self.__getCurrentDateDataBase()
+        converted_data_list = tuple((currentDate, self.database_game_to_id_key[gameTitle]) for gameTitle in gameList)
 
         # SQL Command to update the one game
         sql_command = f""" UPDATE {self.table_name} 
-                            SET LastUpdate = '{self.__getCurrentDateDataBase()}' 
+                            SET LastUpdate = ? 
                             WHERE {self.primary_key} = ? """ 
 
         self.__executemany_commit_sql_command(sql_command, converted_data_list) 
@@ -689,28 +1287,20 @@ class DataBaseManager():
         ''' Updates a data point by Column Name, ID, and dataInput.\n
             For example, update 'Title' to 'Game1' where ID is 1
         '''
-        if type(dataInput).__name__ == 'str':
-            sql_command = f""" UPDATE {self.table_name} 
-                            SET {columnName} = '{dataInput}' 
-                            WHERE ID = {ID} """
-        else: 
-            sql_command = f""" UPDATE {self.table_name} 
-                            SET {columnName} = {dataInput} 
-                            WHERE ID = {ID} """
+        sql_command = f""" UPDATE {self.table_name} 
+                            SET {columnName} = ? 
+                            WHERE ID = ? """
 
-        self.__execute_commit_sql_command(sql_command)
+        self.__execute_commit_sql_command(sql_command, (dataInput, ID))
 
 
     def insert_new_single_line_database(self, rowID: int, columnName: str, dataInput): #  
         ''' Inserts a new line by Column Name, ID, and dataInput.\n
             For example, insert 'Game1-title' and 1 (where 1 is the ID of the row) to the database. 
         '''
-        if type(dataInput).__name__ == 'str':
-            sql_command = f""" INSERT INTO {self.table_name} (ID,{columnName}) VALUES ({rowID}, '{dataInput}') """
-        else:
-            sql_command = f""" INSERT INTO {self.table_name} (ID,{columnName}) VALUES ({rowID}, {dataInput}) """
+        sql_command = f""" INSERT INTO {self.table_name} (ID,{columnName}) VALUES (?, ?) """
 
-        self.__execute_commit_sql_command(sql_command)
+        self.__execute_commit_sql_command(sql_command, (rowID, dataInput))
 
 
 
@@ -718,56 +1308,14 @@ class DataBaseManager():
     #############################################################################
     # Date Functions that help to set or determine the dates of each data entry #
 
-    def __getDateNumbers(self, dateSTR:str):
-        '''Gets the year, month, and day from a string.'''
-        date = str(dateSTR).split('-')
-        month = int(date[0])
-        day = int(date[1])
-        year = int(date[2])
-        return year, month, day
-
-    def compareDates(self, datePast: str, daysToAdd: int) -> bool:
-        '''
-        Checks the date of the game's LastUpdate column by adding a specific number of days.\n
-        And determines whether the game's LastUpdate date is less than or greater than the number of days passed in.\n
-
-        This method is used to determine if a game in the database should be updated based on the last date it was updated.\n
-        For example, if the game's data was last updated on 1-1-2024, and the user wants to update any game's data after 364 days,\n
-        then this method would compare the old date to the current date for example 1-1-2025 and determine if enough time \n
-        has passed to warrant a new search for the game's data.
-         
-        :param datePast: Game's LastUpdate date. 
-        :type datePast: str
-        :param daysToAdd: Number of days to check since the last update.
-        :type daysToAdd: int
-        :return: Boolean value that indicates if the game's data should updated.
-        :rtype: bool
-        '''
-        isDateOld = False 
-
-        dateCurrent = datetime.datetime.today()
-        print("Comparing dates...")
-        print(f"Current day is {dateCurrent.strftime('%m-%d-%Y')} !\n")
-
-        y, m, d = self.__getDateNumbers(datePast)
-
-        newPastDate = datetime.datetime(y, m, d)+ datetime.timedelta(days=daysToAdd)
-
-        print(f"Past date {datetime.datetime(y, m, d).strftime('%m-%d-%Y')} plus {daysToAdd} days is {newPastDate.strftime('%m-%d-%Y')} !\n")
-
-        if dateCurrent > newPastDate:
-            print(f"The current date is greater than {daysToAdd} days!\n")
-            print("We can update this game!")
-            isDateOld = True
-        else:
-            print(f"The current date is not greater than {daysToAdd} days!\n")
-            print("We will not update this game!")
-
-        return isDateOld
+    def __get_date_days_ago(self, days: int) -> str:
+        '''Returns the ISO 8601 timestamp of a number of days before now - used to compare against the LastUpdate column.'''
+        d = datetime.datetime.now() - datetime.timedelta(days=int(days))
+        return d.isoformat(timespec='seconds')
 
     def __getCurrentDateDataBase(self):
-        '''Returns a string of today's date.'''
-        d = datetime.datetime.today()
-        return d.strftime('%m-%d-%Y') 
+        '''Returns an ISO 8601 timestamp of the current date and time - YYYY-MM-DDTHH:MM:SS.'''
+        d = datetime.datetime.now()
+        return d.isoformat(timespec='seconds') 
 
  
\ No newline at end of file
@@ -0,0 +1,99 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - database_writer.py
+# Write-behind buffer for the search results. The web hunters' worker processes never touch the database -
+# their results are sent back to the main process, where this class writes them in batches, one transaction per batch.
+
+import time
+
+try:
+    from ClassContainers.GameData import Game # type: ignore ##
+
+    from Managers.database_manager import DataBaseManager # type: ignore ##
+
+except ImportError as e:
+    print(e)
+    print("Missing Modules in database_writer.py.")
+
+class DatabaseWriter():
+    '''
+    Collects the search results of each game and brand, and writes them to the database in one transaction\n
+    once a set number of games have been completed or a set number of seconds have passed since the last write.\n
+    Writes are only made once a game has been completed - each write holds the search results of the completed games only,\n
+    so a game's search results and its LastUpdate date are always written in the same transaction.
+    '''
+    def __init__(self, database: DataBaseManager, maxGamesPerWrite: int, maxSecondsPerWrite: float):
+        '''
+        :param database: Database Manager the results are written to.
+        :type database: DataBaseManager
+        :param maxGamesPerWrite: Number of completed games that triggers a write.
+        :type maxGamesPerWrite: int
+        :param maxSecondsPerWrite: Number of seconds after which any waiting results are written.
+        :type maxSecondsPerWrite: float
+        '''
+        self.database = database
+
+        self.maxGamesPerWrite = max(1, maxGamesPerWrite)
+
+        self.maxSecondsPerWrite = max(0.0, maxSecondsPerWrite)
+
+        # Search results waiting to be written - (Game, brand)
+        self.__brand_updates: list[tuple] = []
+
+        # Titles of the completed games waiting for their LastUpdate date to be written
+        self.__completed_titles: list[str] = []
+
+        self.__last_write_time = time.monotonic()
+
+        # Number of writes that were saved to the database, and the number that failed
+        self.writeCount = 0
+
+        self.failedWriteCount = 0
+
+    def add_search_result(self, game: Game, brand: str):
+        '''
+        Adds one brand's search result of a game to the write made once the game has been completed.
+        '''
+        self.__brand_updates.append((game, brand))
+
+    def add_completed_game(self, game: Game):
+        '''
+        Adds a game that every brand has finished searching for, so its LastUpdate date is set in the next write.
+        '''
+        self.__completed_titles.append(game.name)
+        self.write_if_due()
+
+    def write_if_due(self) -> bool:
+        '''
+        Writes the waiting results if enough games have been completed, or enough time has passed since the last write.\n
+        Nothing is written until at least one game has been completed. Returns True if a write was made.
+        '''
+        if not self.__completed_titles:
+            return False
+
+        if len(self.__completed_titles) >= self.maxGamesPerWrite or (time.monotonic() - self.__last_write_time) >= self.maxSecondsPerWrite:
+            self.write()
+            return True
+
+        return False
+
+    def write(self):
+        '''
+        Writes the results and LastUpdate dates of every completed game to the database in one transaction.\n
+        The results of the games still being searched for keep waiting for their game to be completed - 
+        any left once the search is over are never written, so those games are searched for again next time.\n
+        If the write fails the results are dropped - the games' LastUpdate dates are not set, so they are searched for again next time.
+        '''
+        if self.__completed_titles:
+            completedTitles = set(self.__completed_titles)
+            brandUpdates = [update for update in self.__brand_updates if update[0].name in completedTitles]
+
+            if self.database.write_game_updates(brandUpdates, self.__completed_titles):
+                print(f"Saved {len(brandUpdates)} search results and {len(self.__completed_titles)} completed games to the database.")
+                self.writeCount += 1
+            else:
+                print(f"Failed to save {len(brandUpdates)} search results and {len(self.__completed_titles)} completed games to the database.")
+                self.failedWriteCount += 1
+
+            self.__brand_updates = [update for update in self.__brand_updates if update[0].name not in completedTitles]
+            self.__completed_titles = []
+
+        self.__last_write_time = time.monotonic()
@@ -0,0 +1,252 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - search_pipeline.py
+# This class schedules the web hunters' searches across several games at once.
+# A game can be searched for on Steam while the next game is already being searched for on Wikipedia.
+# The pacing of each site is handled by the web hunters' shared rate limiter, which waits before every web request.
+# The worker processes only search - each search result is sent back to the main process, which saves it to the database.
+
+import queue
+from collections import deque
+from multiprocessing import get_context
+
+try:
+    from ClassContainers.GameData import Game # type: ignore ##
+
+    from ClassContainers.Options import UserSettings
+
+    from ClassContainers.RunStats import RunStats
+
+except ImportError as e:
+    print(e)
+    print("Missing Modules in search_pipeline.py.")
+
+try:
+    from web_hunters.webHunter import WebHunter
+except ImportError as e:
+    print(e)
+    print("Unable to import the WebHunter Parent Class")
+
+class SearchPipeline():
+    '''
+    Keeps several games in flight at once across the web hunters.\n
+    Each web hunter runs in its own long-lived worker process for the whole search run.\n
+    Each web hunter only searches for one game at a time, and the number of games in flight is limited by the user's settings.\n
+    A web hunter with a batch size over 1 is instead given groups of games, which it looks up together with its search_batch method.
+    '''
+    def __init__(self, web_hunters_list: list[WebHunter], settings: UserSettings, runStats: RunStats, on_search_complete, on_game_complete, on_idle = None):
+        '''
+        :param web_hunters_list: List of the Web Hunters to search with.
+        :type web_hunters_list: list[WebHunter]
+        :param settings: To get the maximum games in flight setting.
+        :type settings: UserSettings
+        :param runStats: Stats of the current search run.
+        :type runStats: RunStats
+        :param on_search_complete: Method called in the main process with the game and brand, once the game holds that brand's search results.
+        :param on_game_complete: Method called with the game once every web hunter has finished searching for it.
+        :param on_idle: Optional method called about once a second while waiting for the next search result.
+        '''
+        self.web_hunters_list = web_hunters_list
+
+        self.settings = settings
+
+        self.runStats = runStats
+
+        self.on_search_complete = on_search_complete
+
+        self.on_game_complete = on_game_complete
+
+        self.on_idle = on_idle
+
+    def run(self, gameList: list[Game]):
+        '''
+        Searches for every game in the game list on all of the web hunters' sites, and returns once every search is complete.\n
+        One long-lived worker process is started for each web hunter, and is fed games through its own task queue.
+
+        :param gameList: List of Game Objects.
+        :type gameList: list[Game]
+        '''
+        if not gameList or not self.web_hunters_list:
+            return
+
+        ctx = get_context("spawn")
+
+        maxGamesInFlight = max(1, self.settings.maxGamesInFlight)
+
+        # Queue the workers use to report back each finished search
+        resultQueue = ctx.Queue()
+
+        # Worker process and task queue for each site
+        workers = {web_hunter.brand: self.__start_worker(ctx, web_hunter, resultQueue) for web_hunter in self.web_hunters_list}
+
+        # Sites whose web hunter searches for a group of games at once with its search_batch method
+        batchBrands = {web_hunter.brand for web_hunter in self.web_hunters_list if web_hunter.batch_size > 1}
+
+        gamesByName = {game.name: game for game in gameList}
+
+        # Games waiting to be searched for on each site
+        pendingGames = {web_hunter.brand: deque(gameList) for web_hunter in self.web_hunters_list}
+
+        # The games currently being searched for on each site - or an empty list if the site is free
+        runningGames = {web_hunter.brand: [] for web_hunter in self.web_hunters_list}
+
+        # Number of sites each game is still waiting on
+        sitesRemaining = {game.name: len(self.web_hunters_list) for game in gameList}
+
+        # Number of sites that search for one game at a time each game is still waiting on.
+        # Only these searches count towards the games in flight, so a game waiting on a batch does not hold up the other sites.
+        singleSitesRemaining = {game.name: len(self.web_hunters_list) - len(batchBrands) for game in gameList}
+
+        gamesInFlight = set()
+
+        try:
+            while any(pendingGames.values()) or any(runningGames.values()):
+
+                self.__start_ready_searches(workers, pendingGames, runningGames, batchBrands, gamesInFlight, maxGamesInFlight)
+
+                # Wait until a search finishes 
+                try:
+                    gameName, brand, counters, brandData = resultQueue.get(timeout=1.0)
+                    self.runStats.merge(counters)
+                    finishedSearches = [(gameName, brand, brandData)]
+                except queue.Empty:
+                    finishedSearches = self.__restart_dead_workers(ctx, workers, runningGames, resultQueue)
+                    if self.on_idle:
+                        self.on_idle()
+
+                for gameName, brand, brandData in finishedSearches:
+                    if not any(game.name == gameName for game in runningGames[brand]):
+                        continue
+
+                    runningGames[brand] = [game for game in runningGames[brand] if game.name != gameName]
+                    game = gamesByName[gameName]
+
+                    # Copy the worker's search results into the main process's Game Object - a lost search has no results
+                    if brandData is not None:
+                        game.set_brand_data(brand, brandData)
+                        self.on_search_complete(game, brand)
+
+                    if brand not in batchBrands:
+                        singleSitesRemaining[gameName] -= 1
+                        if singleSitesRemaining[gameName] == 0:
+                            gamesInFlight.discard(gameName)
+
+                    sitesRemaining[gameName] -= 1
+                    if sitesRemaining[gameName] == 0:
+                        gamesInFlight.discard(gameName)
+                        self.runStats.title_completed()
+                        self.on_game_complete(game)
+                        print(f"Titles completed per minute: {self.runStats.get_titles_per_minute():.2f}")
+        finally:
+            self.__stop_workers(workers)
+
+    def __start_worker(self, ctx, web_hunter: WebHunter, resultQueue):
+        '''
+        Starts a long-lived worker process for a web hunter and returns the process and its task queue.
+        '''
+        taskQueue = ctx.Queue()
+
+        processSub = ctx.Process(target=hunter_worker, args=(web_hunter, taskQueue, resultQueue), daemon=True)
+        processSub.start()
+
+        return processSub, taskQueue
+
+    def __stop_workers(self, workers:dict):
+        '''
+        Tells every worker process to finish, and waits for them to close.
+        '''
+        for processSub, taskQueue in workers.values():
+            if processSub.is_alive():
+                taskQueue.put(None)
+
+        for processSub, taskQueue in workers.values():
+            processSub.join(timeout=30)
+            if processSub.is_alive():
+                processSub.terminate()
+
+    def __restart_dead_workers(self, ctx, workers:dict, runningGames:dict, resultQueue) -> list[tuple]:
+        '''
+        Restarts any worker process that has stopped unexpectedly.\n
+        Returns the game name, brand and empty search results of each search that was lost, so the search is counted as finished.
+        '''
+        lostSearches = []
+
+        for web_hunter in self.web_hunters_list:
+            brand = web_hunter.brand
+            processSub, taskQueue = workers[brand]
+
+            if not processSub.is_alive():
+                print(f"The {brand} worker process stopped unexpectedly. Starting a new one.")
+                workers[brand] = self.__start_worker(ctx, web_hunter, resultQueue)
+
+                for game in runningGames[brand]:
+                    lostSearches.append((game.name, brand, None))
+
+        return lostSearches
+
+    def __start_ready_searches(self, workers:dict, pendingGames:dict, runningGames:dict, batchBrands:set, gamesInFlight:set, maxGamesInFlight:int):
+        '''
+        Starts a search on every site that is free.\n
+        Sites that search for one game at a time only start a game as long as the number of games in flight stays under the limit,\n
+        and sites that search in batches are given the next group of games waiting on them.
+        '''
+        for web_hunter in self.web_hunters_list:
+            brand = web_hunter.brand
+
+            if runningGames[brand] or not pendingGames[brand]:
+                continue
+
+            if brand in batchBrands:
+                batch = [pendingGames[brand].popleft() for i in range(min(web_hunter.batch_size, len(pendingGames[brand])))]
+
+                workers[brand][1].put(batch)
+                runningGames[brand] = batch
+                continue
+
+            game = pendingGames[brand][0]
+
+            if game.name not in gamesInFlight and len(gamesInFlight) >= maxGamesInFlight:
+                continue
+
+            pendingGames[brand].popleft()
+            gamesInFlight.add(game.name)
+
+            workers[brand][1].put(game)
+            runningGames[brand] = [game]
+
+
+def hunter_worker(web_hunter: WebHunter, taskQueue, resultQueue):
+    '''
+    Process Method: Long-lived worker that searches for each game put on its task queue with one web hunter,\n
+    until it is given None. Each finished search is reported back on the result queue with the game's data for the web hunter's brand,\n
+    along with the web hunter's counters. The worker never writes to the database.\n
+    A list of games is searched for at once with the web hunter's search_batch method, and each game is then reported on its own.
+
+    :param web_hunter: Web Hunter used for every search in this worker.
+    :type web_hunter: WebHunter
+    '''
+    while True:
+        task = taskQueue.get()
+
+        if task is None:
+            web_hunter.close()
+            break
+
+        if isinstance(task, list):
+            try:
+                web_hunter.search_batch(task)
+            except Exception as e:
+                print(e)
+                print(f"The {web_hunter.brand} batch search failed.")
+
+            for game in task:
+                resultQueue.put((game.name, web_hunter.brand, web_hunter.runStats.pop_counters(), game.get_brand_data(web_hunter.brand)))
+            continue
+
+        game = task
+
+        try:
+            web_hunter.search(game)
+        except Exception as e:
+            print(e)
+            print(f"The {web_hunter.brand} search failed for {game.name}.")
+
+        resultQueue.put((game.name, web_hunter.brand, web_hunter.runStats.pop_counters(), game.get_brand_data(web_hunter.brand)))
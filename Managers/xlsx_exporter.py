@@ -1,7 +1,6 @@
 from pathlib import Path
 from openpyxl import Workbook
 from openpyxl.utils import column_index_from_string
-import time 
 import datetime
 
 try:      
@@ -57,6 +56,12 @@ class XlsxExporter():
                               'Wikipedia: Extra Info': 'AJ1'
                         }
 
+      # Column number of each column key - found once instead of for every cell
+      self.__column_numbers = {key : column_index_from_string(cell.rstrip('0123456789')) for key, cell in self.colum_key_dict.items()}
+
+      # Column keys in the order of the spreadsheet's columns
+      self.__column_keys = sorted(self.colum_key_dict.keys(), key=lambda key: self.__column_numbers[key])
+
    def export_database_games(self, gameList: list[Game], settings:UserSettings, database:DataBaseManager):
       '''
       Export a list of game's data to a XLSX file. 
@@ -75,35 +80,16 @@ class XlsxExporter():
          # Complete path to the location of the xlsx spreadsheet
          pathToExampleXLSX = Path(settings.export_xlsx_file_path, xlsxGameSheet)
 
-         # Game Titles Starting Row Integar 
-         row_two_start_int = 2 
-
-         # Create a new xlsx spreadsheet 
-         wb = Workbook()
-         
-         # Get the active workbook worksheet
-         ws = wb.active
-         ws.title = settings.xlsx_worksheet_title
-      
-         # Need to create the first row
-         ws = self.__fill_first_row(ws) 
+         # Every game's row is streamed from the database in batches, in the spreadsheet's column order
+         gameRows = database.iter_game_rows([game.name for game in gameList], self.__column_keys, fetchSize=settings.exportFetchSize)
 
-         # Starting position for the rows
-         numY = 0
-         for game in gameList: 
-            currentRowNum = numY + row_two_start_int 
-
-            ws = self.__updateSheetRow(ws, currentRowNum, game, database)
-
-            numY += 1 # Add to the row number to increase it by one for next game title
-         
-         # Add a time delay to allow time for the sheet to be updated and saved.
-         time.sleep(1)
+         if settings.xlsxStreamingExport:
+            wb = self.__create_streaming_workbook(settings.xlsx_worksheet_title, gameRows)
+         else:
+            wb = self.__create_workbook(settings.xlsx_worksheet_title, gameRows)
 
          wb.save(pathToExampleXLSX)
 
-         time.sleep(2)
-
          return True 
 
       except Exception as e:
@@ -112,20 +98,65 @@ class XlsxExporter():
          print(pathToExampleXLSX)
          return False
 
-   def __updateSheetRow(self, ws, currentRowNum: int, game: Game, database:DataBaseManager): 
+   def __create_streaming_workbook(self, worksheetTitle: str, gameRows) -> Workbook:
+      '''
+      Creates a write-only workbook and appends the header and every game row to it.\n
+      A write-only worksheet writes each row to a temporary file as it is appended, so the memory used stays flat however many games are exported.
+       
+      :param worksheetTitle: Title of the worksheet.
+      :type worksheetTitle: str
+      :param gameRows: Game rows from the database, in the spreadsheet's column order.
+      '''
+      wb = Workbook(write_only=True)
+      ws = wb.create_sheet(title=worksheetTitle)
+
+      ws.append(self.__column_keys)
+
+      for gameRow in gameRows:
+         ws.append(list(gameRow))
+
+      return wb
+
+   def __create_workbook(self, worksheetTitle: str, gameRows) -> Workbook:
       '''
-      Updates a Sheet Row based on a current row number utilizing a game object's data and the database.
+      Creates a normal workbook and fills in the header and every game row cell by cell.
+       
+      :param worksheetTitle: Title of the worksheet.
+      :type worksheetTitle: str
+      :param gameRows: Game rows from the database, in the spreadsheet's column order.
+      '''
+      # Game Titles Starting Row Integar 
+      row_two_start_int = 2 
+
+      # Create a new xlsx spreadsheet 
+      wb = Workbook()
+      
+      # Get the active workbook worksheet
+      ws = wb.active
+      ws.title = worksheetTitle
+   
+      # Need to create the first row
+      ws = self.__fill_first_row(ws) 
+
+      for currentRowNum, gameRow in enumerate(gameRows, start=row_two_start_int): 
+         ws = self.__updateSheetRow(ws, currentRowNum, self.__column_keys, gameRow)
+
+      return wb
+
+   def __updateSheetRow(self, ws, currentRowNum: int, columnKeys: list[str], gameRow: tuple): 
+      '''
+      Updates a Sheet Row based on a current row number utilizing a game's row from the database.
        
       :param ws: Workbook sheet
       :param currentRowNum: Number of Row.
       :type currentRowNum: int
-      :param game: Game Object
-      :type game: Game
-      :param database: To access database.
-      :type database: DataBaseManager
+      :param columnKeys: Column keys in the same order as the game row's values.
+      :type columnKeys: list[str]
+      :param gameRow: Game's row from the database.
+      :type gameRow: tuple
       '''
-      for key in self.colum_key_dict.keys():
-         ws = self.__updateColumnValue(ws, key, currentRowNum, database.get_data_from_table_by_column(key, game.name)) 
+      for key, value in zip(columnKeys, gameRow):
+         ws = self.__updateColumnValue(ws, key, currentRowNum, value) 
 
       return ws
 
@@ -139,13 +170,9 @@ class XlsxExporter():
       :param currentRow: Number of Row.
       :param newValue: Value to put into the cell.
       '''
-      columnLetter = (self.colum_key_dict[key]).split('1')[0]
-
-      columnNumToUse = column_index_from_string(columnLetter)
-
       # Add the information to the correct column and row
       ws.cell(row=currentRow, 
-               column=columnNumToUse, 
+               column=self.__column_numbers[key], 
                value=newValue)  
       return ws
 
@@ -15,6 +15,8 @@ except ImportError as e:
 try:         
     from Managers.xlsx_exporter import XlsxExporter
 
+    from Managers.data_exporters import DATA_EXPORTERS
+
     from Managers.GameSearchManager import GameSearchManager
 
     from GUI.GameSearchGUI import GameGUI 
@@ -41,12 +43,30 @@ def main():
 
             gameObjectsList, database = gameSearcher.start_search()
 
-            xlsxExporter = XlsxExporter()
+            exportFormats = [exportFormat.strip().lower() for exportFormat in userSettings.exportFormats.split(",") if exportFormat.strip()]
 
             if gameObjectsList and database:
-                if xlsxExporter.export_database_games(gameObjectsList, userSettings, database):    
-                    print("Xlsx File Created.\nSpread Sheet produced and saved to the following folder:")
-                    print(pathToMainFolder) 
+                if "xlsx" in exportFormats:
+                    xlsxExporter = XlsxExporter()
+
+                    if xlsxExporter.export_database_games(gameObjectsList, userSettings, database):    
+                        print("Xlsx File Created.\nSpread Sheet produced and saved to the following folder:")
+                        print(pathToMainFolder) 
+
+                # CSV, JSON Lines and Parquet files for other programs to read - 
+                # either the searched games, or every game changed since that format's last export
+                for exportFormat in exportFormats:
+                    if exportFormat in DATA_EXPORTERS:
+                        if userSettings.exportIncremental:
+                            DATA_EXPORTERS[exportFormat]().export_changed_games(userSettings, database)
+                        else:
+                            DATA_EXPORTERS[exportFormat]().export_database_games(gameObjectsList, userSettings, database)
+                    elif exportFormat != "xlsx":
+                        print(f"Unknown export format: {exportFormat}")
+
+            # Close the main process's connection to the database now that the spreadsheet has been exported 
+            if database:
+                database.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,94 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - test_data_exporters.py
+# Tests of the exports - the watermark must only move past the rows that were written to the file, and a failed export must not leave a file behind.
+# Usage (from the main folder): python -m unittest discover tests
+
+import os, sqlite3, tempfile, types, unittest
+
+from Managers.database_manager import DataBaseManager
+from Managers.data_exporters import CsvExporter
+
+
+class FailingConnection():
+    '''Wraps a database connection so every changed-rows query after the first one fails.'''
+    def __init__(self, connection:sqlite3.Connection, counter:dict):
+        self.__connection = connection
+        self.__counter = counter
+
+    def execute(self, sql_command:str, parameters=()):
+        if "ChangeSeq > ?" in sql_command:
+            self.__counter['queries'] += 1
+            if self.__counter['queries'] > 1:
+                raise sqlite3.OperationalError("disk I/O error")
+        return self.__connection.execute(sql_command, parameters)
+
+    def __getattr__(self, name:str):
+        return getattr(self.__connection, name)
+
+
+class FailingDatabase():
+    '''Stands in for the DataBaseManager - the game rows fail after the first row is read.'''
+    def __init__(self):
+        self.spreadsheet_to_database_dict = {'Game Title' : 'Title'}
+
+    def iter_game_rows(self, gameKeys, columns, fetchSize=1000):
+        yield ("Game 0",)
+        raise sqlite3.OperationalError("disk I/O error")
+
+
+class IncrementalExportTests(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.database = DataBaseManager(path_to_folder=self.folder.name, database_name="test", table_name="games")
+        self.database.start()
+        self.database.insert_game_list([f"Game {gameNum}" for gameNum in range(10)])
+
+        # Two rows per query, so the export needs several queries
+        self.settings = types.SimpleNamespace(xlsx_filename="Test", export_xlsx_file_path=self.folder.name, exportFetchSize=2)
+
+    def tearDown(self):
+        self.database.close()
+        self.folder.cleanup()
+
+    def test_export_moves_watermark_to_last_change(self):
+        self.assertTrue(CsvExporter().export_changed_games(self.settings, self.database))
+
+        self.assertEqual(self.database.get_export_watermark("csv"), self.database.get_last_change_seq())
+        self.assertEqual(self.exported_files(), [f"Test - Changes 1-{self.database.get_last_change_seq()}.csv"])
+
+    def test_failed_query_mid_stream_keeps_watermark(self):
+        counter = {'queries' : 0}
+        get_connection = self.database.get_connection
+        self.database.get_connection = lambda: FailingConnection(get_connection(), counter)
+
+        exported = CsvExporter().export_changed_games(self.settings, self.database)
+
+        self.database.get_connection = get_connection
+
+        self.assertFalse(exported)
+        self.assertGreater(counter['queries'], 1)
+        self.assertEqual(self.database.get_export_watermark("csv"), 0)
+        self.assertEqual(self.exported_files(), [])
+
+        # The next export writes every change, including the ones the failed export did not
+        self.assertTrue(CsvExporter().export_changed_games(self.settings, self.database))
+        self.assertEqual(self.database.get_export_watermark("csv"), self.database.get_last_change_seq())
+
+    def test_failed_watermark_fails_export(self):
+        self.database.get_connection().execute(f"DROP TABLE {self.database.export_watermarks_table_name}")
+
+        self.assertFalse(CsvExporter().export_changed_games(self.settings, self.database))
+        self.assertEqual(self.exported_files(), [])
+
+    def test_failed_database_export_leaves_no_file(self):
+        exported = CsvExporter().export_database_games([types.SimpleNamespace(name="Game 0")], self.settings, FailingDatabase())
+
+        self.assertFalse(exported)
+        self.assertEqual(self.exported_files(), [])
+
+    def exported_files(self) -> list[str]:
+        '''Returns the names of the files in the export folder, other than the database's files.'''
+        return [fileName for fileName in os.listdir(self.folder.name) if not fileName.startswith("test.")]
+
+
+if __name__ == '__main__':
+    unittest.main()
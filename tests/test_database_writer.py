@@ -0,0 +1,74 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - test_database_writer.py
+# Tests of the write-behind buffer - a game's results and LastUpdate date are written together, and only the writes saved to the database are counted.
+# Usage (from the main folder): python -m unittest discover tests
+
+import unittest
+
+from ClassContainers.GameData import Game
+from Managers.database_writer import DatabaseWriter
+
+
+class FakeDatabase():
+    '''Stands in for the DataBaseManager - each write is recorded and returns the next of the given results.'''
+    def __init__(self, writeResults:list[bool]):
+        self.writeResults = list(writeResults)
+
+        # Each write's (game title, brand) results and completed titles
+        self.writes = []
+
+    def write_game_updates(self, brandUpdates:list[tuple], completedTitles:list[str]) -> bool:
+        self.writes.append(([(game.name, brand) for game, brand in brandUpdates], list(completedTitles)))
+        return self.writeResults.pop(0)
+
+
+class DatabaseWriterTests(unittest.TestCase):
+    def test_only_saved_writes_are_counted(self):
+        writer = DatabaseWriter(FakeDatabase([True, False, True]), maxGamesPerWrite=1, maxSecondsPerWrite=60)
+
+        for gameNum in range(3):
+            writer.add_completed_game(Game(f"Game {gameNum}"))
+
+        self.assertEqual(writer.writeCount, 2)
+        self.assertEqual(writer.failedWriteCount, 1)
+
+    def test_game_results_and_last_update_are_written_together(self):
+        database = FakeDatabase([True, True])
+        # Every check of the timer is due
+        writer = DatabaseWriter(database, maxGamesPerWrite=25, maxSecondsPerWrite=0)
+        gameA, gameB = Game("Game A"), Game("Game B")
+
+        writer.add_search_result(gameA, "Steam")
+        writer.add_search_result(gameB, "Steam")
+        self.assertFalse(writer.write_if_due())
+
+        writer.add_search_result(gameA, "Wikipedia")
+        writer.add_completed_game(gameA)
+
+        writer.add_search_result(gameB, "Wikipedia")
+        self.assertFalse(writer.write_if_due())
+        writer.add_completed_game(gameB)
+
+        self.assertEqual(database.writes, [([("Game A", "Steam"), ("Game A", "Wikipedia")], ["Game A"]),
+                                           ([("Game B", "Steam"), ("Game B", "Wikipedia")], ["Game B"])])
+
+    def test_results_of_games_not_completed_are_not_written(self):
+        database = FakeDatabase([True])
+        writer = DatabaseWriter(database, maxGamesPerWrite=25, maxSecondsPerWrite=60)
+
+        writer.add_search_result(Game("Game A"), "Steam")
+        writer.add_completed_game(Game("Game B"))
+        writer.write()
+
+        self.assertEqual(database.writes, [([], ["Game B"])])
+
+    def test_nothing_waiting_is_not_a_write(self):
+        writer = DatabaseWriter(FakeDatabase([]), maxGamesPerWrite=1, maxSecondsPerWrite=60)
+
+        writer.write()
+
+        self.assertEqual(writer.writeCount, 0)
+        self.assertEqual(writer.failedWriteCount, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
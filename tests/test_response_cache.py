@@ -0,0 +1,80 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - test_response_cache.py
+# Tests of the response cache - a page the website reports as unchanged (304) is not downloaded or parsed again.
+# The web requests are answered with the fixtures - no web requests are made.
+# Usage (from the main folder): python -m unittest discover tests
+
+import tempfile, unittest
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ClassContainers.GameData import Game
+from web_hunters.response_cache import ResponseCache
+from web_hunters.steam_web_hunter import SteamHunter
+
+FIXTURES_FOLDER = Path(__file__).parent / "fixtures"
+
+
+def create_response(url:str, statusCode:int, fileName:str = "") -> requests.Response:
+    '''Creates a requests Response of a fixture, with an ETag so the cache can revalidate it.'''
+    response = requests.Response()
+    response.status_code = statusCode
+    response.url = url
+    response.encoding = 'utf-8'
+    response.headers = CaseInsensitiveDict({'ETag' : f'"{fileName or url}"'})
+    response._content = (FIXTURES_FOLDER / fileName).read_bytes() if fileName else b""
+    return response
+
+
+class UnchangedPageTests(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+
+        self.hunter = SteamHunter({})
+        self.hunter.use_json_api = False
+        # Every cached page is revalidated with a conditional request
+        self.hunter.set_response_cache(ResponseCache(self.folder.name, {}, 0))
+
+        # Set to True when the store page has changed since it was cached
+        self.storePageChanged = False
+        self.hunter._WebHunter__session_get = self.fake_session_get
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def fake_session_get(self, url:str, headers:dict|None = None, cookies:dict|None = None) -> requests.Response:
+        '''Answers with 304 Not Modified when the request carries the page's ETag and the page is unchanged, otherwise with the page.'''
+        isStorePage = "store.steampowered.com/app/" in url
+        fileName = "steam_store_page_367520.html" if isStorePage else "steam_search_page_hollow_knight.html"
+        if headers and headers.get('If-None-Match') == f'"{fileName}"' and not (isStorePage and self.storePageChanged):
+            return create_response(url, 304)
+        return create_response(url, 200, fileName)
+
+    def test_unchanged_store_page_is_not_parsed_again(self):
+        firstGame = Game("Hollow Knight")
+        self.hunter.search(firstGame)
+
+        secondGame = Game("Hollow Knight")
+        self.hunter.search(secondGame)
+
+        counters = self.hunter.runStats.counters
+        self.assertEqual(counters.get("HTTP Cache Revalidated (304)"), 2)
+        self.assertEqual(counters.get("HTTP Cache Pages Not Parsed"), 1)
+        self.assertTrue(secondGame.steam_data.found_data)
+        self.assertEqual(vars(secondGame.steam_data), vars(firstGame.steam_data))
+
+    def test_changed_store_page_is_parsed(self):
+        self.hunter.search(Game("Hollow Knight"))
+
+        self.storePageChanged = True
+        game = Game("Hollow Knight")
+        self.hunter.search(game)
+
+        self.assertIsNone(self.hunter.runStats.counters.get("HTTP Cache Pages Not Parsed"))
+        self.assertTrue(game.steam_data.found_data)
+        self.assertEqual(game.steam_data.allReviewsScore, 97)
+
+
+if __name__ == '__main__':
+    unittest.main()
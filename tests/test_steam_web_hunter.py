@@ -0,0 +1,177 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - test_steam_web_hunter.py
+# Tests of the Steam Hunter's JSON and store page paths - the search page, appdetails and appreviews responses and the store page are read from the fixtures folder.
+# The fixtures are written in the format of Steam's responses - no web requests are made.
+# Usage (from the main folder): python -m unittest discover tests
+
+import json, unittest
+from pathlib import Path
+
+from ClassContainers.GameData import Game
+from web_hunters.steam_web_hunter import SteamHunter
+
+FIXTURES_FOLDER = Path(__file__).parent / "fixtures"
+
+
+def read_fixture(fileName:str) -> str:
+    with open(FIXTURES_FOLDER / fileName, mode='r', encoding='utf-8') as file:
+        return file.read()
+
+
+class FakeResponse():
+    '''Stands in for a requests Response holding the text of a fixture.'''
+    def __init__(self, text:str, url:str = ""):
+        self.text = text
+        self.url = url
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class SteamJsonTests(unittest.TestCase):
+    def setUp(self):
+        self.hunter = SteamHunter({})
+        self.game = Game("Hollow Knight")
+
+    def test_get_app_id_from_url(self):
+        self.assertEqual(self.hunter.get_app_id_from_url("https://store.steampowered.com/app/367520/Hollow_Knight/"), "367520")
+        self.assertEqual(self.hunter.get_app_id_from_url("https://store.steampowered.com/app/1145360"), "1145360")
+        self.assertEqual(self.hunter.get_app_id_from_url("https://store.steampowered.com/search?term=Hollow+Knight"), "")
+        self.assertEqual(self.hunter.get_app_id_from_url(""), "")
+
+    def test_set_steam_data_from_json(self):
+        appdetails = json.loads(read_fixture("steam_appdetails_367520.json"))
+        appreviews = json.loads(read_fixture("steam_appreviews_367520.json"))
+
+        self.assertTrue(self.hunter.set_steam_data_from_json(self.game, "367520", appdetails, appreviews))
+
+        steam_data = self.game.steam_data
+        self.assertTrue(steam_data.found_data)
+        self.assertEqual(steam_data.title_on_steam, "Hollow Knight")
+        self.assertEqual(steam_data.releaseDate, "24 Feb, 2017")
+        self.assertEqual(steam_data.imageURL, "https://shared.akamai.steamstatic.com/store_item_assets/steam/apps/367520/header.jpg")
+        self.assertEqual(steam_data.allReviewsScore, 97)
+        self.assertEqual(steam_data.allReviewsText, "Overwhelmingly Positive")
+        self.assertEqual(steam_data.allReviewsData, "97% of the 297,970 user reviews for this game are positive.")
+
+    def test_set_steam_data_from_json_without_reviews(self):
+        appdetails = json.loads(read_fixture("steam_appdetails_367520.json"))
+        appreviews = json.loads(read_fixture("steam_appreviews_no_reviews.json"))
+
+        self.assertTrue(self.hunter.set_steam_data_from_json(self.game, "367520", appdetails, appreviews))
+
+        self.assertEqual(self.game.steam_data.allReviewsScore, 0)
+        self.assertEqual(self.game.steam_data.allReviewsText, "No user review")
+        self.assertEqual(self.game.steam_data.allReviewsData, "No user review")
+
+    def test_set_steam_data_from_failed_json(self):
+        appdetails = json.loads(read_fixture("steam_appdetails_failed.json"))
+        appreviews = json.loads(read_fixture("steam_appreviews_367520.json"))
+
+        self.assertFalse(self.hunter.set_steam_data_from_json(self.game, "367520", appdetails, appreviews))
+        self.assertFalse(self.game.steam_data.found_data)
+
+    def search_with_fixtures(self) -> list[str]:
+        '''Searches for the game with every Steam request answered by a fixture, and returns the requested urls.'''
+        responses = {"store.steampowered.com/search" : "steam_search_page_hollow_knight.html",
+                     "store.steampowered.com/api/appdetails" : "steam_appdetails_367520.json",
+                     "store.steampowered.com/appreviews/" : "steam_appreviews_367520.json",
+                     "store.steampowered.com/app/367520" : "steam_store_page_367520.html"}
+        requestedUrls = []
+
+        def fake_reponse(url:str, **kwargs):
+            requestedUrls.append(url)
+            for urlPart, fileName in responses.items():
+                if urlPart in url:
+                    return FakeResponse(read_fixture(fileName))
+            return None
+
+        self.hunter.reponse = fake_reponse
+        self.hunter.search(self.game)
+        return requestedUrls
+
+    def test_json_search_does_not_request_store_page(self):
+        requestedUrls = self.search_with_fixtures()
+
+        steam_data = self.game.steam_data
+        self.assertEqual(steam_data.url, "https://store.steampowered.com/app/367520/Hollow_Knight/")
+        self.assertTrue(steam_data.found_data)
+        self.assertEqual(steam_data.allReviewsScore, 97)
+        self.assertEqual(self.hunter.runStats.counters.get("Steam Store Page - JSON API"), 1)
+
+        self.assertEqual(len(requestedUrls), 3)
+        self.assertFalse([url for url in requestedUrls if "store.steampowered.com/app/" in url])
+
+        # The JSON endpoints have no recent reviews
+        self.assertEqual(steam_data.recentReviewsText, "No user review")
+        self.assertEqual(steam_data.recentReviewsData, "No user review")
+        self.assertEqual(steam_data.recentReviewsScore, 0)
+
+    def test_recent_reviews_search_reads_only_store_page(self):
+        self.hunter.read_recent_reviews = True
+
+        requestedUrls = self.search_with_fixtures()
+
+        self.assertFalse([url for url in requestedUrls if "appdetails" in url or "appreviews" in url])
+
+        steam_data = self.game.steam_data
+        self.assertTrue(steam_data.found_data)
+        self.assertEqual(steam_data.allReviewsScore, 97)
+        self.assertEqual(steam_data.recentReviewsText, "Overwhelmingly Positive")
+        self.assertEqual(steam_data.recentReviewsData, "96% of the 4,123 user reviews in the last 30 days are positive.")
+        self.assertEqual(steam_data.recentReviewsScore, 96)
+        self.assertIsNone(self.hunter.runStats.counters.get("Steam Store Page - JSON API"))
+
+
+class SteamAgeCheckTests(unittest.TestCase):
+    def setUp(self):
+        self.hunter = SteamHunter({})
+        self.hunter.use_json_api = False
+
+        # Games read with Selenium instead of the store page's HTML
+        self.seleniumGames = []
+        self.hunter._SteamHunter__use_selenium_method = self.seleniumGames.append
+
+    def search_store_page(self, gameName:str, searchFixture:str, storeFixture:str, storeUrl:str) -> dict:
+        '''Searches for the game with the search page and store page answered by fixtures, and returns the hunter's counters.'''
+        def fake_reponse(url:str, **kwargs):
+            if "store.steampowered.com/search" in url:
+                return FakeResponse(read_fixture(searchFixture))
+            return FakeResponse(read_fixture(storeFixture), url=storeUrl)
+
+        self.game = Game(gameName)
+        self.hunter.reponse = fake_reponse
+        self.hunter.search(self.game)
+        return self.hunter.runStats.counters
+
+    def test_store_page_without_mature_content_is_not_counted(self):
+        counters = self.search_store_page("Hollow Knight", "steam_search_page_hollow_knight.html", "steam_store_page_367520.html",
+                                          "https://store.steampowered.com/app/367520/Hollow_Knight/")
+
+        self.assertTrue(self.game.steam_data.found_data)
+        self.assertEqual(counters.get("Steam Store Page - Requests"), 1)
+        self.assertIsNone(counters.get("Steam Store Page - Age Check Cookies"))
+        self.assertIsNone(counters.get("Steam Store Page - Age Check Cookies Failed"))
+        self.assertEqual(self.seleniumGames, [])
+
+    def test_mature_store_page_read_with_cookies_is_counted(self):
+        counters = self.search_store_page("DOOM Eternal", "steam_search_page_doom_eternal.html", "steam_store_page_782330.html",
+                                          "https://store.steampowered.com/app/782330/DOOM_Eternal/")
+
+        self.assertTrue(self.game.steam_data.found_data)
+        self.assertEqual(self.game.steam_data.releaseDate, "19 Mar, 2020")
+        self.assertEqual(counters.get("Steam Store Page - Requests"), 1)
+        self.assertEqual(counters.get("Steam Store Page - Age Check Cookies"), 1)
+        self.assertEqual(self.seleniumGames, [])
+
+    def test_age_check_page_falls_back_to_selenium(self):
+        counters = self.search_store_page("DOOM Eternal", "steam_search_page_doom_eternal.html", "steam_age_check_page_782330.html",
+                                          "https://store.steampowered.com/agecheck/app/782330/")
+
+        self.assertEqual(counters.get("Steam Store Page - Age Check Cookies Failed"), 1)
+        self.assertIsNone(counters.get("Steam Store Page - Requests"))
+        self.assertIsNone(counters.get("Steam Store Page - Age Check Cookies"))
+        self.assertEqual(self.seleniumGames, [self.game])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - browser_pool.py
+# Pool of warm Selenium browsers that are reused across games by a Web Hunter, instead of starting a new Firefox for every page.
+
+class BrowserPool():
+    '''
+    Keeps Selenium web drivers open between uses, so each Web Hunter only pays for starting Firefox once.\n
+    A web driver is closed and replaced once it has loaded a set number of pages,\n
+    and its cookies and storage are cleared every time it is returned to the pool.
+    '''
+    def __init__(self, create_browser_function, poolSize:int, maxPageLoads:int):
+        '''
+        :param create_browser_function: Method that starts and returns a new web driver.
+        :param poolSize: Maximum number of idle web drivers kept open.
+        :type poolSize: int
+        :param maxPageLoads: Number of page loads a web driver can make before it is closed and replaced.
+        :type maxPageLoads: int
+        '''
+        self.__create_browser = create_browser_function
+
+        self.poolSize = max(1, poolSize)
+
+        self.maxPageLoads = max(1, maxPageLoads)
+
+        self.__idle_browsers = []
+
+        # Number of page loads made by each web driver - keyed by the web driver's id
+        self.__page_loads: dict[int, int] = {}
+
+    def acquire(self):
+        '''
+        Returns an idle web driver from the pool, or starts a new one if the pool is empty.
+        '''
+        if self.__idle_browsers:
+            return self.__idle_browsers.pop()
+
+        wd = self.__create_browser()
+        self.__page_loads[id(wd)] = 0
+        return wd
+
+    def record_page_load(self, wd):
+        '''Adds one to the number of page loads made by the web driver.'''
+        self.__page_loads[id(wd)] = self.__page_loads.get(id(wd), 0) + 1
+
+    def release(self, wd):
+        '''
+        Returns a web driver to the pool after clearing its cookies and storage.\n
+        The web driver is closed instead if it has reached its page load limit, the pool is full, or it can't be cleared.
+        '''
+        if self.__page_loads.get(id(wd), 0) >= self.maxPageLoads or len(self.__idle_browsers) >= self.poolSize:
+            self.__quit(wd)
+            return
+
+        if self.__clear_browser_state(wd):
+            self.__idle_browsers.append(wd)
+        else:
+            self.__quit(wd)
+
+    def discard(self, wd):
+        '''Closes a web driver that is no longer usable - such as one whose page load failed - instead of returning it to the pool.'''
+        self.__quit(wd)
+
+    def close(self):
+        '''Closes every idle web driver in the pool.'''
+        while self.__idle_browsers:
+            self.__quit(self.__idle_browsers.pop())
+
+    def __clear_browser_state(self, wd) -> bool:
+        '''
+        Clears the cookies, local storage and session storage of the web driver and loads a blank page.\n
+        Returns False if the web driver is no longer working.
+        '''
+        try:
+            wd.delete_all_cookies()
+            wd.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            # Pages such as 'about:blank' do not have any storage to clear
+            pass
+
+        try:
+            # Clears the cookies of every website, not only the website currently loaded.
+            # This needs Firefox's system access, so it is skipped when Firefox does not allow it.
+            with wd.context(wd.CONTEXT_CHROME):
+                wd.execute_script("Services.cookies.removeAll();")
+        except Exception:
+            pass
+
+        try:
+            wd.get("about:blank")
+            return True
+        except Exception as e:
+            print(e)
+            print("Unable to clear the browser - closing it instead of returning it to the browser pool.")
+            return False
+
+    def __quit(self, wd):
+        self.__page_loads.pop(id(wd), None)
+        try:
+            wd.quit()
+        except Exception as e:
+            print(e)
+            print("Unable to close the browser.")
@@ -1,6 +1,6 @@
 # Game Information Searcher - by Sebastian Muylle - Version 1.0 - opencritic_web_hunter.py
-import time
-from bs4 import BeautifulSoup 
+import time, re
+from urllib.parse import quote
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys  
@@ -19,6 +19,15 @@ except:
         print(e)
         print("Unable to import the WebHunter Parent Class")
 
+try: 
+    from web_hunters import page_parser
+except ImportError as e:
+    print(e)
+    print("Unable to import the page parser for the OpenCritic Web Hunter.")
+
+# Elements of an OpenCritic game page read by the OpenCritic Hunter - only these elements are built into the page's tree
+GAME_PAGE_STRAINER = page_parser.strain_by_tag(['h1', 'app-tier-display', 'app-game-scores-display'])
+
 #####################################
      
 
@@ -29,6 +38,8 @@ class OpenCriticHunter(WebHunter):
     def __init__(self, webHeaders:dict): 
         super().__init__(webHeaders) 
         self.brand = "OpenCritic"
+        # Determines whether the search uses OpenCritic's JSON search endpoint first, with Selenium only as the fallback
+        self.use_http_search = True
 
     def search(self, game: Game): 
         '''
@@ -38,14 +49,29 @@ class OpenCriticHunter(WebHunter):
         :param game: Game Object to contain OpenCritic Data
         :type game: Game
         '''
-        # Use Selenium to search for the game on the OpenCritic Website
-        game.open_c_data.url = self.__search_opencritic(game.name)  
+        game.open_c_data.url = ''
+
+        # First search for the game with OpenCritic's JSON search endpoint 
+        if self.use_http_search:
+            game.open_c_data.url = self.__search_opencritic_http(game.name)
+
+            if game.open_c_data.url:
+                self.runStats.increment("OpenCritic Search - HTTP")
+
+        # Otherwise use Selenium to search for the game on the OpenCritic Website
+        if not game.open_c_data.url:
+            if self.use_http_search:
+                self.runStats.increment("OpenCritic Search - Selenium Fallback")
+            else:
+                self.runStats.increment("OpenCritic Search - Selenium")
+            game.open_c_data.url = self.__search_opencritic(game.name)  
 
         # If we find a link, go ahead and use the response class to first attempt to get the information
         if game.open_c_data.url:
             res = self.reponse(game.open_c_data.url)
             if res:
-                self.__get_game_page_info(res, game)
+                # An unchanged game page from the response cache is not parsed again
+                self.read_page_data(res, game.open_c_data, lambda: self.__get_game_page_info(res, game))
         
         border_sep_symbol = "#" * 60
         print(f"{border_sep_symbol}") 
@@ -59,13 +85,51 @@ class OpenCriticHunter(WebHunter):
 
     #######################################################
     ### REQUEST SECTION ### 
+    def __search_opencritic_http(self, game_name:str) -> str:
+        '''
+        Utilizes the JSON search endpoint used by OpenCritic's own search box to find the game title\n
+        and return the url of that game title - without starting a browser.
+        
+        :param game_name: Game Title to search
+        '''
+        url = ''
+
+        search_url = "https://api.opencritic.com/api/meta/search?criteria="
+
+        search_response = self.reponse(search_url + quote(game_name))
+
+        if not search_response:
+            return url
+
+        try:
+            # example result - [{'id': 1548, 'name': 'Hades', 'dist': 0, 'relation': 'game'}, ...]
+            for result in search_response.json():
+                if result.get('relation') != 'game':
+                    continue
+
+                if self.check_title_match(str(result['name']), game_name):
+                    url = f"https://opencritic.com/game/{result['id']}/{self.__create_game_url_slug(result['name'])}"
+                    break
+
+        except Exception as e:
+            print(e)
+            print("OpenCritic - Failed to read the results of the JSON search endpoint.")
+
+        return url
+
+    def __create_game_url_slug(self, game_name:str) -> str:
+        '''
+        Creates the last part of an OpenCritic game url - 'The Legend of Zelda: Breath of the Wild' -> 'the-legend-of-zelda-breath-of-the-wild'
+        '''
+        return re.sub(r'[^a-z0-9]+', '-', game_name.lower()).strip('-')
+
     def __get_game_page_info(self, response, game: Game): 
         '''
         Uses the response to parse through the HTML and modifies the Game Object's OpenCritic attributes.
         '''
         web_html = response.text
 
-        soup = BeautifulSoup(web_html, 'html.parser')
+        soup = page_parser.parse_html(web_html, GAME_PAGE_STRAINER)
         try: 
             title_on_page_element = soup.find('h1', class_="my-2")
 
@@ -113,9 +177,7 @@ class OpenCriticHunter(WebHunter):
 
         search_url = "https://opencritic.com/search?criteria="
 
-        wd, wait = self.browser()
-
-        wd.get(search_url)
+        wd, wait = self.browser(search_url)
 
         try:
             elementSearchBox = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'input.ng-valid'))) 
@@ -144,7 +206,7 @@ class OpenCriticHunter(WebHunter):
             print("OpenCritic - Failed to find or search for the game using the search url.")
             
         finally:
-            wd.quit()
+            self.release_browser(wd)
             return url
     
     ## General Methods Used to Modify Data ## 
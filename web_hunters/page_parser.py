@@ -0,0 +1,72 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - page_parser.py
+# Builds the BeautifulSoup trees of the web pages downloaded by the web hunters.
+# lxml is used when it is installed, and each hunter can limit the tree to only the elements it reads with a SoupStrainer,
+# so the rest of the page - scripts, menus, footers and everything else - is never built into a tree.
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml builds trees several times faster than Python's html.parser - html.parser is only used if lxml is not installed
+try:
+    import lxml # type: ignore ##
+
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Determines whether the strainers are used - turning them off builds the whole page's tree, which the parser benchmark compares against
+STRAINERS_ENABLED = True
+
+
+def parse_html(html:str, strainer:SoupStrainer|None = None) -> BeautifulSoup:
+    '''
+    Returns the BeautifulSoup tree of a web page.\n
+    If a strainer is given, only the elements it matches - and everything inside them - are built into the tree.
+
+    :param html: HTML of the web page.
+    :type html: str
+    :param strainer: Strainer matching the elements the tree is limited to.
+    :type strainer: SoupStrainer | None
+    '''
+    if strainer is not None and STRAINERS_ENABLED:
+        return BeautifulSoup(html, HTML_PARSER, parse_only=strainer)
+
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def strain_by_class(classNames:list[str]) -> SoupStrainer:
+    '''
+    Returns a strainer matching the elements with any of the classes - 'infobox ib-video-game' matches 'ib-video-game'.
+
+    :param classNames: Class names to match.
+    :type classNames: list[str]
+    '''
+    classNames = set(classNames)
+
+    def has_class(classValue) -> bool:
+        # While the page is being parsed the class attribute is still one string of every class name
+        if classValue is None:
+            return False
+        elementClasses = classValue.split() if type(classValue).__name__ == 'str' else classValue
+        return not classNames.isdisjoint(elementClasses)
+
+    return SoupStrainer(class_=has_class)
+
+
+def strain_by_id(elementIds:list[str]) -> SoupStrainer:
+    '''
+    Returns a strainer matching the elements with any of the ids.
+
+    :param elementIds: Element ids to match.
+    :type elementIds: list[str]
+    '''
+    return SoupStrainer(id=list(elementIds))
+
+
+def strain_by_tag(tagNames:list[str]) -> SoupStrainer:
+    '''
+    Returns a strainer matching the elements with any of the tag names.
+
+    :param tagNames: Tag names to match - such as ['h1', 'app-game-scores-display']
+    :type tagNames: list[str]
+    '''
+    return SoupStrainer(list(tagNames))
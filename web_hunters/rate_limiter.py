@@ -0,0 +1,98 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - rate_limiter.py
+# Token bucket rate limiter keyed by domain, used by the Web Hunters before every web request or browser page load.
+
+import time, random
+from multiprocessing import get_context
+from urllib.parse import urlparse
+
+class DomainRateLimiter():
+    '''
+    Token bucket rate limiter keyed by domain.\n
+    Each domain has its own bucket that refills at a set rate (requests per second) up to a burst size,\n
+    and every request takes one token - waiting until one is available - plus a random jitter wait.\n
+
+    The buckets are stored in shared memory, so the limiter must be created in the main process\n
+    and handed to the worker processes when they are started.
+    '''
+    def __init__(self, domainLimits:dict, defaultLimit:dict):
+        '''
+        :param domainLimits: Limits of each domain - {'en.wikipedia.org' : {'rate' : 2.0, 'burst' : 5, 'jitter' : 0.0}}
+        :type domainLimits: dict
+        :param defaultLimit: Limit used by any domain that is not in the domainLimits dictionary.
+        :type defaultLimit: dict
+        '''
+        ctx = get_context("spawn")
+
+        self.__default_domain = "default"
+
+        self.__limits: dict[str, tuple] = {}
+
+        # Each bucket holds the number of tokens left and the time it was last refilled
+        self.__buckets = {}
+
+        for domain, limit in list(domainLimits.items()) + [(self.__default_domain, defaultLimit)]:
+            rate = max(float(limit.get('rate', 1.0)), 0.001)
+            burst = max(float(limit.get('burst', 1)), 1.0)
+            jitter = max(float(limit.get('jitter', 0.0)), 0.0)
+
+            self.__limits[domain] = (rate, burst, jitter)
+            self.__buckets[domain] = ctx.Array('d', [burst, time.time()])
+
+    def acquire(self, url:str) -> float:
+        '''
+        Waits until the domain of the URL is allowed another request, and returns the number of seconds waited.
+
+        :param url: URL that is about to be requested - https://www.example.com
+        :type url: str
+        '''
+        domain = self.get_domain_key(url)
+
+        rate, burst, jitter = self.__limits[domain]
+        bucket = self.__buckets[domain]
+
+        with bucket.get_lock():
+            timeNow = time.time()
+            tokens = min(burst, bucket[0] + (timeNow - bucket[1]) * rate)
+            # Take the token now, even if it has not refilled yet, so other processes queue up behind this request
+            tokens -= 1
+            bucket[0] = tokens
+            bucket[1] = timeNow
+
+        waitTime = (-tokens / rate) if tokens < 0 else 0.0
+
+        if jitter:
+            waitTime += random.uniform(0, jitter)
+
+        if waitTime > 0:
+            time.sleep(waitTime)
+
+        return waitTime
+
+    def get_domain_key(self, url:str) -> str:
+        '''
+        Returns the domain key of the bucket a URL belongs to.
+        '''
+        return find_domain_key(url, self.__limits.keys(), self.__default_domain)
+
+
+def find_domain_key(url:str, domainKeys, defaultKey:str = "default") -> str:
+    '''
+    Returns the domain key a URL belongs to, or the default key if the URL's domain is not one of the domain keys.\n
+    Sub-domains use their parent domain's key, for example 'api.opencritic.com' uses the 'opencritic.com' key.
+
+    :param url: URL to find the domain key of - https://www.example.com
+    :type url: str
+    :param domainKeys: Domain keys to look through - ['opencritic.com', 'en.wikipedia.org']
+    :param defaultKey: Key returned when no domain key matches.
+    :type defaultKey: str
+    '''
+    domain = urlparse(url).netloc.lower().split(':')[0]
+
+    while domain:
+        if domain in domainKeys:
+            return domain
+        if '.' not in domain:
+            break
+        domain = domain.split('.', 1)[1]
+
+    return defaultKey
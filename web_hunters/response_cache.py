@@ -0,0 +1,170 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - response_cache.py
+# On-disk cache of the web pages downloaded by the Web Hunters, stored in a folder next to the database.
+
+import os, json, time, hashlib
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    from web_hunters.rate_limiter import find_domain_key
+except ImportError as e:
+    print(e)
+    print("Unable to import the rate limiter in response_cache.py")
+
+class ResponseCache():
+    '''
+    Stores each downloaded web page on disk, keyed by a hash of its URL.\n
+    Each cache entry holds the page body, the page's headers and the time it was fetched.\n
+
+    A cache entry younger than its domain's time-to-live is used without any web request.\n
+    An older entry is revalidated with a conditional request (If-None-Match / If-Modified-Since),\n
+    so if the website answers '304 Not Modified' the page does not need to be downloaded again.\n
+    The data a Web Hunter read from a page can be stored with its entry, so an unchanged page does not need to be parsed again either.
+    '''
+    def __init__(self, path_to_folder:str, domainTTLs:dict, defaultTTL:int):
+        '''
+        :param path_to_folder: Folder the cache will be stored in.
+        :type path_to_folder: str
+        :param domainTTLs: Seconds a page from each domain is used before it is revalidated - {'en.wikipedia.org' : 604800}
+        :type domainTTLs: dict
+        :param defaultTTL: Seconds used for any domain that is not in the domainTTLs dictionary.
+        :type defaultTTL: int
+        '''
+        self.path_to_cache = path_to_folder
+
+        self.domainTTLs = domainTTLs
+
+        self.defaultTTL = defaultTTL
+
+        # Only these headers are kept in the cache entry
+        self.__headers_to_keep = ['Content-Type', 'ETag', 'Last-Modified', 'Date', 'Cache-Control']
+
+    def __get_entry_paths(self, url:str):
+        '''Returns the paths of the body and header files of a URL's cache entry.'''
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        folder = os.path.join(self.path_to_cache, key[:2])
+        return os.path.join(folder, key + ".body"), os.path.join(folder, key + ".json")
+
+    def get(self, url:str):
+        '''
+        Returns the cache entry of a URL as a dictionary, or None if the URL is not cached.
+
+        :param url: URL of the web page.
+        :type url: str
+        '''
+        bodyPath, metaPath = self.__get_entry_paths(url)
+        try:
+            with open(metaPath, mode='r', encoding='utf-8') as file:
+                entry = json.load(file)
+            with open(bodyPath, mode='rb') as file:
+                entry['body'] = file.read()
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry:dict) -> bool:
+        '''Checks if a cache entry is younger than its domain's time-to-live.'''
+        ttl = self.domainTTLs.get(find_domain_key(entry['request_url'], self.domainTTLs.keys()), self.defaultTTL)
+        return (time.time() - entry['fetch_time']) < ttl
+
+    def get_conditional_headers(self, entry:dict) -> dict:
+        '''Returns the If-None-Match and If-Modified-Since headers used to revalidate a cache entry.'''
+        headers = {}
+        if not entry:
+            return headers
+
+        entryHeaders = CaseInsensitiveDict(entry['headers'])
+        if entryHeaders.get('ETag'):
+            headers['If-None-Match'] = entryHeaders['ETag']
+        if entryHeaders.get('Last-Modified'):
+            headers['If-Modified-Since'] = entryHeaders['Last-Modified']
+        return headers
+
+    def store(self, url:str, response:requests.Response):
+        '''
+        Stores a successful response in the cache.
+
+        :param url: URL that was requested - the response's URL may differ if it was redirected.
+        :type url: str
+        :param response: Response of the web page.
+        :type response: Response
+        '''
+        headers = {key: response.headers[key] for key in self.__headers_to_keep if key in response.headers}
+
+        entry = {'request_url' : url, 'url' : response.url, 'status_code' : response.status_code,
+                 'encoding' : response.encoding, 'headers' : headers, 'fetch_time' : time.time()}
+
+        self.__write_entry(url, entry, response.content)
+
+    def refresh(self, url:str, entry:dict, response:requests.Response):
+        '''
+        Marks a cache entry as fetched now, after the website answered '304 Not Modified'.
+        '''
+        for key in self.__headers_to_keep:
+            if key in response.headers:
+                entry['headers'][key] = response.headers[key]
+
+        entry['fetch_time'] = time.time()
+
+        self.__write_entry(url, entry, None)
+
+    def store_page_data(self, url:str, pageData:dict):
+        '''
+        Stores the data a Web Hunter read from a page with the page's cache entry.\n
+        The data is dropped when a new copy of the page is stored, so it is only used while the page is unchanged.
+
+        :param url: URL the page's cache entry is stored under.
+        :type url: str
+        :param pageData: Data read from the page - must only hold values JSON can store.
+        :type pageData: dict
+        '''
+        bodyPath, metaPath = self.__get_entry_paths(url)
+        try:
+            with open(metaPath, mode='r', encoding='utf-8') as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        entry['page_data'] = pageData
+
+        self.__write_entry(url, entry, None)
+
+    def __write_entry(self, url:str, entry:dict, body:bytes|None):
+        '''
+        Writes the cache entry files. Each file is written to a temporary file first and then moved into place,\n
+        so another process never reads a half written entry.
+        '''
+        bodyPath, metaPath = self.__get_entry_paths(url)
+        meta = {key: value for key, value in entry.items() if key != 'body'}
+        try:
+            os.makedirs(os.path.dirname(metaPath), exist_ok=True)
+
+            if body is not None:
+                tempBodyPath = f"{bodyPath}.{os.getpid()}.tmp"
+                with open(tempBodyPath, mode='wb') as file:
+                    file.write(body)
+                os.replace(tempBodyPath, bodyPath)
+
+            tempMetaPath = f"{metaPath}.{os.getpid()}.tmp"
+            with open(tempMetaPath, mode='w', encoding='utf-8') as file:
+                json.dump(meta, file)
+            os.replace(tempMetaPath, metaPath)
+
+        except OSError as e:
+            print(e)
+            print(f"Unable to store the web page in the response cache: {url}")
+
+    def build_response(self, entry:dict) -> requests.Response:
+        '''
+        Creates a requests Response Object out of a cache entry, so the Web Hunters can use it like any other response.\n
+        The data read from the page the last time it was parsed is kept in the response's page_data attribute - None if it has not been stored.
+        '''
+        response = requests.Response()
+        response.status_code = entry['status_code']
+        response.reason = "OK"
+        response.url = entry['url']
+        response.encoding = entry['encoding']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = entry['body']
+        response.page_data = entry.get('page_data')
+        return response
@@ -1,6 +1,5 @@
 # Game Information Searcher - by Sebastian Muylle - Version 1.0 -
-import time, requests
-from bs4 import BeautifulSoup 
+import time, re, requests
   
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select 
@@ -20,6 +19,17 @@ except:
         print(e)
         print("Unable to import the WebHunter Parent Class")
 
+try: 
+    from web_hunters import page_parser
+except ImportError as e:
+    print(e)
+    print("Unable to import the page parser for the Steam Web Hunter.")
+
+# Elements of the Steam pages read by the Steam Hunter - only these elements are built into each page's tree
+STORE_PAGE_STRAINER = page_parser.strain_by_class(['apphub_AppName', 'game_review_summary', 'responsive_reviewdesc', 
+                                                   'outlier_totals', 'date', 'game_header_image_full'])
+SEARCH_PAGE_STRAINER = page_parser.strain_by_id(['search_results'])
+
 #####################################
 
 class SteamHunter(WebHunter):
@@ -32,6 +42,16 @@ class SteamHunter(WebHunter):
         self.__MAIN_GAME_SITE_URL = "store.steampowered.com"
         self.__GAME_SITE_URL_TO_MATCH = f"{self.__MAIN_GAME_SITE_URL}/app" # string to locate the correct url when searching through a search engine results 
         self.brand = "Steam"
+        # Cookies that Steam sets once the age check has been passed - sent with every store page request,
+        # so the store page of a mature rated game can be read without Selenium.
+        self.__AGE_CHECK_COOKIES = {'birthtime' : '283993201', 'lastagecheckage' : '1-0-1979', 
+                                    'mature_content' : '1', 'wants_mature_content' : '1'}
+        # Determines whether the game's data is first read from Steam's JSON appdetails and appreviews endpoints,
+        # with the store page's HTML only used as the fallback
+        self.use_json_api = True
+        # The JSON endpoints have no summary of the last 30 days - when the recent reviews are wanted, 
+        # the store page's HTML is read instead of the JSON endpoints, so only one of the two is downloaded
+        self.read_recent_reviews = False
 
     def search(self, game: Game):
         '''
@@ -45,16 +65,38 @@ class SteamHunter(WebHunter):
         # Use Steam's Search Tool to find the game
         game.steam_data.url = self.__search_steam(game.name)  
 
-        # If the program finds a link, go ahead and use the response class to first attempt to get the information
-        if game.steam_data.url:             
-            res = self.reponse(game.steam_data.url)
-            if res:
-                self.__get_game_page_info(res, game)
+        # If the program finds a link, first attempt to get the information out of Steam's JSON endpoints
+        if game.steam_data.url and self.use_json_api and not self.read_recent_reviews:
+            self.__get_game_json_info(game)
+
+            if game.steam_data.found_data:
+                self.runStats.increment("Steam Store Page - JSON API")
+
+        # Otherwise use the response class to get the information out of the store page
+        # The age check cookies are sent with the request, so mature rated games do not show the age check page
+        if game.steam_data.url and not game.steam_data.found_data:             
+            res = self.reponse(game.steam_data.url, cookies=self.__AGE_CHECK_COOKIES)
+            if res and self.__is_age_check_page(res):
+                # The cookies did not get past the age check - the store page is read with Selenium below
+                print("The age check cookies did not work. Checking Steam store page again with Selenium.")
+                self.runStats.increment("Steam Store Page - Age Check Cookies Failed")
+
+            elif res:
+                # An unchanged store page from the response cache is not parsed again
+                self.read_page_data(res, game.steam_data, lambda: self.__get_game_page_info(res, game))
+
+                if game.steam_data.found_data and game.steam_data.releaseDate != "":
+                    self.runStats.increment("Steam Store Page - Requests")
+
+                    # Only the pages Steam shows the age check in front of were read because of the cookies
+                    if self.__has_mature_content(res):
+                        self.runStats.increment("Steam Store Page - Age Check Cookies")
         
         if game.steam_data.url and game.steam_data.found_data and game.steam_data.releaseDate == "":
             print("Error in Retrieving Steam Data.\nPossible M+ rated game.")
-            print("Checking Steam store page again.")
+            print("The age check cookies did not work. Checking Steam store page again with Selenium.")
 
+            self.runStats.increment("Steam Store Page - Selenium Age Check Fallback")
             self.__use_selenium_method(game) 
 
         # If we do not find the information with the response class method, we'll manually search for the webpage 
@@ -66,8 +108,10 @@ class SteamHunter(WebHunter):
                 game.steam_data.url = self.searchDuck(self.__MAIN_GAME_SITE_URL, game.name, self.__GAME_SITE_URL_TO_MATCH, self.brand) 
 
                 if game.steam_data.url:
+                    self.runStats.increment("Steam Store Page - Selenium")
                     self.__use_selenium_method(game)  
             else:
+                self.runStats.increment("Steam Store Page - Selenium")
                 self.__use_selenium_method(game) 
         
         border_sep_symbol = "#" * 60
@@ -94,7 +138,7 @@ class SteamHunter(WebHunter):
 
         search_response = self.reponse(self.create_website_search_link(search_url, game_name)) 
 
-        soup = BeautifulSoup(search_response.text, 'html.parser') 
+        soup = page_parser.parse_html(search_response.text, SEARCH_PAGE_STRAINER) 
 
         try:
             if soup.find('div', class_="search_results", id="search_results"):
@@ -117,6 +161,108 @@ class SteamHunter(WebHunter):
 
         return url
  
+    def __get_game_json_info(self, game: Game):
+        '''
+        Gets the game's data out of Steam's JSON appdetails and appreviews endpoints,\n
+        which are much smaller than the store page and do not need to be parsed as HTML.
+        
+        :param game: Game Object that will be modified.
+        :type game: Game
+        '''
+        app_id = self.get_app_id_from_url(game.steam_data.url)
+
+        if not app_id:
+            return
+
+        details_response = self.reponse(f"https://store.steampowered.com/api/appdetails?appids={app_id}&l=english")
+
+        reviews_response = self.reponse(f"https://store.steampowered.com/appreviews/{app_id}?json=1&language=all&purchase_type=all&num_per_page=0")
+
+        if details_response and reviews_response:
+            try:
+                self.set_steam_data_from_json(game, app_id, details_response.json(), reviews_response.json())
+            except ValueError:
+                print("Steam - Failed to read the JSON appdetails or appreviews response.")
+
+    def __is_age_check_page(self, response:requests.Response) -> bool:
+        '''
+        Returns True if the response is Steam's age check page instead of the store page - the age check cookies did not work.
+        
+        :param response: Response of the store page.
+        '''
+        return 'agecheck' in str(response.url) or 'agegate_birthday_desc' in response.text
+
+    def __has_mature_content(self, response:requests.Response) -> bool:
+        '''
+        Returns True if the store page has Steam's mature content description - without the age check cookies,\n
+        Steam shows the age check page in front of these store pages.
+        
+        :param response: Response of the store page.
+        '''
+        return 'id="game_area_content_descriptors"' in response.text
+
+    def get_app_id_from_url(self, url: str) -> str:
+        '''
+        Gets the app ID out of a Steam store page url - 'https://store.steampowered.com/app/1145360/Hades/' -> '1145360'
+        '''
+        match = re.search(r'/app/(\d+)', url)
+
+        if match:
+            return match.group(1)
+        return ''
+
+    def set_steam_data_from_json(self, game: Game, app_id: str, appdetails: dict, appreviews: dict) -> bool:
+        '''
+        Sets the game's Steam Data out of the JSON appdetails and appreviews responses, and returns whether the data was found.\n
+        The review score is worked out from the exact number of positive and total reviews.\n 
+        Note: the appreviews query summary only covers all reviews, so the recent reviews are left as 'No user review' -\n
+        set read_recent_reviews to read the store page instead of the JSON endpoints when they are wanted.
+         
+        :param game: Game Object that will be modified.
+        :type game: Game
+        :param app_id: Steam app ID of the game.
+        :type app_id: str
+        :param appdetails: JSON response of the appdetails endpoint.
+        :type appdetails: dict
+        :param appreviews: JSON response of the appreviews endpoint.
+        :type appreviews: dict
+        '''
+        app_details = appdetails.get(str(app_id), {})
+
+        if not app_details.get('success') or not appreviews.get('success'):
+            return False
+
+        details_data = app_details.get('data', {})
+        query_summary = appreviews.get('query_summary', {})
+
+        game.steam_data.title_on_steam = str(details_data.get('name', 'NO TITLE'))
+
+        release_date = details_data.get('release_date', {})
+        if release_date.get('date'):
+            game.steam_data.releaseDate = str(release_date['date'])
+        elif release_date.get('coming_soon'):
+            game.steam_data.releaseDate = "Coming soon"
+        else:
+            game.steam_data.releaseDate = "No Date"
+
+        game.steam_data.imageURL = str(details_data.get('header_image', "NO IMAGE URL FOUND"))
+
+        total_reviews = int(query_summary.get('total_reviews', 0))
+        total_positive = int(query_summary.get('total_positive', 0))
+
+        if total_reviews > 0:
+            game.steam_data.allReviewsScore = round(total_positive * 100 / total_reviews)
+            game.steam_data.allReviewsText = str(query_summary.get('review_score_desc', "No user review"))
+            game.steam_data.allReviewsData = f"{game.steam_data.allReviewsScore}% of the {total_reviews:,} user reviews for this game are positive."
+        else:
+            game.steam_data.allReviewsScore = 0
+            game.steam_data.allReviewsText = "No user review"
+            game.steam_data.allReviewsData = "No user review"
+
+        game.steam_data.found_data = True
+
+        return True
+ 
     def __get_game_page_info(self, response:requests.Response, game: Game):
         '''
         Uses the response to parse through the HTML and return the data for the Steam store data.
@@ -132,7 +278,7 @@ class SteamHunter(WebHunter):
 
         web_html = response.text
 
-        soup = BeautifulSoup(web_html, 'html.parser') 
+        soup = page_parser.parse_html(web_html, STORE_PAGE_STRAINER) 
         try:
 
             if soup.find('div', id="appHubAppName", class_="apphub_AppName"):
@@ -196,13 +342,14 @@ class SteamHunter(WebHunter):
         '''
         Primarily utilizes the Selenium Web Tool to check the game's data on the Steam web page. 
         '''
-        wd, wait = self.browser() # creates a new selenium firefox browser and returns the web driver wd and the wait version of that web driver
-        wd.get(game.steam_data.url) # if the link was found during the google search, use that URL to load the browser 
+        # gets a selenium firefox browser from the browser pool and returns the web driver wd and the wait version of that web driver
+        # if the link was found during the google search, use that URL to load the browser 
+        wd, wait = self.browser(game.steam_data.url)
         if not self.__checkingForErrorPage(wd):
             if self.__checkingForAgeCheck(wd): 
                 self.__setAgeToAdult(wd)
             self.__getSteamData(wd, game) 
-        wd.quit() # Close out the web browser bot
+        self.release_browser(wd) # Give the web browser bot back to the browser pool
 
     def __checkingForAgeCheck(self, wd: Firefox):
         '''
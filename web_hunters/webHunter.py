@@ -6,17 +6,26 @@ from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By 
 
-from urllib.parse import quote
+from urllib.parse import quote, urlparse, urlencode
 
 from pathlib import Path
 
 import os, platform, requests 
+from requests.adapters import HTTPAdapter
 
 try: 
     from ClassContainers.GameData import Game 
+
+    from ClassContainers.RunStats import RunStats
 except:  
     print("Missing the GameData Game Class type for the Web Hunter parent class.")
 
+try: 
+    from web_hunters.browser_pool import BrowserPool
+except ImportError as e:
+    print(e)
+    print("Unable to import the BrowserPool class in webHunter.py.")
+
 try:    
     from cydifflib import SequenceMatcher # Used to help compare strings for similarity 
  
@@ -33,6 +42,19 @@ class WebHunter():
         self.__SCORE_NEEDED_TO_PASS_PARTIAL_STRING_TEST = 0.5 # Testing Score to ensure a partial to near string match
         self.__headless = True # Determines whether the Selenium Browser is available
         self.__web_tool_headers = webHeaders # User's Web Headers for the methods using the requests library 
+        self.__rate_limiter = None # Shared DomainRateLimiter - every web request and browser page load waits on it 
+        self.__response_cache = None # On-disk ResponseCache - used by the reponse method when it is set 
+        self.__session = None # Pooled requests Session - created the first time it is needed in each process 
+        self.__browser_pool = None # Pool of warm Selenium browsers - created the first time it is needed in each process 
+        self.__browser_pool_size = 1 # Number of idle browsers kept open 
+        self.__browser_max_page_loads = 25 # Number of pages a browser loads before it is closed and replaced 
+        self.__session_pool_size = 4 # Number of connections kept open to each website 
+        self.__session_keep_alive = True # Determines whether the connections are kept open between web requests 
+        # Average seconds taken by the web requests that opened a new connection and by the ones that reused a connection
+        self.__new_connection_average = (0.0, 0) 
+        self.__reused_connection_average = (0.0, 0)
+        self.runStats = RunStats() # Counters of this Web Hunter - sent back to the GameSearchManager after each search 
+        self.batch_size = 1 # Number of games given to the search_batch method at once - 1 searches for each game on its own 
         # String Variables used to check which brand the caller is for - used to help with URL construction purposes
         self.brand = 'n/a' # The Brand of the Child - will be overwritten by the child class.
         self.__steam_brand = "Steam" 
@@ -44,40 +66,303 @@ class WebHunter():
         '''
         print(game.name)
 
+    def search_batch(self, gameList:list[Game]):
+        '''
+        Search for several games at once. Child classes whose site can look up many titles in one web request overwrite this,\n
+        otherwise each game is searched for on its own.
+        '''
+        for game in gameList:
+            self.search(game)
+
     def search_linux(self, game_title:str):
         '''
         Search function to be overwritten by child classes of the WebHunter.
         Specifically for Linux platforms to account for the nature of multithreading.
         '''
 
+    def __getstate__(self):
+        '''
+        The requests Session and the browser pool are not passed to other processes - each process creates its own.
+        '''
+        state = self.__dict__.copy()
+        state['_WebHunter__session'] = None
+        state['_WebHunter__browser_pool'] = None
+        return state
+
+    def set_rate_limiter(self, rateLimiter):
+        '''
+        Sets the DomainRateLimiter that every web request and browser page load will wait on.
+        '''
+        self.__rate_limiter = rateLimiter
+
+    def wait_for_rate_limiter(self, url:str):
+        '''
+        Waits until the rate limiter allows another request to the URL's domain.
+        '''
+        if self.__rate_limiter:
+            self.runStats.increment("Rate Limiter Seconds Waited", self.__rate_limiter.acquire(url))
+
+    def set_session_options(self, poolSize:int, keepAlive:bool):
+        '''
+        Sets the connection pool size and keep-alive options of the requests Session.
+        '''
+        self.__session_pool_size = max(1, poolSize)
+        self.__session_keep_alive = keepAlive
+        self.close_session()
+
     ## Request Functions ##
-    def reponse(self, url) -> requests.Response:
+    def set_browser_pool_options(self, poolSize:int, maxPageLoads:int):
+        '''
+        Sets the number of idle browsers kept open and the number of pages a browser loads before it is replaced.
+        '''
+        self.__browser_pool_size = max(1, poolSize)
+        self.__browser_max_page_loads = max(1, maxPageLoads)
+        self.close_browsers()
+
+    def close(self):
+        '''
+        Closes the requests Session and every browser kept open by this Web Hunter.
+        '''
+        self.close_session()
+        self.close_browsers()
+
+    def set_response_cache(self, responseCache):
+        '''
+        Sets the ResponseCache that the reponse method will use to store and revalidate web pages.
+        '''
+        self.__response_cache = responseCache
+
+    def get_session(self) -> requests.Session:
+        '''
+        Returns the pooled requests Session of this Web Hunter, creating it if needed.\n
+        The Session keeps the connections to each website open, so each web request can skip the TCP connection and TLS handshake.
+        '''
+        if self.__session is None:
+            session = requests.Session()
+
+            adapter = HTTPAdapter(pool_connections=self.__session_pool_size, pool_maxsize=self.__session_pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+            if self.__web_tool_headers:
+                session.headers.update(self.__web_tool_headers)
+
+            if not self.__session_keep_alive:
+                session.headers['Connection'] = 'close'
+
+            self.__session = session
+
+        return self.__session
+
+    def close_session(self):
+        if self.__session is not None:
+            self.__session.close()
+            self.__session = None
+
+    def __has_open_connection(self, session:requests.Session, url:str):
+        '''
+        Checks if the Session has an idle connection to the URL's website that is still open.\n
+        Returns None if the connection pool can't be checked.
+        '''
+        try:
+            poolManager = session.get_adapter(url).poolmanager
+            hostName = urlparse(url).hostname
+
+            for poolKey in poolManager.pools.keys():
+                pool = poolManager.pools[poolKey]
+                if pool.host != hostName:
+                    continue
+                for connection in list(pool.pool.queue):
+                    if connection is not None and connection.is_connected:
+                        return True
+            return False
+        except Exception:
+            return None
+
+    def __session_get(self, url:str, **kwargs) -> requests.Response:
+        '''
+        Gets the URL with the pooled requests Session and records whether a new connection had to be opened.\n
+        The seconds saved by reusing a connection are estimated from the difference between the average time\n
+        of the requests that opened a new connection and the requests that reused one.
+        '''
+        session = self.get_session()
+
+        connectionOpen = self.__has_open_connection(session, url)
+
+        response = session.get(url, timeout=self.__timeToWait, allow_redirects=True, **kwargs)
+
+        elapsed = response.elapsed.total_seconds()
+
+        self.runStats.increment("HTTP Requests")
+
+        if connectionOpen is None:
+            return response
+
+        if not connectionOpen:
+            self.runStats.increment("HTTP Connections Opened")
+            total, count = self.__new_connection_average
+            self.__new_connection_average = (total + elapsed, count + 1)
+        else:
+            self.runStats.increment("HTTP Connections Reused")
+            total, count = self.__reused_connection_average
+            self.__reused_connection_average = (total + elapsed, count + 1)
+
+            newTotal, newCount = self.__new_connection_average
+            if newCount:
+                saved = (newTotal / newCount) - ((total + elapsed) / (count + 1))
+                self.runStats.increment("HTTP Connection Setup Seconds Saved (estimate)", max(saved, 0.0))
+
+        return response
+
+    def reponse(self, url, cookies:dict|None = None) -> requests.Response:
         '''
         Attempts to get a response from the URL the caller provides and either returns a response object,\n
-        reporting a success status of 200, or None if the response failed. 
+        reporting a success status of 200, or None if the response failed.\n
+        If a response cache is set, a fresh cached page is returned without a web request, and an older cached page\n
+        is revalidated with a conditional request, so an unchanged page is not downloaded again.\n
+        The data read from an unchanged page can be reused with the read_page_data method, so the page is not parsed again either.
         
         :param url: URL passed in by the caller to a website: https://www.example.com
+        :param cookies: Cookies sent with this request only - such as Steam's age check cookies.
         '''
+        cacheEntry = None
+        conditionalHeaders = {}
+
+        # Pages requested with cookies are cached separately from the same page requested without them
+        cacheKey = url
+        if cookies:
+            cacheKey = f"{url}#{urlencode(sorted(cookies.items()))}"
+
+        if self.__response_cache:
+            cacheEntry = self.__response_cache.get(cacheKey)
+
+            if cacheEntry and self.__response_cache.is_fresh(cacheEntry):
+                self.runStats.increment("HTTP Cache Hits")
+                return self.__build_cached_response(cacheKey, cacheEntry)
+
+            conditionalHeaders = self.__response_cache.get_conditional_headers(cacheEntry)
+
         try:
-            if self.__web_tool_headers:
-                response = requests.get(url, headers=self.__web_tool_headers, timeout=self.__timeToWait, allow_redirects=True)  
-            else:
-                response = requests.get(url, timeout=self.__timeToWait, allow_redirects=True)  
+            self.wait_for_rate_limiter(url)
+
+            response = self.__session_get(url, headers=conditionalHeaders, cookies=cookies)
+
+            if response.status_code == 304 and cacheEntry:
+                self.runStats.increment("HTTP Cache Revalidated (304)")
+                self.__response_cache.refresh(cacheKey, cacheEntry, response)
+                return self.__build_cached_response(cacheKey, cacheEntry)
 
             if response.status_code == 200: 
+                if self.__response_cache:
+                    self.runStats.increment("HTTP Cache Misses")
+                    self.__response_cache.store(cacheKey, response)
+                    response.cache_key = cacheKey
                 return response
             else:                  
                 return None
-        except:
+        except Exception as e:
             print("Response failed completely.") 
-            print("Status Code:", response.status_code)
+            print(e)
             return None
         
+    def __build_cached_response(self, cacheKey:str, cacheEntry:dict) -> requests.Response:
+        '''Creates a response out of a cache entry, keeping the key the entry is stored under.'''
+        response = self.__response_cache.build_response(cacheEntry)
+        response.cache_key = cacheKey
+        return response
+
+    def get_cached_page_data(self, response:requests.Response) -> dict|None:
+        '''
+        Returns the data read from the page the last time it was parsed, if the response is an unchanged page from the response cache.\n
+        Returns None if the page has to be parsed.
+        '''
+        return getattr(response, 'page_data', None)
+
+    def store_page_data(self, response:requests.Response, pageData:dict):
+        '''
+        Stores the data read from the page with the page's cache entry, so the page is not parsed again while it is unchanged.\n
+        Does nothing if the response is not in the response cache.
+
+        :param response: Response of the web page.
+        :type response: Response
+        :param pageData: Data read from the page - must only hold values JSON can store.
+        :type pageData: dict
+        '''
+        cacheKey = getattr(response, 'cache_key', None)
+        if self.__response_cache and cacheKey:
+            self.__response_cache.store_page_data(cacheKey, pageData)
+
+    def read_page_data(self, response:requests.Response, dataObj, read_page):
+        '''
+        Fills a data object - such as the Game Object's Steam Data - by calling read_page, and stores the object's attributes with the page's cache entry.\n
+        If the response is an unchanged page from the response cache, the object is filled with the attributes stored the last time instead,\n
+        without parsing the page again.
+
+        :param response: Response of the web page.
+        :type response: Response
+        :param dataObj: Data object read_page fills in - its attributes must only hold values JSON can store.
+        :param read_page: Method that parses the page and fills in the data object.
+        '''
+        pageData = self.get_cached_page_data(response)
+        if pageData is not None:
+            vars(dataObj).update(pageData)
+            self.runStats.increment("HTTP Cache Pages Not Parsed")
+            return
+
+        read_page()
+
+        self.store_page_data(response, vars(dataObj))
+
     ## Selenium Functions ##
-    def browser(self):
+    def browser(self, url:str = ''):
+        '''
+        Returns a Firefox WebDriver from the browser pool and a WebDriverWait object.\n
+        If a URL is passed in, the browser will wait on the rate limiter and then load the URL.\n
+        If the page fails to load, the browser is closed and removed from the pool before the error is raised.\n
+        The WebDriver must be given back with the release_browser method once the caller is done with it.
+
+        :param url: URL to load in the browser: https://www.example.com
+        '''
+        if self.__browser_pool is None:
+            self.__browser_pool = BrowserPool(self.__create_browser, self.__browser_pool_size, self.__browser_max_page_loads)
+
+        wd = self.__browser_pool.acquire()
+
+        wait = WebDriverWait(wd, self.__timeToWait)
+
+        if url:
+            self.wait_for_rate_limiter(url)
+            self.__browser_pool.record_page_load(wd)
+            self.runStats.increment("Browser Page Loads")
+            try:
+                wd.get(url)
+            except Exception:
+                # The caller never receives the browser, so it can't give it back - close it here instead of leaking the Firefox process
+                self.__browser_pool.discard(wd)
+                raise
+     
+        return wd, wait
+
+    def release_browser(self, wd):
+        '''
+        Gives a WebDriver back to the browser pool, so it can be reused for the next page.
+        '''
+        if self.__browser_pool is None:
+            wd.quit()
+        else:
+            self.__browser_pool.release(wd)
+
+    def close_browsers(self):
+        if self.__browser_pool is not None:
+            self.__browser_pool.close()
+            self.__browser_pool = None
+
+    def __create_browser(self):
         '''
-        Creates and returns a Firefox WebDriver and WebDriverWait objects.        
+        Creates and returns a new Firefox WebDriver.
         '''
+        self.runStats.increment("Browsers Started")
+
         pathToFolder = str(os.path.realpath(os.path.dirname(__file__)))
 
         pathToFireFoxAddons = os.path.join(pathToFolder, 'firefoxprofile')
@@ -118,9 +403,7 @@ class WebHunter():
             for xpiPath in xpi_addons:  
                 wd.install_addon(xpiPath.absolute(), temporary=True)
 
-        wait = WebDriverWait(wd, self.__timeToWait)
-     
-        return wd, wait
+        return wd
     
     def searchDuck(self, main_game_site_url:str, game_name:str, game_site_url_to_match:str, platform_brand:str):
         ''' 
@@ -136,15 +419,13 @@ class WebHunter():
         :type platform_brand: str
         '''
         
-        wd, wait = self.browser()
-
         resultsLinkURL = self.__createDuckSearchURL(game_name, main_game_site_url)
 
-        wd.get(resultsLinkURL) 
+        wd, wait = self.browser(resultsLinkURL)
 
         linkFound, url_result = self.__selDuckSearchMultiResults(game_site_url_to_match, wait, game_name)
 
-        wd.quit()
+        self.release_browser(wd)
         
         if linkFound: # if the link is found, make sure to fix it before being returned to the caller
             return self.__fixGameURL(url_result, platform_brand)
@@ -1,10 +1,9 @@
 
 # Game Information Searcher - by Sebastian Muylle - Version 1.0 - wikipedia_web_hunter.py
-import requests 
 import bs4
 from bs4 import BeautifulSoup
    
-from urllib.parse import quote
+from urllib.parse import quote, urlencode
 
 try: 
     from ClassContainers.GameData import Game, WikipediaData
@@ -19,6 +18,25 @@ except:
     except ImportError as e:
         print(e)
         print("Unable to import the WebHunter Parent Class")
+
+try: 
+    from web_hunters import wikitext_parser
+except ImportError as e:
+    print(e)
+    print("Unable to import the wikitext parser for the Wikipedia Web Hunter.")
+
+try: 
+    from web_hunters import page_parser
+except ImportError as e:
+    print(e)
+    print("Unable to import the page parser for the Wikipedia Web Hunter.")
+
+# Elements of a game's Wikipedia page read by the Wikipedia Hunter - only the infobox and review box are built into the page's tree
+GAME_PAGE_STRAINER = page_parser.strain_by_class(['ib-video-game', 'video-game-reviews'])
+
+# Search result and series pages are only read inside the article's content - the menus, sidebars and footer are not built into the tree.
+# A search can lead straight to the game's page, so this tree also holds the infobox and review box
+CONTENT_STRAINER = page_parser.strain_by_id(['mw-content-text'])
  
 class WikipediaHunter(WebHunter):
     '''
@@ -28,6 +46,139 @@ class WikipediaHunter(WebHunter):
         ### Main Variables ### 
         super().__init__(webHeaders) 
         self.brand = "Wikipedia"
+        self.batch_size = 50 # Titles looked up in each MediaWiki action API request - 1 turns the batch search off
+
+        # The action API does not accept more than 50 titles in one request
+        self.__MAX_API_TITLES = 50
+        self.__API_URL = "https://en.wikipedia.org/w/api.php"
+
+    def search_batch(self, gameList:list[Game]):
+        '''
+        Search for many game titles on Wikipedia at once through the MediaWiki action API.\n
+        Up to 50 titles are resolved in each web request - following redirects and skipping disambiguation pages -\n
+        and the same request returns each page's wikitext, which the infobox and review box are read from.\n
+
+        Titles that do not lead to a video game page are tried again as 'Title (video game)',\n
+        and any game still not found is searched for on its own with the search method.
+
+        :param gameList: Game Objects to contain Wikipedia Data
+        :type gameList: list[Game]
+        '''
+        gamesLeft = list(gameList)
+
+        for titleFormat in ("{}", "{} (video game)"):
+            if not gamesLeft:
+                break
+            chunkSize = max(1, min(self.batch_size, self.__MAX_API_TITLES))
+            notFound = []
+            for i in range(0, len(gamesLeft), chunkSize):
+                notFound += self.__search_titles_with_api(gamesLeft[i:i + chunkSize], titleFormat)
+            gamesLeft = notFound
+
+        for game in gamesLeft:
+            self.runStats.increment("Wikipedia Search - Single Title Fallback")
+            self.search(game)
+
+    def __search_titles_with_api(self, gameList:list[Game], titleFormat:str) -> list[Game]:
+        '''
+        Looks up a group of game titles with one action API query, and sets the Wikipedia Data of every game whose page was found.\n
+        Returns the games that were not found.
+        '''
+        titles = {titleFormat.format(game.name): game for game in gameList}
+
+        pages, titleRedirects = self.__query_pages(list(titles.keys()))
+
+        if pages is None:
+            return gameList
+
+        self.runStats.increment("Wikipedia Search - Action API Titles", len(titles))
+
+        notFound = []
+
+        for title, game in titles.items():
+            # Follow the title through the API's normalization and redirects - 'hades (video game)' -> 'Hades (video game)'
+            pageTitle = title
+            seenTitles = set()
+            while pageTitle in titleRedirects and pageTitle not in seenTitles:
+                seenTitles.add(pageTitle)
+                pageTitle = titleRedirects[pageTitle]
+
+            page = pages.get(pageTitle)
+
+            if not page or page.get('missing') or page.get('invalid') or 'disambiguation' in page.get('pageprops', {}):
+                notFound.append(game)
+                continue
+
+            revisions = page.get('revisions', [])
+            wikitext = revisions[0].get('slots', {}).get('main', {}).get('content', '') if revisions else ''
+
+            infobox_dict = wikitext_parser.get_infobox_dict(wikitext, page['title'])
+
+            # Pages without a video game infobox are not game pages - such as the Greek god for 'Hades'
+            if not infobox_dict:
+                notFound.append(game)
+                continue
+
+            if page.get('original', {}).get('source'):
+                infobox_dict['Image'] = page['original']['source']
+
+            reception_dict = wikitext_parser.get_reception_dict(wikitext)
+
+            url = "https://en.wikipedia.org/wiki/" + quote(page['title'].replace(' ', '_'), safe="()")
+
+            game.wiki_data = self.__set_game_object_wiki_values(game.wiki_data, url, infobox_dict, reception_dict)
+
+            self.runStats.increment("Wikipedia Search - Action API Pages Found")
+            self.__print_search_result(game, url)
+
+        return notFound
+
+    def __query_pages(self, titles:list[str]):
+        '''
+        Sends the action API query for a group of titles, following the API's continuation until every page's content is returned.\n
+        Returns the pages keyed by their title and the normalized and redirected titles, or None and {} if the query failed.
+        '''
+        parameters = {'action' : 'query', 'format' : 'json', 'formatversion' : '2', 'redirects' : '1',
+                      'titles' : "|".join(titles), 'prop' : 'pageprops|pageimages|revisions',
+                      'ppprop' : 'disambiguation', 'piprop' : 'original', 'rvprop' : 'content', 'rvslots' : 'main'}
+
+        pages = {}
+        titleRedirects = {}
+        continueParameters = {}
+
+        while True:
+            response = self.reponse(f"{self.__API_URL}?{urlencode({**parameters, **continueParameters})}")
+
+            if not response:
+                return None, {}
+
+            self.runStats.increment("Wikipedia Search - Action API Requests")
+
+            try:
+                data = response.json()
+            except ValueError as e:
+                print(e)
+                print("The Wikipedia action API did not return JSON.")
+                return None, {}
+
+            query = data.get('query', {})
+
+            for item in query.get('normalized', []) + query.get('redirects', []):
+                titleRedirects[item['from']] = item['to']
+
+            # A continued query returns the same pages again, with the content that did not fit in the last response
+            for page in query.get('pages', []):
+                if page['title'] in pages:
+                    for key, value in page.items():
+                        if value:
+                            pages[page['title']].setdefault(key, value)
+                else:
+                    pages[page['title']] = page
+
+            if 'continue' not in data:
+                return pages, titleRedirects
+
+            continueParameters = data['continue']
 
     def search(self, game:Game): 
         '''
@@ -42,33 +193,58 @@ class WikipediaHunter(WebHunter):
         response = self.reponse(wikiLink)
 
         if response: 
-            wikipage_cat, correct_url = self.__check_results(response, game.name) 
+            self.runStats.increment("Wikipedia Search - HTML Titles Searched")
+
+            # Page data is only stored with a game's page - an unchanged search response that led straight to the game's page is not parsed again
+            if self.get_cached_page_data(response) is not None:
+                game.wiki_data = self.__set_game_info(None, response, game.wiki_data)
+
+            else:
+                # The search response is parsed once - if it is the game's page, the same tree is read for the game's information
+                soup = self.__parse_page(response.text, CONTENT_STRAINER)
+
+                wikipage_cat, correct_url = self.__check_results(soup, game.name) 
 
-            if wikipage_cat == 'Series':
-                response = self.reponse(correct_url)
+                if wikipage_cat == 'Series':
+                    response = self.reponse(correct_url)
 
-                game.wiki_data = self.__set_game_info(response, game.wiki_data)
-                
-            if wikipage_cat == 'Found Page': 
+                    if response:
+                        soup = None if self.get_cached_page_data(response) is not None else self.__parse_page(response.text, GAME_PAGE_STRAINER)
+                        game.wiki_data = self.__set_game_info(soup, response, game.wiki_data)
+                    
+                if wikipage_cat == 'Found Page': 
 
-                game.wiki_data = self.__set_game_info(response, game.wiki_data) 
+                    game.wiki_data = self.__set_game_info(soup, response, game.wiki_data) 
 
+        self.__print_search_result(game, response.url if response else '')
+
+    def __print_search_result(self, game:Game, url:str):
+        '''
+        Prints whether Wikipedia Data has been found for the game.
+        '''
         border_sep_symbol = "#" * 60
         print(f"{border_sep_symbol}") 
         if game.wiki_data.found_data:      
-            print(response.url)
+            print(url)
             print(f"Wikipedia Data has been found for {game.name}")
             
         else:
             print(f"Wikipedia Data has not been found for {game.name}")      
         print(f"{border_sep_symbol}")  
     
-    def __set_game_info(self, response:requests.Response, wikiDataObj:WikipediaData): 
+    def __set_game_info(self, soup:BeautifulSoup|None, response, wikiDataObj:WikipediaData): 
         '''
         Initial method to obtain and then set the page information/data\n
-        into the Wikipedia Data Object contained in the Game Object.
+        into the Wikipedia Data Object contained in the Game Object.\n
+        If the page is unchanged in the response cache, the infobox and reception read from it the last time are used and the soup can be None.
         '''
-        infobox_dict, reception_dict = self.__get_page_info(response) 
+        pageData = self.get_cached_page_data(response)
+        if pageData is not None:
+            self.runStats.increment("HTTP Cache Pages Not Parsed")
+            infobox_dict, reception_dict = pageData['Infobox'], pageData['Reception']
+        else:
+            infobox_dict, reception_dict = self.__get_page_info(soup) 
+            self.store_page_data(response, {'Infobox' : infobox_dict, 'Reception' : reception_dict})
 
         if infobox_dict or reception_dict:
             wikiDataObj = self.__set_game_object_wiki_values(wikiDataObj, response.url, infobox_dict, reception_dict) 
@@ -100,18 +276,22 @@ class WikipediaHunter(WebHunter):
         return f"https://en.wikipedia.org/w/index.php?search={encoded}&title=Special:Search&ns0=1"
  
 
-    def __get_page_info(self, response:requests.Response):
+    def __parse_page(self, html:str, strainer) -> BeautifulSoup:
         '''
-        Main Get method to get the web page information from Wikipedia from the Response Object.\n 
+        Builds the tree of a downloaded Wikipedia page - each response is only parsed once, and the tree is passed to every method that reads it.
+        '''
+        self.runStats.increment("Wikipedia Search - HTML Pages Parsed")
+
+        return page_parser.parse_html(html, strainer)
+
+    def __get_page_info(self, soup:BeautifulSoup):
+        '''
+        Main Get method to get the web page information from Wikipedia from the page's tree.\n 
         
         Note: Wikipedia tends to be not consistent with their layout of web elements in their infoboxes or reception tables.\n
         If there is missing information in the wiki_data object but is present on the web page,\n
         there is a good chance the format of the elements might be unique and couldn't be detected by the Get methods.\n  
         '''
-        web_html = response.text
-
-        soup = BeautifulSoup(web_html, 'html.parser')  
-
         infobox_dict = self.__get_top_table_box_info(soup)
  
         reception_dict = self.__get_scores_info(soup)
@@ -446,7 +626,7 @@ class WikipediaHunter(WebHunter):
         return tempList
 
 
-    def __check_results(self, response:requests.Response, game_title:str):
+    def __check_results(self, soup:BeautifulSoup, game_title:str):
         '''
         Checks the first response result from using the first search Wikipedia URL.\n 
         Either the search URL will take us directly to the game's Wikpedia page,\n
@@ -455,10 +635,6 @@ class WikipediaHunter(WebHunter):
         correct_wikipage_link = ''
         wikipage_result_type = ""
 
-        web_html = response.text
-
-        soup = BeautifulSoup(web_html, 'html.parser')  
-
         try:
             # Search results in the game's series/franchise wikipage
             if soup.find("table", class_="release-timeline") and soup.find('table', class_="hproduct"):
@@ -510,9 +686,7 @@ class WikipediaHunter(WebHunter):
                     series_page_link = "https://en.wikipedia.org" + str(list_element.find('a')['href'])  
                     inner_response = self.reponse(series_page_link)
 
-                    web_html = inner_response.text
-
-                    soup = BeautifulSoup(web_html, 'html.parser')  
+                    soup = self.__parse_page(inner_response.text, CONTENT_STRAINER)  
 
                     wikipage_result_type, correct_wikipage_link = self.__check_series_page(soup, game_title)
                     break
@@ -0,0 +1,265 @@
+# Game Information Searcher - by Sebastian Muylle - Version 1.0 - wikitext_parser.py
+# Reads the Infobox video game and Video game reviews templates out of a Wikipedia page's wikitext,
+# which is returned by the MediaWiki action API, so the page's HTML does not need to be downloaded and parsed.
+
+import re
+
+# Infobox video game parameter names and the infobox keys used by the WikipediaData set_infobox_section method
+INFOBOX_KEYS = {'developer' : 'Developer', 'publisher' : 'Publisher', 'director' : 'Director', 'producer' : 'Producer',
+                'designer' : 'Designer', 'programmer' : 'Programmer', 'artist' : 'Artist', 'writer' : 'Writer',
+                'composer' : 'Composer', 'engine' : 'Engine', 'platforms' : 'Platforms', 'platform' : 'Platforms',
+                'released' : 'Release', 'release' : 'Release', 'genre' : 'Genre', 'modes' : 'Modes', 'series' : 'Series'}
+
+# Infobox parameters that only affect how the infobox is displayed
+INFOBOX_KEYS_TO_IGNORE = ['image', 'caption', 'alt', 'image_size', 'image_upright', 'italic title', 'collapsible', 'state', 'title']
+
+# Video game reviews parameter names and the publication names shown in the review box
+REVIEW_PUBLICATIONS = {'MC' : 'Metacritic', 'GR' : 'GameRankings', 'OC' : 'OpenCritic', '1UP' : '1Up.com',
+                       'Destruct' : 'Destructoid', 'EGM' : 'Electronic Gaming Monthly', 'Eurog' : 'Eurogamer',
+                       'Fam' : 'Famitsu', 'G4' : 'G4', 'GI' : 'Game Informer', 'GRev' : 'Game Revolution',
+                       'GSpot' : 'GameSpot', 'GSpy' : 'GameSpy', 'GT' : 'GameTrailers', 'GB' : 'Giant Bomb',
+                       'GRadar' : 'GamesRadar+', 'GamePro' : 'GamePro', 'IGN' : 'IGN', 'NLife' : 'Nintendo Life',
+                       'NWR' : 'Nintendo World Report', 'PCGUS' : 'PC Gamer (US)', 'PCGUK' : 'PC Gamer (UK)',
+                       'Poly' : 'Polygon', 'TouchArcade' : 'TouchArcade', 'VG247' : 'VG247', 'Edge' : 'Edge',
+                       'OXM' : 'Official Xbox Magazine', 'PSM' : 'PlayStation Official Magazine', 'RPS' : 'Rock Paper Shotgun',
+                       'Hardcore Gamer' : 'Hardcore Gamer', 'HG' : 'Hardcore Gamer', 'Shacknews' : 'Shacknews', 'TT' : 'TechRadar', 'VG' : 'VideoGamer.com'}
+
+# Templates that only hold a list of items
+LIST_TEMPLATES = ['plainlist', 'plain list', 'unbulleted list', 'ubl', 'flatlist', 'flat list', 'hlist', 'collapsible list', 'bulleted list', 'ublist', 'vgrelease list']
+
+MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December']
+
+
+def find_template(wikitext:str, template_names:list[str]) -> dict | None:
+    '''
+    Finds the first template in the wikitext with one of the template names, and returns its named parameters.\n
+    Returns None if the template is not in the wikitext.
+
+    :param wikitext: Wikitext of a Wikipedia page.
+    :type wikitext: str
+    :param template_names: Names of the template - ['Infobox video game']
+    :type template_names: list[str]
+    '''
+    names_pattern = "|".join(re.escape(name) for name in template_names)
+    match = re.search(r'\{\{\s*(?:' + names_pattern + r')\s*(?=[|}\n])', wikitext, flags=re.IGNORECASE)
+
+    if not match:
+        return None
+
+    body = _get_template_body(wikitext, match.start())
+
+    parameters = {}
+    for part in split_top_level(body, '|')[1:]:
+        if '=' in part:
+            key, value = part.split('=', 1)
+            parameters[key.strip()] = value.strip()
+
+    return parameters
+
+
+def _get_template_body(wikitext:str, start:int) -> str:
+    '''Returns the text between a template's opening and closing braces.'''
+    depth = 0
+    index = start
+    while index < len(wikitext) - 1:
+        pair = wikitext[index:index + 2]
+        if pair == '{{':
+            depth += 1
+            index += 2
+            continue
+        if pair == '}}':
+            depth -= 1
+            if depth == 0:
+                return wikitext[start + 2:index]
+            index += 2
+            continue
+        index += 1
+    return wikitext[start + 2:]
+
+
+def split_top_level(text:str, separator:str) -> list[str]:
+    '''
+    Splits the text on the separator, ignoring any separator inside a nested template {{ }} or link [[ ]].
+    '''
+    parts = []
+    depth = 0
+    current = []
+    index = 0
+    while index < len(text):
+        pair = text[index:index + 2]
+        if pair in ('{{', '[['):
+            depth += 1
+            current.append(pair)
+            index += 2
+            continue
+        if pair in ('}}', ']]'):
+            depth = max(depth - 1, 0)
+            current.append(pair)
+            index += 2
+            continue
+        if text[index] == separator and depth == 0:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(text[index])
+        index += 1
+    parts.append("".join(current))
+    return parts
+
+
+def clean_value(value:str) -> str | list[str]:
+    '''
+    Converts a template parameter's wikitext into plain text.\n
+    Values holding several items - bullet lists, line breaks or list templates - are returned as a list of strings,\n
+    and a single item is returned as a string.
+
+    :param value: Wikitext of a template parameter.
+    :type value: str
+    '''
+    # Remove citations and comments
+    value = re.sub(r'<!--.*?-->', '', value, flags=re.DOTALL)
+    value = re.sub(r'<ref[^>/]*/>', '', value, flags=re.IGNORECASE)
+    value = re.sub(r'<ref[^>]*>.*?</ref>', '', value, flags=re.IGNORECASE | re.DOTALL)
+
+    items = []
+    for line in re.split(r'<br\s*/?>|\n', _expand_templates(value), flags=re.IGNORECASE):
+        line = _clean_text(line.lstrip('*# ').strip())
+        if line:
+            items.append(line)
+
+    if len(items) == 1:
+        return items[0]
+    if not items:
+        return ''
+    return items
+
+
+def _expand_templates(value:str) -> str:
+    '''
+    Replaces every template in the text with its text - list templates become one item per line,\n
+    and any unknown template is replaced by its unnamed parameters.
+    '''
+    while True:
+        match = re.search(r'\{\{', value)
+        if not match:
+            return value
+
+        body = _get_template_body(value, match.start())
+        end = match.start() + len(body) + 4
+
+        parts = [part.strip() for part in split_top_level(body, '|')]
+        name = parts[0].lower()
+        arguments = [part for part in parts[1:] if not re.match(r'^[\w\s]+=', part)]
+
+        if name in LIST_TEMPLATES:
+            replacement = "\n".join(_expand_templates(argument) for argument in arguments)
+        elif name in ('video game release', 'vgrelease', 'vgr'):
+            pairs = zip(arguments[0::2], arguments[1::2])
+            replacement = "\n".join(f"{region}: {date}" for region, date in pairs)
+        elif name in ('start date', 'release date', 'start date and age', 'release date and age') and arguments:
+            replacement = _format_date(arguments)
+        elif name in ('nowrap', 'nobr', 'nobold', 'small', 'lang', 'nihongo'):
+            replacement = arguments[-1] if name == 'lang' and arguments else (arguments[0] if arguments else '')
+        elif name in ('rating', 'star rating'):
+            replacement = "/".join(arguments[:2]) if len(arguments) > 1 else "".join(arguments)
+        elif name in ('efn', 'refn', 'sfn', 'citation needed', 'cn', 'r', 'dagger'):
+            replacement = ''
+        else:
+            replacement = ", ".join(arguments)
+
+        value = value[:match.start()] + replacement + value[end:]
+
+
+def _format_date(arguments:list[str]) -> str:
+    '''Formats the parameters of a start date template - ['2020', '9', '17'] -> 'September 17, 2020' '''
+    try:
+        year = int(arguments[0])
+        if len(arguments) > 2:
+            return f"{MONTHS[int(arguments[1]) - 1]} {int(arguments[2])}, {year}"
+        if len(arguments) > 1:
+            return f"{MONTHS[int(arguments[1]) - 1]} {year}"
+        return str(year)
+    except (ValueError, IndexError):
+        return " ".join(arguments)
+
+
+def _clean_text(text:str) -> str:
+    '''Removes the wiki link, bold and italic markup and any HTML tags from the text.'''
+    text = re.sub(r'\[\[(?:[^\]|]*\|)?([^\]]*)\]\]', r'\1', text)
+    text = re.sub(r'\[https?://\S+\s+([^\]]*)\]', r'\1', text)
+    text = re.sub(r"'{2,}", '', text)
+    text = re.sub(r'<[^>]+>', '', text)
+    text = text.replace('&nbsp;', ' ')
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def get_infobox_dict(wikitext:str, page_title:str) -> dict:
+    '''
+    Returns the infobox dictionary of a game's Wikipedia page, in the same format as the WikipediaHunter's HTML infobox method.\n
+    Returns an empty dictionary if the page does not have an Infobox video game template.
+
+    :param wikitext: Wikitext of a Wikipedia page.
+    :type wikitext: str
+    :param page_title: Title of the Wikipedia page.
+    :type page_title: str
+    '''
+    parameters = find_template(wikitext, ['Infobox video game', 'Infobox VG', 'Infobox Video Game'])
+
+    if parameters is None:
+        return {}
+
+    infobox_dict = {"Game Title On Wiki" : clean_value(parameters.get('title', '')) or page_title}
+
+    for key, value in parameters.items():
+        key_lower = key.lower()
+        if key_lower in INFOBOX_KEYS_TO_IGNORE or not value:
+            continue
+
+        cleaned_value = clean_value(value)
+        if cleaned_value:
+            infobox_dict[INFOBOX_KEYS.get(key_lower, key)] = cleaned_value
+
+    return infobox_dict
+
+
+def get_reception_dict(wikitext:str) -> dict:
+    '''
+    Returns the aggregator and review scores of a game's Wikipedia page, in the same format as the WikipediaHunter's HTML reception method.\n
+    Returns an empty dictionary if the page does not have a Video game reviews template.
+
+    :param wikitext: Wikitext of a Wikipedia page.
+    :type wikitext: str
+    '''
+    parameters = find_template(wikitext, ['Video game reviews', 'VG Reviews', 'Video game multiple console reviews'])
+
+    if parameters is None:
+        return {}
+
+    reception_dict = {}
+
+    for key, value in parameters.items():
+        if not value:
+            continue
+
+        # Reviews not in the template's own list - 'rev1 = Publication' and 'rev1Score = 9/10'
+        numbered_review = re.match(r'^rev(\d+)$', key, flags=re.IGNORECASE)
+        if numbered_review:
+            score = parameters.get(f"{key}Score", parameters.get(f"{key}score", ''))
+            if score:
+                reception_dict[clean_value(value)] = clean_value(score)
+            continue
+
+        # Aggregator or publication abbreviations - 'MC = 85/100' or with a platform - 'MC_PS4 = 87/100'
+        abbreviation, _, platform = key.partition('_')
+        if abbreviation in REVIEW_PUBLICATIONS:
+            name = REVIEW_PUBLICATIONS[abbreviation]
+            cleaned_value = clean_value(value)
+            if platform:
+                cleaned_value = f"{platform}: {cleaned_value}" if type(cleaned_value).__name__ == 'str' else cleaned_value
+                existing = reception_dict.get(name, [])
+                existing = existing if type(existing).__name__ == 'list' else [existing]
+                reception_dict[name] = existing + (cleaned_value if type(cleaned_value).__name__ == 'list' else [cleaned_value])
+            else:
+                reception_dict[name] = cleaned_value
+
+    return reception_dict